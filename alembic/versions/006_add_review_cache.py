@@ -0,0 +1,35 @@
+"""Add review_cache table for the critic semantic review cache
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Cached critic reviews keyed by embedding; embeddings stored as JSON arrays
+    op.create_table(
+        'review_cache',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('cache_key', sa.String(64), nullable=False),
+        sa.Column('embedding_json', sa.JSON(), nullable=False),
+        sa.Column('review_json', sa.JSON(), nullable=False),
+        sa.Column('hits', sa.Integer(), nullable=True, server_default='0'),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.UniqueConstraint('cache_key', name='uq_review_cache_cache_key'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('review_cache')
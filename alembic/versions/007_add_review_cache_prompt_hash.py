@@ -0,0 +1,32 @@
+"""Add prompt_sha256 to review_cache for the critic exact prompt cache
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Exact-prompt entries carry a prompt hash and no embedding
+    op.add_column('review_cache', sa.Column('prompt_sha256', sa.String(64), nullable=True))
+    op.create_index('ix_review_cache_prompt_sha256', 'review_cache', ['prompt_sha256'], unique=True)
+    op.alter_column('review_cache', 'cache_key', existing_type=sa.String(64), nullable=True)
+    op.alter_column('review_cache', 'embedding_json', existing_type=sa.JSON(), nullable=True)
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM review_cache WHERE embedding_json IS NULL")
+    op.alter_column('review_cache', 'embedding_json', existing_type=sa.JSON(), nullable=False)
+    op.alter_column('review_cache', 'cache_key', existing_type=sa.String(64), nullable=False)
+    op.drop_index('ix_review_cache_prompt_sha256', table_name='review_cache')
+    op.drop_column('review_cache', 'prompt_sha256')
@@ -0,0 +1,31 @@
+"""Make research_documents.connector_id unique so saves can upsert
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Keep the newest document per connector before adding the constraint
+    op.execute("""
+        DELETE FROM research_documents d
+        USING research_documents newer
+        WHERE d.connector_id = newer.connector_id AND d.id < newer.id
+    """)
+    op.drop_index(op.f('ix_research_documents_connector_id'), table_name='research_documents')
+    op.create_index(op.f('ix_research_documents_connector_id'), 'research_documents', ['connector_id'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_research_documents_connector_id'), table_name='research_documents')
+    op.create_index(op.f('ix_research_documents_connector_id'), 'research_documents', ['connector_id'], unique=False)
@@ -0,0 +1,41 @@
+"""Store connector JSON columns as JSONB and GIN-index sources
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+JSONB_COLUMNS = ('fivetran_urls', 'progress', 'sources')
+
+
+def upgrade() -> None:
+    for column in JSONB_COLUMNS:
+        op.alter_column(
+            'connectors', column,
+            existing_type=postgresql.JSON(astext_type=sa.Text()),
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            postgresql_using=f'{column}::jsonb'
+        )
+    op.create_index('ix_connectors_sources_gin', 'connectors', ['sources'], postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_connectors_sources_gin', table_name='connectors')
+    for column in JSONB_COLUMNS:
+        op.alter_column(
+            'connectors', column,
+            existing_type=postgresql.JSONB(astext_type=sa.Text()),
+            type_=postgresql.JSON(astext_type=sa.Text()),
+            postgresql_using=f'{column}::json'
+        )
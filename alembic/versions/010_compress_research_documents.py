@@ -0,0 +1,53 @@
+"""Add zstd-compressed content column to research_documents
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import text
+
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Existing rows keep their plain-text content; new saves write content_zstd
+    op.add_column('research_documents', sa.Column('content_zstd', sa.LargeBinary(), nullable=True))
+
+
+def downgrade() -> None:
+    # Compressed rows keep '' in content, so decompress them back before the
+    # column goes; one row at a time to bound memory on large documents
+    connection = op.get_bind()
+    compressed_ids = connection.execute(text(
+        "SELECT id FROM research_documents WHERE content_zstd IS NOT NULL"
+    )).scalars().all()
+    
+    if compressed_ids:
+        try:
+            import zstandard
+        except ImportError:
+            raise RuntimeError(
+                f"{len(compressed_ids)} research documents are zstd-compressed; "
+                "install zstandard to decompress them before downgrading"
+            )
+        
+        decompressor = zstandard.ZstdDecompressor()
+        for doc_id in compressed_ids:
+            compressed = connection.execute(
+                text("SELECT content_zstd FROM research_documents WHERE id = :id"),
+                {'id': doc_id}
+            ).scalar()
+            connection.execute(
+                text("UPDATE research_documents SET content = :content, content_zstd = NULL WHERE id = :id"),
+                {'id': doc_id, 'content': decompressor.decompress(bytes(compressed)).decode('utf-8')}
+            )
+    
+    op.drop_column('research_documents', 'content_zstd')
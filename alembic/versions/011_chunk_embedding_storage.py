@@ -0,0 +1,46 @@
+"""Add float32 embedding_bytes to document_chunks and an HNSW embedding index
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import text
+
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('document_chunks', sa.Column('embedding_bytes', sa.LargeBinary(), nullable=True))
+    
+    # The VECTOR column only exists where pgvector was available (002_pgvector)
+    connection = op.get_bind()
+    vector_col_exists = connection.execute(text("""
+        SELECT EXISTS (
+            SELECT FROM information_schema.columns 
+            WHERE table_name = 'document_chunks' 
+            AND column_name = 'embedding'
+        )
+    """)).scalar()
+    
+    if vector_col_exists:
+        with op.get_context().autocommit_block():
+            op.execute("""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chunks_embedding_hnsw
+                ON document_chunks USING hnsw (embedding vector_cosine_ops)
+                WITH (m = 16, ef_construction = 64)
+            """)
+    else:
+        print("⚠ document_chunks.embedding not found. Skipping HNSW index creation.")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_chunks_embedding_hnsw")
+    op.drop_column('document_chunks', 'embedding_bytes')
@@ -0,0 +1,43 @@
+"""Use jsonb_path_ops GIN indexes for JSONB containment filters
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+# (index, table, column); claims/evidence indexes existed with the default opclass
+PATH_OPS_INDEXES = (
+    ('ix_connectors_sources_gin', 'connectors', 'sources'),
+    ('ix_connectors_fivetran_urls_gin', 'connectors', 'fivetran_urls'),
+    ('ix_research_documents_claims_json', 'research_documents', 'claims_json'),
+    ('ix_research_documents_canonical_facts_json', 'research_documents', 'canonical_facts_json'),
+    ('ix_research_documents_evidence_map_json', 'research_documents', 'evidence_map_json'),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, table_name, column in PATH_OPS_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY {index_name} ON {table_name} USING gin ({column} jsonb_path_ops)"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, table_name, column in PATH_OPS_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+        # Restore the default-opclass indexes from 004_claim_graph and 009
+        op.execute("CREATE INDEX CONCURRENTLY ix_connectors_sources_gin ON connectors USING gin (sources)")
+        op.execute("CREATE INDEX CONCURRENTLY ix_research_documents_claims_json ON research_documents USING gin (claims_json)")
+        op.execute("CREATE INDEX CONCURRENTLY ix_research_documents_evidence_map_json ON research_documents USING gin (evidence_map_json)")
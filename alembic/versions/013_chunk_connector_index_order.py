@@ -0,0 +1,28 @@
+"""Index document_chunks by (connector_id, chunk_index) for ordered streaming
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_chunks_connector_chunkidx', 'document_chunks', ['connector_id', 'chunk_index'],
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_chunks_connector_chunkidx', table_name='document_chunks', postgresql_concurrently=True)
@@ -0,0 +1,37 @@
+"""Replace document_chunks connector_id indexes with one covering index
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '014'
+down_revision = '013'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chunks_connector_cover
+            ON document_chunks (connector_id, chunk_index)
+            INCLUDE (section, source_type, connector_name)
+        """)
+        # ix_document_chunks_connector_id only exists on create_all-built tables
+        for index_name in ('idx_chunks_connector', 'idx_chunks_connector_chunkidx', 'ix_document_chunks_connector_id'):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chunks_connector ON document_chunks (connector_id)")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chunks_connector_chunkidx "
+            "ON document_chunks (connector_id, chunk_index)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_chunks_connector_cover")
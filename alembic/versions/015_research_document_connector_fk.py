@@ -0,0 +1,32 @@
+"""Cascade research_documents deletes from connectors
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '015'
+down_revision = '014'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Documents left behind by earlier connector deletes would fail validation
+    op.execute("""
+        DELETE FROM research_documents d
+        WHERE NOT EXISTS (SELECT 1 FROM connectors c WHERE c.id = d.connector_id)
+    """)
+    # document_chunks gets no FK: knowledge vault chunks use vault_* ids with no connectors row
+    op.create_foreign_key(
+        'fk_research_documents_connector', 'research_documents', 'connectors',
+        ['connector_id'], ['id'], ondelete='CASCADE'
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('fk_research_documents_connector', 'research_documents', type_='foreignkey')
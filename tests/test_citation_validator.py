@@ -247,3 +247,41 @@ class TestCitationValidator:
         
         # Should pass because evidence_ids column exists
         assert isinstance(result, ValidationResult)
+    
+    def test_validate_content_memoizes_unchanged_content(self):
+        """Test that re-validating identical content reuses the cached result."""
+        validator = CitationValidator()
+        content = "Rate limit is 1000 requests per hour. This applies to all endpoints."
+        
+        first = validator.validate_content(content, section_number=1)
+        first.uncited_claims.clear()  # Mutating a returned result must not poison the cache
+        second = validator.validate_content(content, section_number=1)
+        
+        assert not second.is_valid
+        assert len(second.uncited_claims) > 0
+        assert second.uncited_claims is not first.uncited_claims
+    
+    def test_claim_positions_index_original_content_after_code_block(self):
+        """Test that code blocks are masked, not rewritten, so claim positions stay exact."""
+        validator = CitationValidator()
+        content = "Intro text here.\n\n```python\nrate_limit = 1000\n```\n\nRate limit is 1000 requests per hour."
+        
+        result = validator.validate_content(content, section_number=1)
+        
+        assert len(result.uncited_claims) == 1
+        claim = result.uncited_claims[0]
+        assert "__CODE_BLOCK" not in claim.sentence
+        assert content[claim.position:claim.position + len(claim.sentence)] == claim.sentence
+    
+    def test_validate_sections_matches_sequential_results(self):
+        """Test that batch validation returns the same results, in order, as validate_content."""
+        validator = CitationValidator()
+        sections = [
+            ("Rate limit is 1000 requests per hour.", 1),
+            ("Rate limit is 1000 requests per hour [web:1].", 2),
+            ("The accounts endpoint is available at https://api.example.com/v1/accounts.", 3),
+        ]
+        
+        results = validator.validate_sections(sections, max_workers=2)
+        
+        assert results == [validator.validate_content(content, number) for content, number in sections]
@@ -0,0 +1,166 @@
+"""
+Unit tests for Connector Manager's buffered writes.
+
+Tests that connector writes are coalesced on a short timer, that a
+failed flush keeps its connectors queued for the next one, and that
+buffered research documents stay readable until their write commits.
+"""
+
+import json
+import threading
+import pytest
+
+import services.connector_manager as connector_manager
+from services.connector_manager import ConnectorManager
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    return ConnectorManager(base_dir=tmp_path)
+
+
+def read_connector_file(manager, connector_id):
+    return json.loads((manager.connectors_dir / f"{connector_id}.json").read_text())
+
+
+class TestDebouncedFlush:
+    """Test suite for ConnectorManager's buffered file writes."""
+
+    def test_coalesces_updates_until_flush(self, manager, monkeypatch):
+        """Test that rapid updates are written once, with the latest state."""
+        writes = []
+        write_atomic = connector_manager._write_atomic
+        monkeypatch.setattr(
+            connector_manager, "_write_atomic",
+            lambda path, data: (writes.append(path.name), write_atomic(path, data))
+        )
+
+        manager.create_connector("Test Connector", "rest_api")
+        for section in range(1, 6):
+            manager.update_progress("test-connector", section, completed=True)
+        manager.flush_pending()
+
+        assert writes.count("test-connector.json") == 1
+        assert read_connector_file(manager, "test-connector")["progress"]["sections_completed"] == [1, 2, 3, 4, 5]
+
+    def test_timer_flushes_without_explicit_call(self, manager, monkeypatch):
+        """Test that the flush timer writes dirty connectors on its own."""
+        timers = []
+        timer_cls = threading.Timer
+
+        def recording_timer(*args, **kwargs):
+            timers.append(timer_cls(*args, **kwargs))
+            return timers[-1]
+
+        monkeypatch.setattr(threading, "Timer", recording_timer)
+
+        manager.create_connector("Test Connector", "rest_api")
+
+        # Join the timer thread so both the connector file and the index are written
+        assert len(timers) == 1
+        timers[0].join(timeout=2)
+
+        assert not timers[0].is_alive()
+        assert (manager.connectors_dir / "test-connector.json").exists()
+        assert json.loads(manager.index_file.read_text())["connectors"] == ["test-connector"]
+
+    def test_failed_write_is_requeued(self, manager, monkeypatch):
+        """Test that connectors whose write fails are retried on the next flush."""
+        write_atomic = connector_manager._write_atomic
+
+        def failing_write(path, data):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(connector_manager, "_write_atomic", failing_write)
+        manager.create_connector("Test Connector", "rest_api")
+        manager.flush_pending()
+
+        assert "test-connector" in manager._dirty
+        assert not (manager.connectors_dir / "test-connector.json").exists()
+
+        monkeypatch.setattr(connector_manager, "_write_atomic", write_atomic)
+        manager.flush_pending()
+
+        assert not manager._dirty
+        assert read_connector_file(manager, "test-connector")["name"] == "Test Connector"
+
+    def test_stored_manual_input_is_truncated(self, manager):
+        """Test that connector files store ManualInput.to_dict()'s truncated content."""
+        manager.create_connector(
+            "Test Connector", "rest_api",
+            manual_file_content="x" * 5000, manual_file_type="csv"
+        )
+        manager.flush_pending()
+
+        assert len(read_connector_file(manager, "test-connector")["manual_input"]["file_content"]) == 1000
+
+    def test_deleted_connector_file_is_removed(self, manager):
+        """Test that deleting a connector removes its file on the next flush."""
+        manager.create_connector("Test Connector", "rest_api")
+        manager.flush_pending()
+        manager.delete_connector("test-connector")
+        manager.flush_pending()
+
+        assert not (manager.connectors_dir / "test-connector.json").exists()
+        assert json.loads(manager.index_file.read_text())["connectors"] == []
+
+
+class FakeDocumentStorage:
+    """Records research document upserts; optionally fails or runs a hook mid-write."""
+
+    def __init__(self):
+        self.saved = {}
+        self.fail = False
+        self.during_save = None
+
+    def save_research_document(self, connector_id, **document):
+        if self.during_save:
+            hook, self.during_save = self.during_save, None
+            hook()
+        if self.fail:
+            return False
+        self.saved[connector_id] = document
+        return True
+
+    def get_research_document(self, connector_id):
+        document = self.saved.get(connector_id)
+        return document["content"] if document else None
+
+
+@pytest.fixture
+def db_manager(manager):
+    manager._use_database = True
+    manager._db_storage = FakeDocumentStorage()
+    return manager
+
+
+class TestBufferedDocuments:
+    """Test suite for ConnectorManager's buffered research document writes."""
+
+    def test_failed_document_write_stays_readable(self, db_manager):
+        """Test that a document whose write fails stays buffered and is retried."""
+        db_manager._queue_document_save("test-connector", {"content": "v1"})
+        db_manager._db_storage.fail = True
+
+        assert not db_manager.flush_pending("test-connector")
+        assert db_manager.get_research_document("test-connector") == "v1"
+
+        db_manager._db_storage.fail = False
+        assert db_manager.flush_pending("test-connector")
+        assert db_manager._db_storage.saved["test-connector"]["content"] == "v1"
+        assert "test-connector" not in db_manager._pending_documents
+
+    def test_save_during_write_is_kept_for_next_flush(self, db_manager):
+        """Test that a save queued while a write is in flight is not dropped."""
+        db_manager._queue_document_save("test-connector", {"content": "v1"})
+        db_manager._db_storage.during_save = lambda: db_manager._queue_document_save(
+            "test-connector", {"content": "v2"}
+        )
+
+        assert db_manager.flush_pending("test-connector")
+        assert db_manager._db_storage.saved["test-connector"]["content"] == "v1"
+        assert db_manager.get_research_document("test-connector") == "v2"
+
+        db_manager.flush_pending("test-connector")
+        assert db_manager._db_storage.saved["test-connector"]["content"] == "v2"
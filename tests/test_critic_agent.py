@@ -0,0 +1,193 @@
+"""
+Unit tests for the Critic Agent's review caches and streamed reviews.
+
+Tests that a cached review is only reused when the parts of the section
+the embedding doesn't see (late content, previous sections) are unchanged,
+that exact-review database calls stay off the event loop, and that an
+empty review stream fails the same way with or without ijson.
+"""
+
+import json
+import threading
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import services.critic_agent as critic_agent
+from services.critic_agent import CriticAgent, SemanticReviewCache
+
+
+APPROVED_REVIEW = {
+    "approval_status": "APPROVED",
+    "confidence_score": 0.9,
+    "issues": [],
+    "contradictions": [],
+    "uncertainty_flags": [],
+    "suggestions": []
+}
+
+
+def fake_embedding(text: str):
+    """Deterministic embedding: letter frequencies of the text."""
+    counts = [0.0] * 26
+    for char in text.lower():
+        if "a" <= char <= "z":
+            counts[ord(char) - ord("a")] += 1
+    return SimpleNamespace(data=[SimpleNamespace(embedding=counts)])
+
+
+@pytest.fixture
+def critic(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(critic_agent, "_review_cache_storage", lambda: None)
+    agent = CriticAgent()
+    agent.client.embeddings.create = AsyncMock(side_effect=lambda model, input: fake_embedding(input))
+    agent._dispatch = AsyncMock(return_value=dict(APPROVED_REVIEW))
+    return agent
+
+
+async def review(agent, content, previous_sections=None):
+    return await agent.review_section(
+        section_number=1,
+        section_name="Authentication",
+        content=content,
+        sources={"web": "OAuth 2.0 docs"},
+        previous_sections=previous_sections or ["Overview section"]
+    )
+
+
+class TestSemanticReviewCache:
+    """Test suite for semantic reuse of critic reviews."""
+
+    async def test_reuses_review_for_near_identical_section(self, critic):
+        """Test that a small edit inside the embedded prefix reuses the review."""
+        content = "Authentication uses OAuth 2.0 with refresh tokens. " * 20
+
+        await review(critic, content)
+        await review(critic, content + " Tokens expire hourly.")
+
+        assert critic._dispatch.await_count == 1
+
+    async def test_edit_past_embedded_prefix_is_reviewed(self, critic):
+        """Test that an edit after KEY_CONTENT_CHARS does not reuse the earlier review."""
+        content = "x" * SemanticReviewCache.KEY_CONTENT_CHARS
+
+        await review(critic, content + " Rate limit is 100 requests per minute.")
+        await review(critic, content + " Rate limit is 500 requests per minute.")
+
+        assert critic._dispatch.await_count == 2
+
+    async def test_changed_previous_sections_are_reviewed(self, critic):
+        """Test that the same content after different previous sections is reviewed again."""
+        content = "Authentication uses OAuth 2.0 with refresh tokens."
+
+        await review(critic, content, previous_sections=["Overview section"])
+        await review(critic, content, previous_sections=["Overview section", "Rate limits section"])
+
+        assert critic._dispatch.await_count == 2
+
+    async def test_skips_lookup_embedding_without_candidates(self, critic):
+        """Test that a section with no possible match embeds once, alongside the review."""
+        await review(critic, "Authentication uses OAuth 2.0 with refresh tokens.")
+
+        assert critic.client.embeddings.create.await_count == 1
+        assert critic._dispatch.await_count == 1
+
+    async def test_persisted_entries_load_on_first_review(self, critic, monkeypatch):
+        """Test that persisted entries are read once, on first use, and can be reused."""
+        content = "Authentication uses OAuth 2.0 with refresh tokens."
+        cache_text = SemanticReviewCache.key_text("Authentication", content, {"web": "OAuth 2.0 docs"})
+        guard = SemanticReviewCache.guard_hash(content, {"web": "OAuth 2.0 docs"}, ["Overview section"])
+        loads = []
+
+        class FakeStorage:
+            def load_review_cache_entries(self, limit):
+                loads.append(limit)
+                return [{
+                    "cache_key": guard + "0" * (64 - SemanticReviewCache.GUARD_CHARS),
+                    "embedding": SemanticReviewCache._normalize(fake_embedding(cache_text).data[0].embedding),
+                    "review_data": dict(APPROVED_REVIEW),
+                    "hits": 5
+                }]
+
+            def get_exact_review(self, prompt_sha256):
+                return None
+
+        monkeypatch.setattr(critic_agent, "_review_cache_storage", lambda: FakeStorage())
+
+        await review(critic, content)
+        await review(critic, content + " Tokens expire hourly.")
+
+        assert loads == [SemanticReviewCache.MAX_ENTRIES]
+        assert critic._dispatch.await_count == 0
+
+    def test_vector_matrix_grows_with_entries(self, critic):
+        """Test that the vector matrix starts small and doubles as entries are added."""
+        pytest.importorskip("numpy")
+        cache = critic.review_cache
+
+        for i in range(SemanticReviewCache.INITIAL_SLOTS + 1):
+            cache._add(f"{i:064d}", [1.0, 0.0], dict(APPROVED_REVIEW), hits=0)
+
+        assert cache._vectors.shape == (SemanticReviewCache.INITIAL_SLOTS * 2, 2)
+        assert cache._nearest([1.0, 0.0], "0" * SemanticReviewCache.GUARD_CHARS)[1] == pytest.approx(1.0)
+
+    def test_guard_hash_ignores_embedded_prefix(self):
+        """Test that the guard only covers what the embedding leaves out."""
+        prefix_chars = SemanticReviewCache.KEY_CONTENT_CHARS
+        sources = {"web": "docs"}
+
+        assert SemanticReviewCache.guard_hash("a" * 10, sources, []) == \
+            SemanticReviewCache.guard_hash("b" * 10, sources, [])
+        assert SemanticReviewCache.guard_hash("a" * prefix_chars + "tail", sources, []) != \
+            SemanticReviewCache.guard_hash("a" * prefix_chars + "tall", sources, [])
+        assert SemanticReviewCache.guard_hash("a", sources, ["ab", "c"]) != \
+            SemanticReviewCache.guard_hash("a", sources, ["a", "bc"])
+
+
+class TestExactReviewCache:
+    """Test suite for the prompt-hash review cache."""
+
+    async def test_database_calls_run_off_the_event_loop(self, critic, monkeypatch):
+        """Test that exact-review reads and writes and the review cache load run in worker threads."""
+        loop_thread = threading.get_ident()
+        calls = []
+
+        class FakeStorage:
+            def load_review_cache_entries(self, limit):
+                calls.append(("load", threading.get_ident()))
+                return []
+
+            def get_exact_review(self, prompt_sha256):
+                calls.append(("get", threading.get_ident()))
+                return None
+
+            def save_exact_review(self, prompt_sha256, review_data):
+                calls.append(("save", threading.get_ident()))
+                return True
+
+        monkeypatch.setattr(critic_agent, "_review_cache_storage", lambda: FakeStorage())
+
+        await review(critic, "Authentication uses OAuth 2.0 with refresh tokens.")
+
+        assert [name for name, _ in calls] == ["get", "load", "save"]
+        assert all(thread != loop_thread for _, thread in calls)
+
+
+class TestRequestReview:
+    """Test suite for parsing streamed review responses."""
+
+    @pytest.mark.parametrize("ijson_available", [True, False])
+    async def test_empty_stream_fails_like_fallback(self, critic, monkeypatch, ijson_available):
+        """Test that a stream with no content deltas raises the JSON parse error on both paths."""
+        if ijson_available:
+            pytest.importorskip("ijson")
+        monkeypatch.setattr(critic_agent, "IJSON_AVAILABLE", ijson_available)
+
+        async def empty_stream():
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=None))])
+
+        critic.client.chat.completions.create = AsyncMock(return_value=empty_stream())
+
+        with pytest.raises(json.JSONDecodeError):
+            await critic._request_review(critic.model, "prompt")
@@ -0,0 +1,119 @@
+"""
+Unit tests for DAG Orchestrator.
+
+Tests that the maintained ready set matches a full rescan of the DAG, and
+that a research context's derived source views follow edits to its sources.
+"""
+
+import random
+import pytest
+
+from services.dag_orchestrator import ResearchContext, ResearchDAG, SectionStatus
+from services.research_agent import ResearchSection
+
+
+def make_section(number: int) -> ResearchSection:
+    return ResearchSection(number=number, name=f"Section {number}", phase=1, phase_name="Discovery", prompts=[])
+
+
+def ready_numbers(dag: ResearchDAG):
+    return [node.section.number for node in dag.get_ready_sections()]
+
+
+def rescan_ready_numbers(dag: ResearchDAG):
+    """Readiness rule applied to every node (dependencies missing from the DAG don't block)."""
+    return [
+        number for number, node in dag.nodes.items()
+        if node.status == SectionStatus.PENDING and all(
+            dag.nodes[dep].status == SectionStatus.APPROVED
+            for dep in node.dependencies if dep in dag.nodes
+        )
+    ]
+
+
+class TestReadySections:
+    """Test suite for ResearchDAG.get_ready_sections."""
+
+    def test_polling_does_not_consume_ready_sections(self):
+        """Test that repeated polls return a section until it leaves PENDING."""
+        dag = ResearchDAG()
+        dag.add_section(make_section(1), [])
+        dag.add_section(make_section(2), [1])
+
+        assert ready_numbers(dag) == [1]
+        assert ready_numbers(dag) == [1]
+
+        dag.update_node_status(1, SectionStatus.RUNNING)
+        assert ready_numbers(dag) == []
+
+    def test_add_approve_reset_readd(self):
+        """Test readiness through approval, a reset to PENDING, and re-adding a section."""
+        dag = ResearchDAG()
+        dag.add_section(make_section(1), [])
+        dag.add_section(make_section(2), [1])
+        dag.add_section(make_section(3), [1, 2])
+        assert ready_numbers(dag) == [1]
+
+        dag.mark_completed(1, "content")
+        assert ready_numbers(dag) == [2]
+
+        # Resetting an approved dependency blocks its dependents again
+        dag.update_node_status(1, "PENDING")
+        assert ready_numbers(dag) == [1]
+
+        dag.mark_completed(1, "content")
+        dag.mark_completed(2, "content")
+        assert ready_numbers(dag) == [3]
+
+        # Re-adding an approved section makes it pending and blocks section 3
+        dag.add_section(make_section(2), [1])
+        assert ready_numbers(dag) == [2]
+
+        # Re-adding with a dependency that isn't approved keeps it off the ready set
+        dag.add_section(make_section(2), [3])
+        assert ready_numbers(dag) == []
+
+        # Order follows the order sections were first added
+        dag.add_section(make_section(2), [])
+        dag.add_section(make_section(0), [])
+        assert ready_numbers(dag) == [2, 0]
+
+    def test_matches_rescan_under_random_operations(self):
+        """Test that the ready set always equals a full rescan."""
+        rng = random.Random(7)
+        statuses = list(SectionStatus)
+
+        for _ in range(50):
+            dag = ResearchDAG()
+            for _ in range(60):
+                number = rng.randrange(8)
+                action = rng.random()
+                if action < 0.35 or number not in dag.nodes:
+                    deps = rng.sample(range(8), rng.randrange(3))
+                    dag.add_section(make_section(number), [d for d in deps if d != number])
+                elif action < 0.7:
+                    dag.mark_completed(number, "content")
+                else:
+                    dag.update_node_status(number, rng.choice(statuses))
+
+                assert ready_numbers(dag) == rescan_ready_numbers(dag)
+
+
+class TestResearchContextSources:
+    """Test suite for ResearchContext's derived source views."""
+
+    def test_sources_filled_after_construction(self):
+        """Test that truncated sources and digests follow later edits to sources."""
+        context = ResearchContext(connector_id="test", connector_name="Test", connector_type="rest_api")
+        assert context.truncated_sources == {}
+
+        context.sources["web"] = "Rate limit is 100 requests per minute"
+        assert context.truncated_sources == {"web": "Rate limit is 100 requests per minute"}
+        first_digest = context.source_digests["web"]
+
+        context.sources["web"] = "Rate limit is 200 requests per minute"
+        assert context.source_digests["web"] != first_digest
+
+        context.sources = {"vault": "x" * 100000}
+        assert list(context.source_digests) == ["vault"]
+        assert len(context.truncated_sources["vault"]) < 100000
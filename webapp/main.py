@@ -1059,6 +1059,9 @@ async def generate_research(
                 evidence_map_json=progress.evidence_map_json if progress else None,
                 validation_attempts=len([e for e in (progress.stop_the_line_events or []) if 'citation' in str(e).lower()]) if progress else None
             )
+            # The final document is written now rather than on the buffer timer
+            if not await asyncio.to_thread(connector_manager.flush_pending, connector_id):
+                print(f"⚠ Final research document for {connector_id} not written; it stays buffered for retry")
             
             # Vectorize into Pinecone
             vectors_count = 0
@@ -1260,6 +1263,10 @@ async def get_citation_report(
     # Get research document from database
     from services.database import get_db_session, ResearchDocumentModel
     
+    # A buffered document save must land before the row is read
+    if not await asyncio.to_thread(connector_manager.flush_pending, connector_id):
+        print(f"⚠ Buffered research document for {connector_id} not yet written")
+    
     session = get_db_session()
     if not session:
         raise HTTPException(status_code=503, detail="Database not available")
@@ -1332,6 +1339,11 @@ async def citation_override(
     if not connector:
         raise HTTPException(status_code=404, detail=f"Connector '{connector_id}' not found")
     
+    # Overrides are written to the row directly, so a buffered save must land
+    # first or its flush would overwrite them
+    if not await asyncio.to_thread(connector_manager.flush_pending, connector_id):
+        raise HTTPException(status_code=503, detail="Research document could not be saved; try again")
+    
     session = get_db_session()
     if not session:
         raise HTTPException(status_code=503, detail="Database not available")
@@ -1462,8 +1474,8 @@ async def search(
         )
     else:
         # Search across all complete connectors
-        connectors = connector_manager.list_connectors()
-        connector_ids = [c.id for c in connectors if c.status == ConnectorStatus.COMPLETE.value]
+        connectors = connector_manager.list_connectors_summary()
+        connector_ids = [c['id'] for c in connectors if c['status'] == ConnectorStatus.COMPLETE.value]
         
         if not connector_ids:
             return SearchResponse(query=request.query, results=[], total_results=0)
@@ -1512,8 +1524,8 @@ async def chat(
             top_k=request.top_k
         )
     else:
-        connectors = connector_manager.list_connectors()
-        connector_ids = [c.id for c in connectors if c.status == ConnectorStatus.COMPLETE.value]
+        connectors = connector_manager.list_connectors_summary()
+        connector_ids = [c['id'] for c in connectors if c['status'] == ConnectorStatus.COMPLETE.value]
         
         if not connector_ids:
             return ChatResponse(
@@ -95,6 +95,7 @@ class ArtifactStore:
     FACTS_KEY = "facts"
     SOURCES_KEY = "sources"
     STATS_KEY = "stats"
+    CONFIDENCE_KEY = "confidence"
     
     def __init__(self, redis_url: str = REDIS_URL, connector_name: str = ""):
         """
@@ -106,7 +107,12 @@ class ArtifactStore:
         """
         self.redis = redis.from_url(redis_url, decode_responses=True)
         self.connector_name = connector_name
-        self.prefix = f"research:{connector_name}" if connector_name else "research"
+        self.prefix = self.key_prefix(connector_name)
+    
+    @staticmethod
+    def key_prefix(connector_name: str) -> str:
+        """Redis key prefix for a connector's store (usable without a client)."""
+        return f"research:{connector_name}" if connector_name else "research"
     
     def _key(self, *parts: str) -> str:
         """Generate Redis key with prefix."""
@@ -199,11 +205,21 @@ class ArtifactStore:
             existing_data["evidence"] = merged_evidence
             
             # Update confidence (take max)
-            existing_data["confidence"] = max(existing_data.get("confidence", 0), fact.confidence)
+            existing_confidence = existing_data.get("confidence", 0)
+            if fact.confidence > existing_confidence:
+                existing_data["confidence"] = fact.confidence
+                self._ensure_confidence_sum(fact.category)
+                self.redis.hincrbyfloat(
+                    self._key(self.CONFIDENCE_KEY), fact.category,
+                    fact.confidence - existing_confidence
+                )
             
             self.redis.set(key, json.dumps(existing_data))
             return False  # Not a new fact
         
+        # Backfill the running sum before this fact joins the index
+        self._ensure_confidence_sum(fact.category)
+        
         # Store new fact
         self.redis.set(key, json.dumps(fact.to_dict()))
         
@@ -216,9 +232,32 @@ class ArtifactStore:
         # Update stats
         self.redis.hincrby(self._key(self.STATS_KEY), f"facts:{fact.category}", 1)
         self.redis.hincrby(self._key(self.STATS_KEY), "facts:total", 1)
+        self.redis.hincrbyfloat(self._key(self.CONFIDENCE_KEY), fact.category, fact.confidence)
         
         return True
     
+    def _ensure_confidence_sum(self, category: str):
+        """
+        Seed a category's confidence sum from its stored facts.
+        
+        Facts stored before confidence sums were tracked have no running
+        sum, so incrementing from zero would under-report the average.
+        Sums live in their own hash so get_stats() only sees integer counters.
+        
+        Args:
+            category: Fact category about to be incremented
+        """
+        if self.redis.hexists(self._key(self.CONFIDENCE_KEY), category):
+            return
+        if not self.get_fact_count_by_category(category):
+            return
+        
+        facts = self.get_facts_by_categories([category])[category]
+        self.redis.hsetnx(
+            self._key(self.CONFIDENCE_KEY), category,
+            repr(float(sum(f.confidence for f in facts)))
+        )
+    
     def get_fact(self, fact_id: str, category: str) -> Optional[Fact]:
         """Get fact by ID and category."""
         key = self._key(self.FACTS_KEY, category, fact_id)
@@ -240,10 +279,43 @@ class ArtifactStore:
         
         return facts
     
+    def get_facts_by_categories(self, categories: List[str]) -> Dict[str, List[Fact]]:
+        """
+        Get all facts for several categories in two round trips.
+        
+        One pipeline reads every category index, then one MGET loads all
+        the facts they reference.
+        
+        Args:
+            categories: Categories to load
+            
+        Returns:
+            Dict of category -> facts
+        """
+        pipe = self.redis.pipeline(transaction=False)
+        for category in categories:
+            pipe.smembers(self._key(self.FACTS_KEY, category, "_index"))
+        indexes = pipe.execute()
+        
+        keys = []
+        owners = []
+        for category, fact_ids in zip(categories, indexes):
+            for fact_id in fact_ids:
+                keys.append(self._key(self.FACTS_KEY, category, fact_id))
+                owners.append(category)
+        
+        facts = {category: [] for category in categories}
+        if keys:
+            for category, data in zip(owners, self.redis.mget(keys)):
+                if data:
+                    facts[category].append(Fact.from_dict(json.loads(data)))
+        
+        return facts
+    
     def get_all_facts(self) -> Dict[str, List[Fact]]:
         """Get all facts grouped by category."""
         categories = ["auth", "rate_limit", "endpoint", "object", "sdk", "webhook"]
-        return {cat: self.get_facts_by_category(cat) for cat in categories}
+        return self.get_facts_by_categories(categories)
     
     def get_fact_count(self) -> int:
         """Get total unique facts discovered."""
@@ -253,6 +325,58 @@ class ArtifactStore:
         """Get fact count for a specific category."""
         return int(self.redis.hget(self._key(self.STATS_KEY), f"facts:{category}") or 0)
     
+    def get_fact_counts(self, categories: List[str]) -> Dict[str, int]:
+        """
+        Get fact counts for several categories in a single HMGET.
+        
+        Args:
+            categories: Categories to count
+            
+        Returns:
+            Dict of category -> count, plus the overall count under "total"
+        """
+        fields = [f"facts:{category}" for category in categories]
+        fields.append("facts:total")
+        values = self.redis.hmget(self._key(self.STATS_KEY), fields)
+        
+        counts = {category: int(value or 0) for category, value in zip(categories, values)}
+        counts["total"] = int(values[-1] or 0)
+        return counts
+    
+    def get_confidence_totals(self, categories: List[str]) -> Dict[str, tuple]:
+        """
+        Get (fact count, confidence sum) per category from the running stats.
+        
+        Counts and sums come from one pipelined HMGET each. Categories whose
+        facts were stored before confidence sums were tracked are summed from
+        the facts instead.
+        
+        Args:
+            categories: Categories to read
+            
+        Returns:
+            Dict of category -> (count, confidence_sum)
+        """
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hmget(self._key(self.STATS_KEY), [f"facts:{category}" for category in categories])
+        pipe.hmget(self._key(self.CONFIDENCE_KEY), categories)
+        counts, sums = pipe.execute()
+        
+        totals = {}
+        untracked = []
+        for category, count, confidence_sum in zip(categories, counts, sums):
+            count = int(count or 0)
+            if count and confidence_sum is None:
+                untracked.append(category)
+            else:
+                totals[category] = (count, float(confidence_sum or 0.0))
+        
+        if untracked:
+            for category, facts in self.get_facts_by_categories(untracked).items():
+                totals[category] = (len(facts), sum(f.confidence for f in facts))
+        
+        return {category: totals[category] for category in categories}
+    
     # =========================================================================
     # Source Tracking
     # =========================================================================
@@ -4,9 +4,14 @@ Deterministic pre-Critic validation that requires citations for factual claims.
 Uses 3-pass parsing to avoid false failures on code blocks and tables.
 """
 
+import io
+import os
 import re
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from typing import List, Dict, Any, Tuple, Optional
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 try:
     import nltk
     from nltk.tokenize import sent_tokenize
@@ -76,9 +81,21 @@ class CitationValidator:
         r"^To\s+be\s+determined",
     ]
     
+    # All safe patterns are ^-anchored, so one alternation checked with a
+    # single match() replaces a search() per pattern
+    SAFE_ANY = re.compile('|'.join(f'(?:{p})' for p in KNOWN_SAFE_PATTERNS), re.IGNORECASE)
+    
     # Citation tag patterns
     CITATION_PATTERN = re.compile(r'\[(web|vault|doc|github):\d+\]')
     
+    # Content structure patterns for 3-pass parsing
+    CODE_BLOCK_PATTERN = re.compile(r'```[\s\S]*?```', re.MULTILINE)
+    TABLE_PATTERN = re.compile(
+        r'(\|.+\|)\s*\n(\|[-:\s\|]+\|)\s*\n((?:\|.+\|\s*\n?)+)',
+        re.MULTILINE
+    )
+    TABLE_LINE_PATTERN = re.compile(r'\|.*\|[\s\S]*?(?=\n\n|\n[^|]|$)', re.MULTILINE)
+    
     # Capability markers for "supports/requires" detection
     CAPABILITY_MARKERS = [
         'REST', 'GraphQL', 'SOAP', 'OAuth', 'API key', 'rate limit', 'scope',
@@ -99,6 +116,9 @@ class CitationValidator:
         """
         Validate content for proper citations.
         
+        Results are memoized per (content, section_number, max_citation_distance),
+        so regeneration loops that re-validate unchanged content are O(1).
+        
         Args:
             content: The content to validate
             section_number: Section number for context
@@ -106,11 +126,59 @@ class CitationValidator:
         Returns:
             ValidationResult with validation status and issues
         """
+        result = _validate_cached(content, section_number, self.max_citation_distance)
+        # Copy the lists so callers can't mutate the cached entry
+        return replace(
+            result,
+            uncited_claims=list(result.uncited_claims),
+            uncited_table_rows=list(result.uncited_table_rows)
+        )
+    
+    def validate_sections(
+        self,
+        sections: List[Tuple[str, int]],
+        max_workers: Optional[int] = None
+    ) -> List[ValidationResult]:
+        """
+        Validate many sections in parallel across processes.
+        
+        Sections are independent and validation is regex-bound, so a process
+        pool sidesteps the GIL and scales with core count.
+        
+        Args:
+            sections: List of (content, section_number) tuples
+            max_workers: Worker process count (defaults to os.cpu_count())
+            
+        Returns:
+            ValidationResults in the same order as sections
+        """
+        if len(sections) < 2:
+            return [self.validate_content(content, number) for content, number in sections]
+        
+        kwargs = {'max_citation_distance': self.max_citation_distance}
+        jobs = [(content, number, kwargs) for content, number in sections]
+        workers = max_workers or os.cpu_count() or 1
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                self._worker,
+                jobs,
+                chunksize=max(1, len(jobs) // (workers * 4))
+            ))
+    
+    @staticmethod
+    def _worker(args: Tuple[str, int, Dict[str, Any]]) -> ValidationResult:
+        """Process-pool entry point: validate one section in a worker."""
+        content, section_number, kwargs = args
+        return CitationValidator(**kwargs).validate_content(content, section_number)
+    
+    def _validate_uncached(self, content: str, section_number: int) -> ValidationResult:
+        """Run the full validation pipeline without consulting the cache."""
         # 3-pass parsing
-        prose_content, tables, code_blocks = self._parse_content_3pass(content)
+        masked_ranges, tables, code_ranges = self._parse_content_3pass(content)
         
-        # Extract factual claims from prose (excluding code blocks)
-        claims = self._extract_factual_claims(prose_content, content)
+        # Extract factual claims from prose (excluding code blocks and tables)
+        claims = self._extract_factual_claims(content, masked_ranges)
         
         # Validate table rows
         uncited_rows = self._validate_table_rows(tables, content)
@@ -144,43 +212,60 @@ class CitationValidator:
             failure_report=failure_report
         )
     
-    def _parse_content_3pass(self, content: str) -> Tuple[str, List[Table], List[str]]:
+    def _parse_content_3pass(self, content: str) -> Tuple[List[Tuple[int, int]], List[Table], List[Tuple[int, int]]]:
         """
-        3-pass parsing: Strip code blocks → Extract tables → Sentence-split prose.
+        3-pass parsing: Locate code blocks → Extract tables → Mask both for sentence splitting.
+        
+        Nothing is rewritten: code blocks and table lines are tracked as
+        (start, end) character ranges in the original content instead of being
+        substituted with placeholders, so positions stay exact.
         
         Returns:
-            Tuple of (prose_content, tables, code_blocks)
+            Tuple of (masked_ranges, tables, code_ranges), ranges sorted by start
         """
-        # Pass 1: Strip fenced code blocks completely
-        code_blocks = []
-        code_block_pattern = re.compile(r'```[\s\S]*?```', re.MULTILINE)
-        
-        def replace_code_block(match):
-            code_blocks.append(match.group(0))
-            return f"__CODE_BLOCK_{len(code_blocks) - 1}__"
+        # Pass 1: Locate fenced code blocks
+        code_ranges = [(m.start(), m.end()) for m in self.CODE_BLOCK_PATTERN.finditer(content)]
         
-        content_without_code = code_block_pattern.sub(replace_code_block, content)
+        # Pass 2: Extract markdown tables outside code blocks
+        tables = self._extract_tables(content, code_ranges)
         
-        # Pass 2: Extract markdown tables separately
-        tables = self._extract_tables(content_without_code, content)
+        # Pass 3: Mask code blocks and table lines so only prose is sentence-split
+        table_ranges = [
+            (m.start(), m.end())
+            for m in self.TABLE_LINE_PATTERN.finditer(content)
+            if not self._in_ranges(m.start(), code_ranges)
+        ]
+        masked_ranges = self._merge_ranges(code_ranges + table_ranges)
         
-        # Remove tables from content for sentence splitting
-        table_pattern = re.compile(r'\|.*\|[\s\S]*?(?=\n\n|\n[^|]|$)', re.MULTILINE)
-        prose_content = table_pattern.sub('__TABLE_PLACEHOLDER__', content_without_code)
-        
-        # Pass 3: Restore code block placeholders (they're excluded from validation)
-        # But keep them in prose_content for position tracking
-        return prose_content, tables, code_blocks
+        return masked_ranges, tables, code_ranges
     
-    def _extract_tables(self, content: str, original_content: str) -> List[Table]:
-        """Extract markdown tables from content."""
+    @staticmethod
+    def _merge_ranges(ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """Sort and merge overlapping (start, end) ranges."""
+        merged: List[Tuple[int, int]] = []
+        for start, end in sorted(ranges):
+            if merged and start <= merged[-1][1]:
+                if end > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], end)
+            else:
+                merged.append((start, end))
+        return merged
+    
+    @staticmethod
+    def _in_ranges(pos: int, ranges: List[Tuple[int, int]]) -> bool:
+        """Check if a position falls inside any of the sorted ranges."""
+        idx = bisect_right(ranges, (pos, float('inf'))) - 1
+        return idx >= 0 and pos < ranges[idx][1]
+    
+    def _extract_tables(self, content: str, code_ranges: List[Tuple[int, int]]) -> List[Table]:
+        """Extract markdown tables from content, skipping any inside code blocks."""
         tables = []
-        table_pattern = re.compile(
-            r'(\|.+\|)\s*\n(\|[-:\s\|]+\|)\s*\n((?:\|.+\|\s*\n?)+)',
-            re.MULTILINE
-        )
         
-        for match in table_pattern.finditer(content):
+        for match in self.TABLE_PATTERN.finditer(content):
+            start_pos = match.start()
+            if self._in_ranges(start_pos, code_ranges):
+                continue
+            
             header_row = [cell.strip() for cell in match.group(1).split('|')[1:-1]]
             separator = match.group(2)
             body_text = match.group(3)
@@ -191,14 +276,13 @@ class CitationValidator:
                     cells = [cell.strip() for cell in row_line.split('|')[1:-1]]
                     data_rows.append(cells)
             
-            # Find position in original content
-            start_pos = match.start()
+            # Position in original content
             end_pos = match.end()
             
             # Try to identify table name from preceding heading
             table_name = "Unknown Table"
-            before_table = content[:start_pos]
-            heading_match = re.search(r'^#{1,3}\s+(.+)$', before_table[-200:], re.MULTILINE)
+            before_table = content[max(0, start_pos - 200):start_pos]
+            heading_match = re.search(r'^#{1,3}\s+(.+)$', before_table, re.MULTILINE)
             if heading_match:
                 table_name = heading_match.group(1).strip()
             
@@ -213,29 +297,46 @@ class CitationValidator:
         
         return tables
     
-    def _extract_factual_claims(self, prose_content: str, original_content: str) -> List[FactualClaim]:
+    def _extract_factual_claims(self, content: str, masked_ranges: List[Tuple[int, int]]) -> List[FactualClaim]:
         """
-        Extract factual claims from prose content.
+        Extract factual claims from the prose of content.
         
+        Only the gaps between masked ranges (code blocks, tables) are
+        sentence-split, so claim positions index directly into content.
         Excludes headings and bullet labels.
         """
         claims = []
         
+        # Walk the prose segments between masked ranges
+        segment_start = 0
+        for range_start, range_end in masked_ranges + [(len(content), len(content))]:
+            if range_start > segment_start:
+                claims.extend(self._extract_segment_claims(content, segment_start, range_start))
+            segment_start = max(segment_start, range_end)
+        
+        return claims
+    
+    def _extract_segment_claims(self, content: str, seg_start: int, seg_end: int) -> List[FactualClaim]:
+        """Extract factual claims from a single prose segment of content."""
+        claims = []
+        segment = content[seg_start:seg_end]
+        
         # Sentence tokenization
         if NLTK_AVAILABLE:
-            sentences = sent_tokenize(prose_content)
+            sentences = sent_tokenize(segment)
         else:
             # Fallback: simple sentence splitting
-            sentences = re.split(r'[.!?]+\s+', prose_content)
+            sentences = re.split(r'[.!?]+\s+', segment)
             sentences = [s.strip() for s in sentences if s.strip()]
         
         current_pos = 0
         for sentence in sentences:
-            # Find position in original content
-            pos = original_content.find(sentence, current_pos)
+            # Find position within the segment, then map back to content
+            pos = segment.find(sentence, current_pos)
             if pos == -1:
                 pos = current_pos
             current_pos = pos + len(sentence)
+            pos += seg_start
             
             # Skip if it's a heading
             if re.match(r'^#+\s+', sentence):
@@ -300,11 +401,7 @@ class CitationValidator:
     
     def _is_known_safe_statement(self, sentence: str) -> bool:
         """Check if sentence matches known safe patterns."""
-        sentence_clean = sentence.strip()
-        for pattern in self.KNOWN_SAFE_PATTERNS:
-            if re.search(pattern, sentence_clean, re.IGNORECASE):
-                return True
-        return False
+        return self.SAFE_ANY.match(sentence.lstrip()) is not None
     
     def _check_citations_local(self, claim: FactualClaim, content: str) -> bool:
         """
@@ -386,40 +483,53 @@ class CitationValidator:
         if not uncited_claims and not uncited_rows:
             return ""
         
-        report_parts = []
-        report_parts.append(f"CRITICAL VALIDATION FAILURE - Section {section_number}")
-        report_parts.append("")
-        report_parts.append("The following claims require citations but were found without them:")
-        report_parts.append("")
+        buf = io.StringIO()
+        buf.write(
+            f"CRITICAL VALIDATION FAILURE - Section {section_number}\n"
+            "\n"
+            "The following claims require citations but were found without them:\n"
+            "\n"
+        )
         
         if uncited_claims:
-            report_parts.append("UNCITED SENTENCES:")
+            buf.write("UNCITED SENTENCES:\n")
+            distance = self.max_citation_distance
             for i, claim in enumerate(uncited_claims, 1):
-                report_parts.append(
-                    f"{i}. \"{claim.sentence[:100]}{'...' if len(claim.sentence) > 100 else ''}\" "
-                    f"(Type: {claim.claim_type}, Position: {claim.position})"
-                )
-                report_parts.append(
-                    f"   → Add citation [web:N] or [vault:N] within {self.max_citation_distance} characters, "
-                    f"OR rewrite as \"Unknown\""
+                sentence = claim.sentence
+                buf.write(
+                    f"{i}. \"{sentence[:100]}{'...' if len(sentence) > 100 else ''}\" "
+                    f"(Type: {claim.claim_type}, Position: {claim.position})\n"
+                    f"   → Add citation [web:N] or [vault:N] within {distance} characters, "
+                    f"OR rewrite as \"Unknown\"\n"
+                    "\n"
                 )
-                report_parts.append("")
         
         if uncited_rows:
-            report_parts.append("UNCITED TABLE ROWS:")
+            buf.write("UNCITED TABLE ROWS:\n")
             for row in uncited_rows:
-                report_parts.append(
+                row_content = row.row_content
+                buf.write(
                     f"- {row.table_name}, Row {row.row_index}: "
-                    f"\"{row.row_content[:80]}{'...' if len(row.row_content) > 80 else ''}\" (missing citation)"
+                    f"\"{row_content[:80]}{'...' if len(row_content) > 80 else ''}\" (missing citation)\n"
+                    "  → Add [web:N] [vault:N] at end of row OR add evidence_ids column\n"
+                    "\n"
                 )
-                report_parts.append(
-                    f"  → Add [web:N] [vault:N] at end of row OR add evidence_ids column"
-                )
-                report_parts.append("")
         
-        report_parts.append(
+        buf.write(
             "Please regenerate this section with citations added to the exact items above, "
             "or rewrite uncertain claims as \"Unknown\"."
         )
         
-        return "\n".join(report_parts)
+        return buf.getvalue()
+
+
+@lru_cache(maxsize=256)
+def _validate_cached(content: str, section_number: int, max_citation_distance: int) -> ValidationResult:
+    """
+    Memoized validation keyed on the content itself.
+    
+    CPython caches a str's hash on the object, so repeat lookups for the same
+    content string don't rehash it; equality on a hit is a single memcmp.
+    """
+    validator = CitationValidator(max_citation_distance=max_citation_distance)
+    return validator._validate_uncached(content, section_number)
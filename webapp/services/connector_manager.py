@@ -5,13 +5,46 @@ Supports both database (PostgreSQL) and file-based storage.
 """
 
 import os
+import re
 import json
+import base64
+import hashlib
+import time
+import atexit
+import bisect
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass, field, asdict, fields
+from typing import List, Optional, Dict, Any, Set
+from dataclasses import dataclass, field, asdict, fields, is_dataclass, MISSING
 from enum import Enum
 
+# Try to import orjson for faster registry serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Try to import ijson for streaming the legacy single-file registry
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Research document writes (database mode) are flushed after this much
+# quiescence, or immediately once a connector has this many buffered saves
+_DOCUMENT_FLUSH_DELAY = 0.5
+_DOCUMENT_FLUSH_UPDATES = 5
+
+# Errors that mean the legacy registry file is unreadable
+_LEGACY_REGISTRY_ERRORS = (OSError, ValueError, KeyError, TypeError) + (
+    (ijson.JSONError,) if IJSON_AVAILABLE else ()
+)
+
 
 class ConnectorStatus(str, Enum):
     """Status of a connector research project."""
@@ -22,6 +55,11 @@ class ConnectorStatus(str, Enum):
     FAILED = "failed"
     CANCELLED = "cancelled"
     STOPPED = "stopped"  # Stop-the-line triggered
+    
+    @classmethod
+    def from_value(cls, value: str) -> 'ConnectorStatus':
+        """Look up a status by value without scanning members."""
+        return _STATUS_BY_VALUE[value]
 
 
 class ConnectorType(str, Enum):
@@ -37,9 +75,99 @@ class ConnectorType(str, Enum):
     MESSAGING = "messaging"
     ADVERTISING = "advertising"
     WAREHOUSE = "warehouse"
+    
+    @classmethod
+    def from_value(cls, value: str) -> 'ConnectorType':
+        """Look up a connector type by value without scanning members."""
+        return _TYPE_BY_VALUE[value]
+
+
+# Value -> member lookups, and status values used on hot paths
+_STATUS_BY_VALUE = {s.value: s for s in ConnectorStatus}
+_TYPE_BY_VALUE = {t.value: t for t in ConnectorType}
+_STATUS_NOT_STARTED = ConnectorStatus.NOT_STARTED.value
+_STATUS_RESEARCHING = ConnectorStatus.RESEARCHING.value
+_STATUS_COMPLETE = ConnectorStatus.COMPLETE.value
+
+
+def _dump_json(data: Any) -> bytes:
+    """Serialize registry data to indented JSON bytes.
+    
+    Pass plain data (e.g. Connector.to_dict()), so the stored JSON is the
+    same with or without orjson.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _load_json(raw: bytes) -> Any:
+    """Parse registry JSON bytes (orjson.JSONDecodeError subclasses json's)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _write_atomic(path: Path, data: bytes):
+    """Write bytes to a temp file with one buffered write, fsync, then swap it into place.
+    
+    Readers never see a partially written file, and a crash mid-write
+    leaves the previous version intact.
+    """
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_path, 'wb', buffering=1 << 20) as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _progress_percentage(completed_count: int, total_sections: int) -> float:
+    """Percentage of sections completed."""
+    if total_sections == 0:
+        # If total not yet calculated, estimate based on minimum sections
+        if completed_count:
+            return min(95.0, completed_count * 5)
+        return 0.0
+    return (completed_count / total_sections) * 100
 
 
-@dataclass
+def _summarize(connector: 'Connector') -> Dict[str, Any]:
+    """List-view fields for a connector."""
+    return {
+        'id': connector.id,
+        'name': connector.name,
+        'status': connector.status,
+        'percentage': connector.progress.percentage
+    }
+
+
+def _to_plain(value: Any) -> Any:
+    """Convert dataclass instances nested in progress payloads (e.g. SectionReview) to dicts."""
+    if isinstance(value, dict):
+        return {k: _to_plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_plain(v) for v in value]
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    return value
+
+
+def _has_dataclass(value: Any) -> bool:
+    """Check (without copying) whether a payload contains dataclass instances."""
+    if isinstance(value, dict):
+        return any(_has_dataclass(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_dataclass(v) for v in value)
+    return is_dataclass(value) and not isinstance(value, type)
+
+
+def _jsonable(value: Any) -> Any:
+    """Return a payload as-is when already JSON-safe, converting only if needed."""
+    return _to_plain(value) if _has_dataclass(value) else value
+
+
+@dataclass(slots=True)
 class ConnectorProgress:
     """Tracks research generation progress."""
     current_section: int = 0
@@ -55,18 +183,63 @@ class ConnectorProgress:
     contradictions: List[Any] = field(default_factory=list)  # Detected contradictions
     engineering_costs: Dict[str, Any] = field(default_factory=dict)  # Engineering cost analysis
     overall_confidence: float = 0.0  # Overall confidence score
+    # Mirrors of sections_completed / sections_failed for O(1) membership tests; not serialized
+    _completed_set: Set[int] = field(default_factory=set, init=False, repr=False, compare=False)
+    _failed_set: Set[int] = field(default_factory=set, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._completed_set = set(self.sections_completed)
+        self._failed_set = set(self.sections_failed)
     
     @property
     def percentage(self) -> float:
-        if self.total_sections == 0:
-            # If total not yet calculated, estimate based on minimum sections
-            if self.sections_completed:
-                return min(95.0, len(self.sections_completed) * 5)
-            return 0.0
-        return (len(self.sections_completed) / self.total_sections) * 100
+        return _progress_percentage(len(self.sections_completed), self.total_sections)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            'current_section': self.current_section,
+            'total_sections': self.total_sections,
+            'current_phase': self.current_phase,
+            'sections_completed': list(self.sections_completed),
+            'sections_failed': list(self.sections_failed),
+            'current_section_name': self.current_section_name,
+            'research_method': dict(self.research_method),
+            'discovered_methods': list(self.discovered_methods),
+            'section_reviews': _to_plain(self.section_reviews),
+            'stop_the_line_events': _to_plain(self.stop_the_line_events),
+            'contradictions': _to_plain(self.contradictions),
+            'engineering_costs': _to_plain(self.engineering_costs),
+            'overall_confidence': self.overall_confidence
+        }
+    
+    def to_jsonable(self) -> Dict[str, Any]:
+        """Shallow JSON-ready dict for a payload that is serialized right away.
+        
+        Unlike to_dict, the large review/contradiction/cost payloads are
+        passed by reference unless they hold dataclasses. update_progress
+        only ever replaces those wholesale, never mutates them in place.
+        The small section lists and method map are still copied because
+        update_progress mutates them.
+        """
+        return {
+            'current_section': self.current_section,
+            'total_sections': self.total_sections,
+            'current_phase': self.current_phase,
+            'sections_completed': list(self.sections_completed),
+            'sections_failed': list(self.sections_failed),
+            'current_section_name': self.current_section_name,
+            'research_method': dict(self.research_method),
+            'discovered_methods': list(self.discovered_methods),
+            'section_reviews': _jsonable(self.section_reviews),
+            'stop_the_line_events': _jsonable(self.stop_the_line_events),
+            'contradictions': _jsonable(self.contradictions),
+            'engineering_costs': _jsonable(self.engineering_costs),
+            'overall_confidence': self.overall_confidence
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class ManualInput:
     """Manual input for object lists (CSV, PDF, or text)."""
     text: Optional[str] = None           # Text list of objects
@@ -95,7 +268,7 @@ class ManualInput:
         return bool(self.text or self.file_content)
 
 
-@dataclass
+@dataclass(slots=True)
 class FivetranUrls:
     """Fivetran documentation URLs for parity comparison."""
     setup_guide_url: Optional[str] = None        # Setup Guide page (prerequisites, auth)
@@ -124,13 +297,13 @@ class FivetranUrls:
         return any([self.setup_guide_url, self.connector_overview_url, self.schema_info_url])
 
 
-@dataclass
+@dataclass(slots=True)
 class Connector:
     """Represents a connector research project."""
     id: str  # slug, e.g., "facebook-ads"
     name: str  # Display name, e.g., "Facebook Ads"
     connector_type: str = "auto"  # Auto-discovered during research
-    status: str = ConnectorStatus.NOT_STARTED.value
+    status: str = _STATUS_NOT_STARTED
     github_url: Optional[str] = None
     hevo_github_url: Optional[str] = None  # Optional Hevo connector GitHub URL for comparison
     description: str = ""
@@ -176,44 +349,123 @@ class Connector:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        data = asdict(self)
-        # Convert progress to dict
-        if isinstance(self.progress, ConnectorProgress):
-            data['progress'] = asdict(self.progress)
-        # Convert fivetran_urls to dict
-        if isinstance(self.fivetran_urls, FivetranUrls):
-            data['fivetran_urls'] = self.fivetran_urls.to_dict()
-        # Convert manual_input to dict
-        if isinstance(self.manual_input, ManualInput):
-            data['manual_input'] = self.manual_input.to_dict()
-        return data
+        progress = self.progress
+        fivetran_urls = self.fivetran_urls
+        manual_input = self.manual_input
+        return {
+            'id': self.id,
+            'name': self.name,
+            'connector_type': self.connector_type,
+            'status': self.status,
+            'github_url': self.github_url,
+            'hevo_github_url': self.hevo_github_url,
+            'description': self.description,
+            'official_doc_urls': list(self.official_doc_urls) if self.official_doc_urls is not None else None,
+            'doc_crawl_status': self.doc_crawl_status,
+            'doc_crawl_urls': list(self.doc_crawl_urls) if self.doc_crawl_urls is not None else None,
+            'doc_crawl_pages': self.doc_crawl_pages,
+            'doc_crawl_words': self.doc_crawl_words,
+            'fivetran_urls': fivetran_urls.to_dict() if fivetran_urls else None,
+            'manual_input': manual_input.to_dict() if manual_input else None,
+            'discovered_methods': list(self.discovered_methods),
+            'objects_count': self.objects_count,
+            'vectors_count': self.vectors_count,
+            'fivetran_parity': self.fivetran_parity,
+            'progress': progress.to_dict() if progress else None,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'completed_at': self.completed_at,
+            'sources': list(self.sources),
+            'pinecone_index': self.pinecone_index
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Connector':
-        """Create from dictionary."""
-        # Make a copy to avoid modifying the original
-        data = data.copy()
+        """Create from dictionary (the input dict is not modified)."""
+        _get = data.get
         
         # Handle progress
-        progress_data = data.pop('progress', {})
+        progress_data = _get('progress', {})
         if isinstance(progress_data, dict):
-            progress = ConnectorProgress(**progress_data) if progress_data else ConnectorProgress()
+            progress = _build_fast(
+                ConnectorProgress,
+                _PROGRESS_DEFAULTS,
+                _PROGRESS_FACTORIES,
+                {k: v for k, v in progress_data.items() if k in _PROGRESS_FIELDS}
+            ) if progress_data else ConnectorProgress()
+            progress._completed_set = set(progress.sections_completed)
+            progress._failed_set = set(progress.sections_failed)
         else:
             progress = ConnectorProgress()
         
         # Handle fivetran_urls
-        fivetran_urls_data = data.pop('fivetran_urls', None)
+        fivetran_urls_data = _get('fivetran_urls')
         fivetran_urls = FivetranUrls.from_dict(fivetran_urls_data) if fivetran_urls_data else None
         
         # Handle manual_input
-        manual_input_data = data.pop('manual_input', None)
+        manual_input_data = _get('manual_input')
         manual_input = ManualInput.from_dict(manual_input_data) if manual_input_data else None
         
-        # Filter out any unknown fields that aren't in the dataclass
-        known_fields = {f.name for f in fields(cls)}
-        filtered_data = {k: v for k, v in data.items() if k in known_fields}
+        # Filter out unknown fields and the nested ones handled above
+        filtered_data = {k: v for k, v in data.items() if k in _CONNECTOR_PLAIN_FIELDS}
         
-        return cls(progress=progress, fivetran_urls=fivetran_urls, manual_input=manual_input, **filtered_data)
+        # Skip __init__/__post_init__: set attributes directly, keeping the
+        # pinecone_index default inline
+        obj = _build_fast(cls, _CONNECTOR_DEFAULTS, _CONNECTOR_FACTORIES, filtered_data)
+        obj.progress = progress
+        obj.fivetran_urls = fivetran_urls
+        obj.manual_input = manual_input
+        if not obj.pinecone_index:
+            obj.pinecone_index = f"{obj.id}-docs"
+        return obj
+
+
+def _field_defaults(cls) -> tuple:
+    """Split a dataclass's defaults into (static defaults, (name, factory) pairs)."""
+    defaults = {f.name: f.default for f in fields(cls) if f.default is not MISSING}
+    factories = tuple(
+        (f.name, f.default_factory) for f in fields(cls) if f.default_factory is not MISSING
+    )
+    return defaults, factories
+
+
+def _build_fast(cls, defaults: Dict[str, Any], factories: tuple, data: Dict[str, Any]):
+    """Build a slotted dataclass instance from already-validated data without calling __init__."""
+    obj = object.__new__(cls)
+    for name, value in defaults.items():
+        if name not in data:
+            setattr(obj, name, value)
+    for name, factory in factories:
+        if name not in data:
+            setattr(obj, name, factory())
+    for name, value in data.items():
+        setattr(obj, name, value)
+    return obj
+
+
+# Without discovered methods, everything after Discovery is Implementation
+_NO_METHOD_PHASE_BOUNDS = (3, 3, 3)
+
+
+# Slug cleanup for _generate_id: drop anything that is not alphanumeric
+# (unicode-aware, like str.isalnum) or a dash, then collapse dash runs
+_SLUG_STRIP_RE = re.compile(r'[^\w-]|_')
+_SLUG_DASH_RE = re.compile(r'-{2,}')
+
+
+# Field names and defaults computed once at import instead of walking fields() per from_dict call
+_PROGRESS_FIELDS = frozenset(f.name for f in fields(ConnectorProgress) if f.init)
+_CONNECTOR_FIELDS = frozenset(f.name for f in fields(Connector))
+_CONNECTOR_PLAIN_FIELDS = _CONNECTOR_FIELDS - {'progress', 'fivetran_urls', 'manual_input'}
+_PROGRESS_DEFAULTS, _PROGRESS_FACTORIES = _field_defaults(ConnectorProgress)
+_CONNECTOR_DEFAULTS, _CONNECTOR_FACTORIES = _field_defaults(Connector)
+
+
+@lru_cache(maxsize=None)
+def _import_db():
+    """Import the database layer (psycopg2/SQLAlchemy) only when DATABASE_URL is set."""
+    from services.database import init_database, get_database_storage
+    return init_database, get_database_storage
 
 
 class ConnectorManager:
@@ -229,9 +481,31 @@ class ConnectorManager:
         self._use_database = False
         self._db_storage = None
         
+        # Buffered writes: dirty connector files (file mode) and pending
+        # progress updates (database mode), flushed on short timers
+        self._flush_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+        self._pending_progress: Dict[str, Dict[str, Any]] = {}
+        self._pending_timer: Optional[threading.Timer] = None
+        # Research documents (database mode): buffered fields, save counts,
+        # and the content hash last written per connector
+        self._pending_documents: Dict[str, Dict[str, Any]] = {}
+        self._pending_document_saves: Dict[str, int] = {}
+        self._document_timer: Optional[threading.Timer] = None
+        self._document_hashes: Dict[str, str] = {}
+        atexit.register(self.flush_pending)
+        
+        # Last update_progress event applied per connector, to skip repeats
+        self._last_progress_events: Dict[str, tuple] = {}
+        
+        # Cached timestamp for _now_iso: (monotonic tick, ISO string)
+        self._last_tick = float('-inf')
+        self._last_iso = ''
+        
         if os.getenv("DATABASE_URL"):
             try:
-                from services.database import init_database, get_database_storage, is_database_available
+                init_database, get_database_storage = _import_db()
                 
                 # Initialize database
                 if init_database():
@@ -254,7 +528,7 @@ class ConnectorManager:
                     base_dir = Path(__file__).parent.parent.parent / "connectors"
             
             self.base_dir = Path(base_dir)
-            self.registry_file = self.base_dir / "_agent" / "connectors_registry.json"
+            self._set_registry_paths()
             
             try:
                 self.base_dir.mkdir(parents=True, exist_ok=True)
@@ -264,7 +538,7 @@ class ConnectorManager:
             except Exception as e:
                 print(f"⚠ Could not create directories at {self.base_dir}: {e}")
                 self.base_dir = Path("/tmp/connectors")
-                self.registry_file = self.base_dir / "_agent" / "connectors_registry.json"
+                self._set_registry_paths()
                 self.base_dir.mkdir(parents=True, exist_ok=True)
                 (self.base_dir / "_agent").mkdir(exist_ok=True)
                 (self.base_dir / "_templates").mkdir(exist_ok=True)
@@ -272,51 +546,360 @@ class ConnectorManager:
             
             # Load file-based registry
             self._registry: Dict[str, Connector] = {}
+            self._dirty: set = set()
+            self._index_dirty = False
+            # List-view fields per connector, kept in step with _registry
+            self._summary: Dict[str, Dict[str, Any]] = {}
             self._load_registry()
     
+    def _now_iso(self) -> str:
+        """Current UTC time as ISO string, reused for calls within 10ms.
+        
+        update_progress bursts stamp several fields per call; timestamps
+        that close together are indistinguishable for our purposes.
+        """
+        tick = time.monotonic()
+        if tick - self._last_tick >= 0.01:
+            self._last_tick = tick
+            self._last_iso = datetime.utcnow().isoformat()
+        return self._last_iso
+    
+    def _set_registry_paths(self):
+        """Point registry paths at the current base_dir."""
+        agent_dir = self.base_dir / "_agent"
+        # Legacy single-file registry, only read for migration
+        self.registry_file = agent_dir / "connectors_registry.json"
+        self.connectors_dir = agent_dir / "connectors"
+        self.index_file = agent_dir / "connectors_index.json"
+    
     def _load_registry(self):
-        """Load connector registry from file (file-based mode only)."""
+        """Load connector registry from per-connector files (file-based mode only)."""
         if self._use_database:
             return
         
-        if self.registry_file.exists():
-            try:
-                with open(self.registry_file, 'r') as f:
-                    data = json.load(f)
-                    for connector_id, connector_data in data.get('connectors', {}).items():
-                        self._registry[connector_id] = Connector.from_dict(connector_data)
-            except (json.JSONDecodeError, KeyError) as e:
-                print(f"Warning: Could not load registry: {e}")
-                self._registry = {}
+        self._registry = {}
+        paths = sorted(self.connectors_dir.glob("*.json")) if self.connectors_dir.exists() else []
+        
+        if paths:
+            # I/O bound, so threads overlap the file reads
+            with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+                for connector in pool.map(self._load_connector_file, paths):
+                    if connector is not None:
+                        self._registry[connector.id] = connector
+        elif self.registry_file.exists():
+            self._migrate_legacy_registry()
+        
+        self._summary = {cid: _summarize(c) for cid, c in self._registry.items()}
+    
+    @staticmethod
+    def _load_connector_file(path: Path) -> Optional[Connector]:
+        """Load a single connector file, returning None if it is unreadable."""
+        try:
+            with open(path, 'rb') as f:
+                return Connector.from_dict(_load_json(f.read()))
+        except (OSError, json.JSONDecodeError, KeyError, TypeError) as e:
+            print(f"Warning: Could not load connector file {path.name}: {e}")
+            return None
+    
+    def _migrate_legacy_registry(self):
+        """Split the old single-file registry into per-connector files."""
+        try:
+            connectors = dict(self._iter_legacy_registry())
+        except _LEGACY_REGISTRY_ERRORS as e:
+            # Nothing is written on failure, so the next start retries the migration
+            print(f"Warning: Could not load registry: {e}")
+            return
+        
+        self._registry.update(connectors)
+        if self._registry:
+            self._dirty.update(self._registry)
+            self._index_dirty = True
+            self._flush_dirty()
+            print(f"✓ Migrated {len(self._registry)} connectors to {self.connectors_dir}")
+    
+    def _iter_legacy_registry(self):
+        """Yield (connector_id, Connector) pairs from the legacy registry file.
+        
+        With ijson the file is streamed one connector at a time, so peak
+        memory does not include the whole parsed document. The template
+        registry ships "connectors": [], which yields nothing either way.
+        """
+        with open(self.registry_file, 'rb') as f:
+            if IJSON_AVAILABLE:
+                for connector_id, connector_data in ijson.kvitems(f, 'connectors', use_float=True):
+                    yield connector_id, Connector.from_dict(connector_data)
+                return
+            
+            data = _load_json(f.read())
+        
+        connectors = data.get('connectors') or {}
+        if isinstance(connectors, dict):
+            for connector_id, connector_data in connectors.items():
+                yield connector_id, Connector.from_dict(connector_data)
+    
+    def _save_registry(self, connector_id: str):
+        """Schedule a connector's file to be written (file-based mode only).
+        
+        Rapid successive updates are coalesced: the dirty set is flushed
+        on a short timer instead of rewriting on every mutation.
+        """
+        if self._use_database:
+            return
+        
+        connector = self._registry.get(connector_id)
+        if connector is not None:
+            self._summary[connector_id] = _summarize(connector)
         else:
-            self._registry = {}
+            self._summary.pop(connector_id, None)
+        
+        with self._flush_lock:
+            self._dirty.add(connector_id)
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(0.1, self._flush_dirty)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
     
-    def _save_registry(self):
-        """Save connector registry to file (file-based mode only)."""
+    def flush_pending(self, connector_id: Optional[str] = None) -> bool:
+        """Write buffered updates immediately.
+        
+        Call with a connector_id before reading research_documents rows
+        directly, so a buffered document save is not missed.
+        
+        Args:
+            connector_id: Only flush this connector's buffered research
+                document (progress updates are always flushed in full)
+        
+        Returns:
+            True if every write succeeded (failures stay buffered for retry)
+        """
         if self._use_database:
+            progress_ok = self._flush_pending_progress()
+            return not self._flush_pending_documents(connector_id) and progress_ok
+        return self._flush_dirty()
+    
+    def _queue_progress_update(self, connector_id: str, updates: Dict[str, Any]):
+        """Buffer a progress update for the next batched database write (database mode only).
+        
+        Each update carries the full progress snapshot, so a newer update
+        for the same connector replaces the pending one.
+        """
+        with self._flush_lock:
+            self._pending_progress[connector_id] = updates
+            if self._pending_timer is None:
+                self._pending_timer = threading.Timer(0.2, self._flush_pending_progress)
+                self._pending_timer.daemon = True
+                self._pending_timer.start()
+    
+    def _flush_pending_progress(self) -> bool:
+        """Write buffered progress updates in one batch (database mode only).
+        
+        Updates are snapshotted under the flush lock and written outside it,
+        so producers queueing progress aren't held up by the round trip.
+        They stay buffered until the write succeeds, so reads still see them
+        and a failed batch is retried on the next flush; an entry replaced
+        by a newer update mid-write is left for the next flush.
+        
+        Returns:
+            True if the batch was written (or there was nothing to write)
+        """
+        # One flush writes at a time, so an older snapshot never lands last
+        with self._write_lock:
+            with self._flush_lock:
+                if self._pending_timer is not None:
+                    self._pending_timer.cancel()
+                    self._pending_timer = None
+                pending = dict(self._pending_progress)
+            
+            if not pending or not self._db_storage:
+                return True
+            
+            if not self._db_storage.update_connectors_batch(list(pending.items())):
+                print(f"⚠ Failed to write {len(pending)} batched progress updates")
+                return False
+            
+            with self._flush_lock:
+                for connector_id, updates in pending.items():
+                    if self._pending_progress.get(connector_id) is updates:
+                        del self._pending_progress[connector_id]
+            return True
+    
+    def _queue_document_save(self, connector_id: str, document: Dict[str, Any]):
+        """Buffer a research document save (database mode only).
+        
+        The full document is rewritten on every save, so rapid saves are
+        coalesced: the buffer is flushed once saves stop for
+        _DOCUMENT_FLUSH_DELAY seconds, or after _DOCUMENT_FLUSH_UPDATES saves.
+        Claim graph fields passed as None keep any buffered value.
+        
+        Returns:
+            False if this save triggered an immediate flush that failed to
+            write the document, True otherwise
+        """
+        with self._flush_lock:
+            # Replaced rather than updated in place, so a flush writing the
+            # previous buffer can tell it has been superseded
+            pending = dict(self._pending_documents.get(connector_id, ()))
+            pending.update((k, v) for k, v in document.items() if v is not None)
+            self._pending_documents[connector_id] = pending
+            saves = self._pending_document_saves.get(connector_id, 0) + 1
+            self._pending_document_saves[connector_id] = saves
+            
+            if self._document_timer is not None:
+                self._document_timer.cancel()
+                self._document_timer = None
+            flush_now = saves >= _DOCUMENT_FLUSH_UPDATES
+            if not flush_now:
+                self._document_timer = threading.Timer(_DOCUMENT_FLUSH_DELAY, self._flush_pending_documents)
+                self._document_timer.daemon = True
+                self._document_timer.start()
+        
+        if flush_now:
+            return connector_id not in self._flush_pending_documents()
+        return True
+    
+    def _flush_pending_documents(self, connector_id: Optional[str] = None) -> Set[str]:
+        """Write buffered research documents, one upsert each (database mode only).
+        
+        Like progress updates, documents are snapshotted under the flush lock
+        and written outside it, staying buffered until their write commits so
+        reads still see them. A document saved again mid-write is left for
+        the next flush; one that fails to write is logged and retried then.
+        
+        Args:
+            connector_id: Only flush this connector's document
+        
+        Returns:
+            IDs of connectors whose document failed to write
+        """
+        # One flush writes at a time, so an older snapshot never lands last
+        with self._write_lock:
+            with self._flush_lock:
+                if connector_id is None:
+                    if self._document_timer is not None:
+                        self._document_timer.cancel()
+                        self._document_timer = None
+                    pending = dict(self._pending_documents)
+                    self._pending_document_saves = {}
+                else:
+                    document = self._pending_documents.get(connector_id)
+                    self._pending_document_saves.pop(connector_id, None)
+                    pending = {connector_id: document} if document else {}
+            
+            failed = set()
+            if not pending or not self._db_storage:
+                return failed
+            
+            written = {}
+            for pending_id, document in pending.items():
+                content_hash = hashlib.sha256(document['content'].encode('utf-8')).hexdigest()
+                # Unchanged text and no claim graph data: nothing to write
+                if len(document) == 1 and self._document_hashes.get(pending_id) == content_hash:
+                    written[pending_id] = content_hash
+                elif self._db_storage.save_research_document(connector_id=pending_id, **document):
+                    written[pending_id] = content_hash
+                else:
+                    print(f"⚠ Failed to write buffered research document for {pending_id}")
+                    failed.add(pending_id)
+            
+            with self._flush_lock:
+                for pending_id, content_hash in written.items():
+                    self._document_hashes[pending_id] = content_hash
+                    if self._pending_documents.get(pending_id) is pending[pending_id]:
+                        del self._pending_documents[pending_id]
+            return failed
+    
+    def _with_pending(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Overlay a buffered progress update onto a database row (database mode only)."""
+        pending = self._pending_progress.get(data.get('id'))
+        if pending:
+            data.update(pending)
+        return data
+    
+    def _flush_dirty(self) -> bool:
+        """Write all pending connector files and the index (file-based mode only).
+        
+        Connectors are snapshotted under the flush lock and written outside
+        it, so request threads queueing saves aren't held up by disk I/O.
+        A connector mutated mid-snapshot is re-marked dirty by its
+        _save_registry call, so the next flush writes the settled state.
+        IDs whose write fails go back into the dirty set and are retried on
+        the next flush.
+        
+        Returns:
+            True if every pending write succeeded
+        """
+        if self._use_database:
+            return True
+        
+        # One flush writes at a time, so an older snapshot never lands last
+        with self._write_lock:
+            with self._flush_lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                dirty, self._dirty = self._dirty, set()
+                
+                if not dirty and not self._index_dirty:
+                    return True
+                
+                snapshots = {}
+                for connector_id in dirty:
+                    connector = self._registry.get(connector_id)
+                    snapshots[connector_id] = connector.to_dict() if connector is not None else None
+                connector_ids = sorted(self._registry)
+                self._index_dirty = False
+            
+            failed = set()
+            try:
+                self.connectors_dir.mkdir(parents=True, exist_ok=True)
+                for connector_id, data in snapshots.items():
+                    try:
+                        self._save_connector(connector_id, data)
+                    except OSError as e:
+                        print(f"⚠ Failed to write connector file {connector_id}: {e}")
+                        failed.add(connector_id)
+                self._save_index(connector_ids)
+            except OSError as e:
+                print(f"⚠ Failed to write connector registry: {e}")
+                failed.update(snapshots)
+                with self._flush_lock:
+                    self._index_dirty = True
+            
+            if failed:
+                with self._flush_lock:
+                    self._dirty.update(failed)
+            return not failed
+    
+    def _save_connector(self, connector_id: str, data: Optional[Dict[str, Any]]):
+        """Write one connector's file atomically, or remove it if deleted (data is None)."""
+        path = self.connectors_dir / f"{connector_id}.json"
+        
+        if data is None:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
             return
         
+        _write_atomic(path, _dump_json(data))
+    
+    def _save_index(self, connector_ids: List[str]):
+        """Write the registry index listing all connector IDs."""
         data = {
-            'connectors': {
-                connector_id: connector.to_dict()
-                for connector_id, connector in self._registry.items()
-            },
+            'connectors': connector_ids,
             'metadata': {
-                'version': '1.0.0',
-                'updated_at': datetime.utcnow().isoformat()
+                'version': '2.0.0',
+                'updated_at': self._now_iso()
             }
         }
         
-        with open(self.registry_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        _write_atomic(self.index_file, _dump_json(data))
     
     def _generate_id(self, name: str) -> str:
         """Generate a URL-safe ID from connector name."""
-        slug = name.lower().strip()
-        slug = slug.replace(' ', '-')
-        slug = ''.join(c for c in slug if c.isalnum() or c == '-')
-        while '--' in slug:
-            slug = slug.replace('--', '-')
+        slug = name.lower().strip().replace(' ', '-')
+        slug = _SLUG_STRIP_RE.sub('', slug)
+        slug = _SLUG_DASH_RE.sub('-', slug)
         return slug.strip('-')
     
     def create_connector(
@@ -342,7 +925,6 @@ class ConnectorManager:
             file_content_str = None
             if manual_file_content:
                 if isinstance(manual_file_content, bytes):
-                    import base64
                     file_content_str = base64.b64encode(manual_file_content).decode('utf-8')
                 else:
                     file_content_str = manual_file_content
@@ -358,7 +940,7 @@ class ConnectorManager:
             'id': connector_id,
             'name': name,
             'connector_type': connector_type,
-            'status': ConnectorStatus.NOT_STARTED.value,
+            'status': _STATUS_NOT_STARTED,
             'github_url': github_url,
             'hevo_github_url': hevo_github_url,
             'official_doc_urls': official_doc_urls,
@@ -378,8 +960,8 @@ class ConnectorManager:
                 'current_section_name': '',
                 'research_method': {}
             },
-            'created_at': datetime.utcnow().isoformat(),
-            'updated_at': datetime.utcnow().isoformat(),
+            'created_at': self._now_iso(),
+            'updated_at': self._now_iso(),
             'completed_at': None,
             'sources': [],
             'pinecone_index': f"{connector_id}-docs"
@@ -419,7 +1001,8 @@ class ConnectorManager:
             )
             
             self._registry[connector_id] = connector
-            self._save_registry()
+            self._index_dirty = True
+            self._save_registry(connector_id)
             self._create_research_document(connector)
             
             return connector
@@ -472,7 +1055,7 @@ class ConnectorManager:
         if self._use_database:
             data = self._db_storage.get_connector(connector_id)
             if data:
-                return Connector.from_dict(data)
+                return Connector.from_dict(self._with_pending(data))
             return None
         else:
             return self._registry.get(connector_id)
@@ -481,10 +1064,38 @@ class ConnectorManager:
         """List all connectors."""
         if self._use_database:
             connectors_data = self._db_storage.list_connectors()
-            return [Connector.from_dict(data) for data in connectors_data]
+            return [Connector.from_dict(self._with_pending(data)) for data in connectors_data]
         else:
             return list(self._registry.values())
     
+    def list_connectors_summary(self) -> List[Dict[str, Any]]:
+        """List connectors as lightweight {id, name, status, percentage} dicts.
+        
+        Avoids hydrating full Connector objects (and their section reviews)
+        for list views that only need a few fields.
+        """
+        if self._use_database:
+            rows = self._db_storage.list_connectors_summary()
+            summaries = []
+            for row in rows:
+                pending = self._pending_progress.get(row['id'])
+                if pending:
+                    progress = pending['progress']
+                    row['status'] = pending['status']
+                    row['sections_completed_count'] = len(progress.get('sections_completed') or [])
+                    row['total_sections'] = progress.get('total_sections') or 0
+                summaries.append({
+                    'id': row['id'],
+                    'name': row['name'],
+                    'status': row['status'],
+                    'percentage': _progress_percentage(
+                        row['sections_completed_count'], row['total_sections']
+                    )
+                })
+            return summaries
+        else:
+            return list(self._summary.values())
+    
     def update_connector(self, connector_id: str, **updates) -> Optional[Connector]:
         """Update connector properties."""
         allowed_fields = {
@@ -495,11 +1106,26 @@ class ConnectorManager:
         
         # Filter to allowed fields
         filtered_updates = {k: v for k, v in updates.items() if k in allowed_fields}
-        filtered_updates['updated_at'] = datetime.utcnow().isoformat()
+        filtered_updates['updated_at'] = self._now_iso()
+        # The connector may have changed under the last event, so the next
+        # update_progress must be written even if it repeats that event
+        self._last_progress_events.pop(connector_id, None)
         
         if self._use_database:
+            # Buffered progress must land first so it cannot overwrite this update
+            self._flush_pending_progress()
             result = self._db_storage.update_connector(connector_id, filtered_updates)
             if result:
+                with self._flush_lock:
+                    # A snapshot still buffered after a failed flush must not
+                    # undo this update when it is retried
+                    pending = self._pending_progress.get(connector_id)
+                    if pending:
+                        remaining = {k: v for k, v in pending.items() if k not in filtered_updates}
+                        if remaining:
+                            self._pending_progress[connector_id] = remaining
+                        else:
+                            del self._pending_progress[connector_id]
                 return Connector.from_dict(result)
             return None
         else:
@@ -511,7 +1137,7 @@ class ConnectorManager:
                 if hasattr(connector, key):
                     setattr(connector, key, value)
             
-            self._save_registry()
+            self._save_registry(connector_id)
             return connector
     
     def update_progress(
@@ -527,9 +1153,22 @@ class ConnectorManager:
         research_progress: Optional[Any] = None  # ResearchProgress from ResearchAgent
     ) -> Optional[Connector]:
         """Update research progress for a connector."""
+        if discovered_methods:
+            # Order-preserving dedupe; phase bounds below depend on the count
+            discovered_methods = list(dict.fromkeys(discovered_methods))
+        
+        # The research agent often re-emits the same event; skip the write
+        event = (
+            section, section_name, method, completed, failed, total_sections,
+            tuple(discovered_methods or ())
+        )
+        if research_progress is None and self._last_progress_events.get(connector_id) == event:
+            return self.get_connector(connector_id)
+        
         connector = self.get_connector(connector_id)
         if not connector:
             return None
+        self._last_progress_events[connector_id] = event
         
         progress = connector.progress
         progress.current_section = section
@@ -550,7 +1189,9 @@ class ConnectorManager:
         if research_progress:
             # CRITICAL: Copy sections_completed from research agent's progress
             if hasattr(research_progress, 'sections_completed') and research_progress.sections_completed:
-                progress.sections_completed = list(research_progress.sections_completed)
+                # Kept sorted so completions below can insort
+                progress.sections_completed = sorted(research_progress.sections_completed)
+                progress._completed_set = set(progress.sections_completed)
             if hasattr(research_progress, 'total_sections') and research_progress.total_sections > 0:
                 progress.total_sections = research_progress.total_sections
             if hasattr(research_progress, 'section_reviews'):
@@ -570,21 +1211,15 @@ class ConnectorManager:
         # Phase 3: Cross-Cutting (variable)
         # Phase 4: Implementation (final sections)
         num_methods = len(progress.discovered_methods) if progress.discovered_methods else 0
+        phase_bounds = (3, 3 + num_methods, 3 + num_methods + 5) if num_methods else _NO_METHOD_PHASE_BOUNDS
+        progress.current_phase = bisect.bisect_left(phase_bounds, section) + 1
         
-        if section <= 3:
-            progress.current_phase = 1  # Discovery
-        elif num_methods > 0 and section <= 3 + num_methods:
-            progress.current_phase = 2  # Method Deep Dives
-        elif num_methods > 0 and section <= 3 + num_methods + 5:
-            progress.current_phase = 3  # Cross-Cutting
-        else:
-            progress.current_phase = 4  # Implementation
+        if completed and section not in progress._completed_set:
+            progress._completed_set.add(section)
+            bisect.insort(progress.sections_completed, section)
         
-        if completed and section not in progress.sections_completed:
-            progress.sections_completed.append(section)
-            progress.sections_completed.sort()
-        
-        if failed and section not in progress.sections_failed:
+        if failed and section not in progress._failed_set:
+            progress._failed_set.add(section)
             progress.sections_failed.append(section)
         
         # Determine new status
@@ -592,39 +1227,50 @@ class ConnectorManager:
         completed_at = connector.completed_at
         
         if len(progress.sections_completed) == progress.total_sections:
-            new_status = ConnectorStatus.COMPLETE.value
-            completed_at = datetime.utcnow().isoformat()
+            new_status = _STATUS_COMPLETE
+            completed_at = self._now_iso()
         elif len(progress.sections_completed) > 0 or progress.current_section > 0:
-            new_status = ConnectorStatus.RESEARCHING.value
+            new_status = _STATUS_RESEARCHING
         
         if self._use_database:
             updates = {
-                'progress': asdict(progress),
+                'progress': progress.to_jsonable(),
                 'status': new_status,
                 'completed_at': completed_at,
-                'updated_at': datetime.utcnow().isoformat()
+                'updated_at': self._now_iso()
             }
-            result = self._db_storage.update_connector(connector_id, updates)
-            if result:
-                return Connector.from_dict(result)
-            return None
+            self._queue_progress_update(connector_id, updates)
+            
+            connector.status = new_status
+            connector.completed_at = completed_at
+            connector.updated_at = updates['updated_at']
+            return connector
         else:
             connector.status = new_status
             connector.completed_at = completed_at
-            connector.updated_at = datetime.utcnow().isoformat()
-            self._save_registry()
+            connector.updated_at = self._now_iso()
+            self._save_registry(connector_id)
             return connector
     
     def delete_connector(self, connector_id: str) -> bool:
         """Delete a connector."""
+        self._last_progress_events.pop(connector_id, None)
         if self._use_database:
-            return self._db_storage.delete_connector(connector_id)
+            self._flush_pending_progress()
+            # Wait out an in-flight document write so it can't land after the delete
+            with self._write_lock:
+                with self._flush_lock:
+                    self._pending_documents.pop(connector_id, None)
+                    self._pending_document_saves.pop(connector_id, None)
+                    self._document_hashes.pop(connector_id, None)
+                return self._db_storage.delete_connector(connector_id)
         else:
             if connector_id not in self._registry:
                 return False
             
             del self._registry[connector_id]
-            self._save_registry()
+            self._index_dirty = True
+            self._save_registry(connector_id)
             return True
     
     def get_connector_dir(self, connector_id: str) -> Optional[Path]:
@@ -650,6 +1296,12 @@ class ConnectorManager:
     def get_research_document(self, connector_id: str) -> Optional[str]:
         """Get the content of a connector's research document."""
         if self._use_database:
+            # Buffered documents stay put until their write commits, so a
+            # document missing here is already in the database
+            with self._flush_lock:
+                pending = self._pending_documents.get(connector_id)
+                if pending:
+                    return pending['content']
             return self._db_storage.get_research_document(connector_id)
         else:
             doc_path = self.get_research_document_path(connector_id)
@@ -670,19 +1322,24 @@ class ConnectorManager:
         validation_attempts: Optional[int] = None,
         assumptions_section: Optional[str] = None
     ) -> bool:
-        """Save research document content with optional claim graph data."""
+        """Save research document content with optional claim graph data.
+        
+        In database mode the write is buffered and flushed shortly after
+        (see _queue_document_save); reads see the buffered content. A failed
+        deferred flush is logged and retried; use flush_pending(connector_id)
+        to confirm the document reached the database.
+        """
         if self._use_database:
-            return self._db_storage.save_research_document(
-                connector_id=connector_id,
-                content=content,
-                claims_json=claims_json,
-                canonical_facts_json=canonical_facts_json,
-                evidence_map_json=evidence_map_json,
-                citation_report_json=citation_report_json,
-                citation_overrides_json=citation_overrides_json,
-                validation_attempts=validation_attempts,
-                assumptions_section=assumptions_section
-            )
+            return self._queue_document_save(connector_id, {
+                'content': content,
+                'claims_json': claims_json,
+                'canonical_facts_json': canonical_facts_json,
+                'evidence_map_json': evidence_map_json,
+                'citation_report_json': citation_report_json,
+                'citation_overrides_json': citation_overrides_json,
+                'validation_attempts': validation_attempts,
+                'assumptions_section': assumptions_section
+            })
         else:
             doc_path = self.get_research_document_path(connector_id)
             if not doc_path:
@@ -707,11 +1364,15 @@ class ConnectorManager:
 
 # Singleton instance
 _manager: Optional[ConnectorManager] = None
+_manager_lock = threading.Lock()
 
 
 def get_connector_manager() -> ConnectorManager:
     """Get the singleton ConnectorManager instance."""
     global _manager
     if _manager is None:
-        _manager = ConnectorManager()
+        # Double-checked so concurrent first calls don't run init_database twice
+        with _manager_lock:
+            if _manager is None:
+                _manager = ConnectorManager()
     return _manager
\ No newline at end of file
@@ -4,14 +4,89 @@ Identifies contradictions between sources, especially for critical claims.
 """
 
 import re
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from services.uncertainty_model import SourceType, SourceClaim
 
+# Try to import numpy for vectorized pair scans on large claim lists
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
 
-@dataclass
+# Try to import numba to JIT-compile the pair scan for very large claim lists
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Try to import hyperscan to prefilter very long documents before the claim regexes
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+
+# Compiled once at import; used on every claim pair and content scan
+_RE_NUMBERS = re.compile(r'\d+')
+_RE_SUPPORTS = re.compile(r'([A-Z][^.]*supports?[^.]*\.)', re.IGNORECASE)
+_RE_IS = re.compile(r'([A-Z][^.]*is [^.]*\.)', re.IGNORECASE)
+_RE_REQUIRES = re.compile(r'([A-Z][^.]*requires?[^.]*\.)', re.IGNORECASE)
+_RE_RATE = re.compile(
+    r'(\d+\s*(?:requests?|calls?|queries?)\s*(?:per|/)\s*(?:second|minute|hour|day))',
+    re.IGNORECASE
+)
+
+_RE_LETTER = re.compile(r'[A-Z]', re.IGNORECASE)
+
+# Anchors of the supports/is/requires claim patterns, in pattern order
+_CLAIM_KEYWORDS = ("support", "is ", "require")
+
+# Keywords that put two numeric claims in the same (rate-limit) context
+_RATE_KEYWORDS = ("rate", "limit", "per", "second", "minute", "hour", "day")
+
+# (negative, positive) substrings that make two claims explicitly contradict
+_CONTRADICTION_INDICATORS = (
+    ("not", "yes"),
+    ("no", "yes"),
+    ("does not", "does"),
+    ("unsupported", "supported"),
+    ("not available", "available"),
+    ("none", "some"),
+    ("0", ">0")
+)
+# Below this many claims the bucketed Python scan beats building N x N arrays
+_NUMPY_MIN_CLAIMS = 64
+# Above this many claims the compiled scan amortizes its one-time JIT cost
+_NUMBA_MIN_CLAIMS = 512
+
+# Non-ASCII content at least this long is prefiltered with Hyperscan instead of
+# running the backtracking regexes over all of it (ASCII has the sentence scan)
+_HYPERSCAN_MIN_CHARS = 1 << 14
+
+# Keyword anchors for the Hyperscan prefilter, one per pattern in _HYPERSCAN_REGEXES.
+# Each is a superset of what the IGNORECASE regex accepts for that keyword;
+# Hyperscan does not fold U+0130/U+0131 to "i", so those are listed explicitly.
+_HYPERSCAN_KEYWORDS = (
+    r'support',
+    r'[i\x{130}\x{131}]s ',
+    r'requ[i\x{130}\x{131}]re',
+    r'request|call|quer[i\x{130}\x{131}]e',
+)
+_HYPERSCAN_REGEXES = (_RE_SUPPORTS, _RE_IS, _RE_REQUIRES, _RE_RATE)
+
+_NEG_INDICATORS = tuple(neg for neg, _ in _CONTRADICTION_INDICATORS)
+_POS_INDICATORS = tuple(pos for _, pos in _CONTRADICTION_INDICATORS)
+
+
+@dataclass(slots=True, frozen=True)
 class Contradiction:
     """A contradiction between sources."""
     claim: str
@@ -25,6 +100,245 @@ class Contradiction:
     resolution_strategy: str  # "CONFIDENCE_WEIGHTED", "SOURCE_PRIORITY", "HUMAN_REVIEW"
 
 
+def _scan_claim_sentences(content: str) -> List[str]:
+    """Single-pass equivalent of the supports/is/requires claim patterns.
+    
+    Each pattern ``[A-Z][^.]*<keyword>[^.]*\\.`` can only match inside one
+    period-terminated segment, starting at that segment's first letter,
+    and it matches exactly when a keyword occurrence starts after that
+    letter. So one split plus a C-level rfind per keyword replaces three
+    backtracking regex scans. Returns one entry per matching pattern, like
+    the separate findall calls did. Only valid for ASCII content, where
+    lowercasing cannot shift offsets.
+    """
+    claims = []
+    segments = content.split('.')
+    
+    # The last segment has no terminating period, so it never matches
+    for segment in segments[:-1]:
+        letter = _RE_LETTER.search(segment)
+        if letter is None:
+            continue
+        start = letter.start()
+        lowered = segment.lower()
+        for keyword in _CLAIM_KEYWORDS:
+            if lowered.rfind(keyword) > start:
+                claims.append(segment[start:] + '.')
+    
+    return claims
+
+
+@lru_cache(maxsize=1)
+def _hyperscan_database():
+    """Compile the Hyperscan keyword database once, on first use."""
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+    database.compile(
+        expressions=[keyword.encode() for keyword in _HYPERSCAN_KEYWORDS],
+        ids=list(range(len(_HYPERSCAN_KEYWORDS))),
+        flags=[flags] * len(_HYPERSCAN_KEYWORDS)
+    )
+    return database
+
+
+def _hyperscan_findall(content: str, include_rate: bool) -> List[str]:
+    """Hyperscan-prefiltered equivalent of the claim (and rate) findall calls.
+    
+    None of the patterns can match across a period, so findall over the
+    document equals findall over each period-terminated segment in turn.
+    One SIMD pass over the UTF-8 bytes finds the segments that contain a
+    keyword, and only those are decoded and handed to the regexes. A
+    period is a single byte in UTF-8, so byte segments map onto the str
+    segments. Results come back in pattern order, then document order.
+    """
+    data = content.encode('utf-8')
+    segment_starts = [set() for _ in _HYPERSCAN_REGEXES]
+    # Matches arrive ordered by end offset: [bytes searched for periods, current segment start]
+    cursor = [0, 0]
+    
+    def on_match(pattern_id, start, end, flags, context):
+        period = data.rfind(b'.', cursor[0], end)
+        if period != -1:
+            cursor[1] = period + 1
+        cursor[0] = end
+        segment_starts[pattern_id].add(cursor[1])
+    
+    _hyperscan_database().scan(data, match_event_handler=on_match)
+    
+    claims = []
+    regex_count = len(_HYPERSCAN_REGEXES) if include_rate else len(_HYPERSCAN_REGEXES) - 1
+    for pattern_id in range(regex_count):
+        regex = _HYPERSCAN_REGEXES[pattern_id]
+        for start in sorted(segment_starts[pattern_id]):
+            end = data.find(b'.', start)
+            segment = data[start:] if end == -1 else data[start:end + 1]
+            claims.extend(regex.findall(segment.decode('utf-8')))
+    
+    return claims
+
+
+# Maps every ASCII non-digit to a space, so split() yields the digit runs
+_DIGIT_TRANS = str.maketrans({
+    chr(c): (chr(c) if chr(c).isdigit() else ' ') for c in range(128)
+})
+
+
+def _digit_runs(text: str) -> List[str]:
+    """Runs of digits in text, same as _RE_NUMBERS.findall."""
+    if text.isascii():
+        return text.translate(_DIGIT_TRANS).split()
+    # Unicode digits and unmapped characters need the regex
+    return _RE_NUMBERS.findall(text)
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _pair_scan(neg, pos, rate, text_id, number_id, has_numbers, out):
+        """Compiled contradict() over the upper triangle; marks hits in out[i, j]."""
+        n = neg.shape[0]
+        for i in prange(n):
+            for j in range(i + 1, n):
+                if text_id[i] == text_id[j]:
+                    continue
+                if (neg[i] & pos[j]) != 0 or (pos[i] & neg[j]) != 0:
+                    out[i, j] = True
+                elif (has_numbers[i] and has_numbers[j]
+                        and number_id[i] != number_id[j]
+                        and (rate[i] & rate[j]) != 0):
+                    out[i, j] = True
+
+
+def _substring_mask(text: str, words: tuple) -> int:
+    """Bitmask with bit k set when words[k] occurs in text."""
+    mask = 0
+    for bit, word in enumerate(words):
+        if word in text:
+            mask |= 1 << bit
+    return mask
+
+
+class _ClaimTable:
+    """
+    Per-claim comparison features, stored column-wise.
+    
+    Normalization, indicator probes and number extraction run once per
+    claim instead of once per pair; a pair test is then a few integer
+    ANDs and a set comparison. text_hash lets identical claims be
+    rejected with an integer compare before touching the strings. Bit k of neg_mask/pos_mask corresponds
+    to _CONTRADICTION_INDICATORS[k], bit k of rate_mask to _RATE_KEYWORDS[k].
+    """
+    
+    __slots__ = ('normalized', 'text_hash', 'neg_mask', 'pos_mask', 'numbers', 'rate_mask')
+    
+    def __init__(self, claims: List[Any]):
+        normalized = [c.get('claim', '').lower().strip() for c in claims]
+        self.normalized = normalized
+        self.text_hash = [hash(text) for text in normalized]
+        self.neg_mask = [_substring_mask(text, _NEG_INDICATORS) for text in normalized]
+        self.pos_mask = [_substring_mask(text, _POS_INDICATORS) for text in normalized]
+        self.numbers = [frozenset(_digit_runs(text)) for text in normalized]
+        self.rate_mask = [_substring_mask(text, _RATE_KEYWORDS) for text in normalized]
+    
+    def contradict(self, i: int, j: int) -> bool:
+        """Whether claims i and j contradict (see ContradictionDetector._are_contradictory)."""
+        # Exact match - not contradictory (hashes differ for almost every other pair)
+        if self.text_hash[i] == self.text_hash[j] and self.normalized[i] == self.normalized[j]:
+            return False
+        
+        # Explicit indicator on one side, its counterpart on the other
+        if (self.neg_mask[i] & self.pos_mask[j]) or (self.pos_mask[i] & self.neg_mask[j]):
+            return True
+        
+        # Different numbers in a shared rate-limit context
+        numbers1 = self.numbers[i]
+        numbers2 = self.numbers[j]
+        return bool(
+            numbers1 and numbers2 and numbers1 != numbers2
+            and self.rate_mask[i] & self.rate_mask[j]
+        )
+    
+    def contradicting_pairs(self) -> List[tuple]:
+        """All contradicting index pairs (i < j), in row-major order."""
+        count = len(self.normalized)
+        if NUMBA_AVAILABLE and count >= _NUMBA_MIN_CLAIMS:
+            return self._contradicting_pairs_numba()
+        if NUMPY_AVAILABLE and count >= _NUMPY_MIN_CLAIMS:
+            return self._contradicting_pairs_numpy()
+        return [(i, j) for i, j in sorted(self.candidate_pairs()) if self.contradict(i, j)]
+    
+    def _feature_arrays(self) -> tuple:
+        """Features as numpy arrays; equal ids mean equal normalized text / number sets."""
+        text_ids = {}
+        number_ids = {}
+        return (
+            np.array(self.neg_mask, dtype=np.uint8),
+            np.array(self.pos_mask, dtype=np.uint8),
+            np.array(self.rate_mask, dtype=np.uint8),
+            np.array([text_ids.setdefault(t, len(text_ids)) for t in self.normalized], dtype=np.int64),
+            np.array([number_ids.setdefault(n, len(number_ids)) for n in self.numbers], dtype=np.int64),
+            np.array([bool(n) for n in self.numbers], dtype=np.bool_)
+        )
+    
+    def _contradicting_pairs_numba(self) -> List[tuple]:
+        """JIT-compiled, multi-threaded contradict() over the upper triangle."""
+        arrays = self._feature_arrays()
+        count = len(self.normalized)
+        out = np.zeros((count, count), dtype=np.bool_)
+        _pair_scan(*arrays, out)
+        rows, cols = np.nonzero(out)
+        return list(zip(rows.tolist(), cols.tolist()))
+    
+    def _contradicting_pairs_numpy(self) -> List[tuple]:
+        """Vectorized contradict() over the full upper triangle of pairs."""
+        neg, pos, rate, text_id, number_id, has_numbers = self._feature_arrays()
+        
+        indicated = ((neg[:, None] & pos[None, :]) | (pos[:, None] & neg[None, :])) != 0
+        numeric = (
+            (has_numbers[:, None] & has_numbers[None, :])
+            & (number_id[:, None] != number_id[None, :])
+            & ((rate[:, None] & rate[None, :]) != 0)
+        )
+        mask = np.triu((indicated | numeric) & (text_id[:, None] != text_id[None, :]), k=1)
+        
+        rows, cols = np.nonzero(mask)
+        return list(zip(rows.tolist(), cols.tolist()))
+    
+    def candidate_pairs(self) -> set:
+        """
+        Index pairs (i < j) that contradict() could accept.
+        
+        A pair can only contradict if one claim has a negative indicator
+        and the other its positive counterpart, or if both have numbers
+        and share a rate keyword. Bucketing by those bits skips the
+        (usually vast) majority of pairs.
+        """
+        pairs = set()
+        
+        for bit in range(len(_CONTRADICTION_INDICATORS)):
+            flag = 1 << bit
+            with_neg = [i for i, mask in enumerate(self.neg_mask) if mask & flag]
+            if not with_neg:
+                continue
+            with_pos = [i for i, mask in enumerate(self.pos_mask) if mask & flag]
+            for i in with_neg:
+                for j in with_pos:
+                    if i < j:
+                        pairs.add((i, j))
+                    elif j < i:
+                        pairs.add((j, i))
+        
+        numeric = [i for i, numbers in enumerate(self.numbers) if numbers]
+        if len(numeric) > 1:
+            for bit in range(len(_RATE_KEYWORDS)):
+                flag = 1 << bit
+                bucket = [i for i in numeric if self.rate_mask[i] & flag]
+                for a, i in enumerate(bucket):
+                    for j in bucket[a + 1:]:
+                        pairs.add((i, j))
+        
+        return pairs
+
+
 class ContradictionDetector:
     """Detects contradictions between sources."""
     
@@ -58,16 +372,14 @@ class ContradictionDetector:
         if len(claims) < 2:
             return contradictions
         
-        # Compare each pair of claims
-        for i, claim1_dict in enumerate(claims):
-            for claim2_dict in claims[i+1:]:
-                if self._are_contradictory(claim1_dict, claim2_dict):
-                    contradiction = self._create_contradiction(
-                        claim1_dict=claim1_dict,
-                        claim2_dict=claim2_dict,
-                        category=category
-                    )
-                    contradictions.append(contradiction)
+        # Compare only pairs that could possibly contradict, in original pair order
+        for i, j in _ClaimTable(claims).contradicting_pairs():
+            contradiction = self._create_contradiction(
+                claim1_dict=claims[i],
+                claim2_dict=claims[j],
+                category=category
+            )
+            contradictions.append(contradiction)
         
         return contradictions
     
@@ -77,51 +389,7 @@ class ContradictionDetector:
         
         Simple heuristic: claims are contradictory if they differ significantly.
         """
-        # Normalize claims for comparison
-        c1_normalized = claim1_dict.get('claim', '').lower().strip()
-        c2_normalized = claim2_dict.get('claim', '').lower().strip()
-        
-        # Exact match - not contradictory
-        if c1_normalized == c2_normalized:
-            return False
-        
-        # Check for explicit contradictions
-        contradiction_indicators = [
-            ("not", "yes"),
-            ("no", "yes"),
-            ("does not", "does"),
-            ("unsupported", "supported"),
-            ("not available", "available"),
-            ("none", "some"),
-            ("0", ">0")
-        ]
-        
-        for neg, pos in contradiction_indicators:
-            if (neg in c1_normalized and pos in c2_normalized) or \
-               (pos in c1_normalized and neg in c2_normalized):
-                return True
-        
-        # Check for significant differences in numbers/values
-        # (This is a simplified check - could be enhanced with NLP)
-        if self._has_conflicting_values(c1_normalized, c2_normalized):
-            return True
-        
-        return False
-    
-    def _has_conflicting_values(self, text1: str, text2: str) -> bool:
-        """Check if texts have conflicting numeric or categorical values."""
-        # Extract numbers
-        numbers1 = set(re.findall(r'\d+', text1))
-        numbers2 = set(re.findall(r'\d+', text2))
-        
-        # If both have numbers and they're different, might be contradictory
-        if numbers1 and numbers2 and numbers1 != numbers2:
-            # Check if they're in similar context (e.g., both rate limits)
-            if any(keyword in text1 and keyword in text2 for keyword in 
-                   ["rate", "limit", "per", "second", "minute", "hour", "day"]):
-                return True
-        
-        return False
+        return _ClaimTable([claim1_dict, claim2_dict]).contradict(0, 1)
     
     def _create_contradiction(
         self,
@@ -173,30 +441,38 @@ class ContradictionDetector:
         """
         claims = []
         
+        is_ascii = content.isascii()
+        use_hyperscan = HYPERSCAN_AVAILABLE and not is_ascii and len(content) >= _HYPERSCAN_MIN_CHARS
+        
         # Look for statements with specific patterns
-        # Pattern 1: "X supports Y"
-        pattern1 = r'([A-Z][^.]*supports?[^.]*\.)'
-        matches1 = re.findall(pattern1, content, re.IGNORECASE)
-        claims.extend(matches1)
-        
-        # Pattern 2: "X is Y"
-        pattern2 = r'([A-Z][^.]*is [^.]*\.)'
-        matches2 = re.findall(pattern2, content, re.IGNORECASE)
-        claims.extend(matches2)
-        
-        # Pattern 3: "X requires Y"
-        pattern3 = r'([A-Z][^.]*requires?[^.]*\.)'
-        matches3 = re.findall(pattern3, content, re.IGNORECASE)
-        claims.extend(matches3)
-        
-        # Pattern 4: Rate limit patterns
-        if category == "RATE_LIMIT":
-            pattern4 = r'(\d+\s*(?:requests?|calls?|queries?)\s*(?:per|/)\s*(?:second|minute|hour|day))'
-            matches4 = re.findall(pattern4, content, re.IGNORECASE)
-            claims.extend(matches4)
-        
-        # Deduplicate and clean
-        claims = list(set(claims))
-        claims = [c.strip() for c in claims if len(c.strip()) > 10]
-        
-        return claims
+        if use_hyperscan:
+            # One SIMD keyword pass, then the regexes on matching segments only
+            claims.extend(_hyperscan_findall(content, category == "RATE_LIMIT"))
+        elif is_ascii:
+            # Patterns 1-3 fused into one scan over the sentences
+            claims.extend(_scan_claim_sentences(content))
+        else:
+            # Unicode case folding can change string lengths, so use the regexes
+            # Pattern 1: "X supports Y"
+            claims.extend(_RE_SUPPORTS.findall(content))
+            
+            # Pattern 2: "X is Y"
+            claims.extend(_RE_IS.findall(content))
+            
+            # Pattern 3: "X requires Y"
+            claims.extend(_RE_REQUIRES.findall(content))
+        
+        # Pattern 4: Rate limit patterns (already covered by the Hyperscan pass)
+        if category == "RATE_LIMIT" and not use_hyperscan:
+            claims.extend(_RE_RATE.findall(content))
+        
+        # Deduplicate and clean in one pass, keeping first-seen order
+        seen = set()
+        unique_claims = []
+        for claim in claims:
+            claim = claim.strip()
+            if len(claim) > 10 and claim not in seen:
+                seen.add(claim)
+                unique_claims.append(claim)
+        
+        return unique_claims
@@ -3,20 +3,54 @@ Contradiction Resolver Service
 Resolves contradictions using confidence-weighted approach.
 """
 
-from typing import Optional
+from typing import List, Optional
 from dataclasses import dataclass
+from functools import lru_cache
 from .contradiction_detector import Contradiction
 from .uncertainty_model import UncertaintyModel, SourceType
 from typing import Any
 
+# Try to import numpy for bulk resolution
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
 
-@dataclass
+
+# Keyword -> source type, probed in order; the first keyword found wins
+_SOURCE_TYPE_KEYWORDS = (
+    ("vault", SourceType.KNOWLEDGE_VAULT),
+    ("knowledge", SourceType.KNOWLEDGE_VAULT),
+    ("docwhisperer", SourceType.DOCWHISPERER),
+    ("doc whisperer", SourceType.DOCWHISPERER),
+    ("fivetran", SourceType.FIVETRAN),
+    ("github", SourceType.GITHUB_CODE),
+    ("official", SourceType.OFFICIAL_DOCS),
+    ("docs", SourceType.OFFICIAL_DOCS),
+    ("blog", SourceType.BLOG),
+    ("community", SourceType.COMMUNITY),
+)
+
+
+# Below this many contradictions the per-item path is cheaper than building arrays
+_NUMPY_MIN_CONTRADICTIONS = 32
+
+
+@lru_cache(maxsize=1)
+def _uncertainty_model() -> UncertaintyModel:
+    """Shared UncertaintyModel; it holds no per-resolver state."""
+    return UncertaintyModel()
+
+
+@dataclass(slots=True, frozen=True)
 class Resolution:
     """Resolution of a contradiction."""
     selected_claim: Optional[str]  # None if both should be documented
     confidence: float
     uncertainty_note: str
-    both_claims: Optional[list] = None
+    both_claims: Optional[tuple] = None
     alternative_claim: Optional[str] = None
 
 
@@ -25,35 +59,93 @@ class ContradictionResolver:
     
     def __init__(self):
         """Initialize the contradiction resolver."""
-        self.uncertainty_model = UncertaintyModel()
+        self.uncertainty_model = _uncertainty_model()
     
-    async def resolve_contradiction(
+    def resolve_contradiction(
         self,
         contradiction: Contradiction
     ) -> Resolution:
         """
         Resolve contradiction using confidence-weighted approach.
         
+        Pure CPU work, so it runs synchronously; use
+        resolve_contradiction_async from coroutines that expect to await it.
+        
         Args:
             contradiction: The contradiction to resolve
             
         Returns:
             Resolution with selected claim and uncertainty note
         """
-        # Extract source types from source strings
-        source_1_type = self._extract_source_type(contradiction.source_1)
-        source_2_type = self._extract_source_type(contradiction.source_2)
+        # Calculate weighted confidence
+        weighted_1 = contradiction.confidence_1 * self._source_weight(contradiction.source_1)
+        weighted_2 = contradiction.confidence_2 * self._source_weight(contradiction.source_2)
         
-        # Get source weights
-        source_1_weight = self.uncertainty_model.get_source_weight(source_1_type)
-        source_2_weight = self.uncertainty_model.get_source_weight(source_2_type)
+        return self._build_resolution(
+            contradiction,
+            weighted_1,
+            weighted_2,
+            too_close=abs(weighted_1 - weighted_2) < 0.1,
+            first_wins=weighted_1 > weighted_2
+        )
+    
+    def resolve_contradictions(self, contradictions: List[Contradiction]) -> List[Resolution]:
+        """
+        Resolve many contradictions at once.
         
-        # Calculate weighted confidence
-        weighted_1 = contradiction.confidence_1 * source_1_weight
-        weighted_2 = contradiction.confidence_2 * source_2_weight
+        The weighted confidences and the close-call / winner decisions are
+        computed as NumPy arrays; only building the Resolution objects stays
+        per contradiction. Results match resolve_contradiction one by one.
+        
+        Args:
+            contradictions: Contradictions to resolve
+            
+        Returns:
+            Resolutions in the same order as contradictions
+        """
+        count = len(contradictions)
+        if not NUMPY_AVAILABLE or count < _NUMPY_MIN_CONTRADICTIONS:
+            return [self.resolve_contradiction(c) for c in contradictions]
+        
+        source_weight = self._source_weight
+        weighted_1 = (
+            np.fromiter((c.confidence_1 for c in contradictions), dtype=np.float64, count=count)
+            * np.fromiter((source_weight(c.source_1) for c in contradictions), dtype=np.float64, count=count)
+        )
+        weighted_2 = (
+            np.fromiter((c.confidence_2 for c in contradictions), dtype=np.float64, count=count)
+            * np.fromiter((source_weight(c.source_2) for c in contradictions), dtype=np.float64, count=count)
+        )
+        too_close = np.abs(weighted_1 - weighted_2) < 0.1
+        first_wins = weighted_1 > weighted_2
+        
+        return [
+            self._build_resolution(contradiction, w1, w2, close, wins)
+            for contradiction, w1, w2, close, wins in zip(
+                contradictions,
+                weighted_1.tolist(),
+                weighted_2.tolist(),
+                too_close.tolist(),
+                first_wins.tolist()
+            )
+        ]
+    
+    def _build_resolution(
+        self,
+        contradiction: Contradiction,
+        weighted_1: float,
+        weighted_2: float,
+        too_close: bool,
+        first_wins: bool
+    ) -> Resolution:
+        """Build the Resolution for already-weighted confidences."""
+        # Split the "left vs right" claim once; a claim without " vs " stands for both sides
+        claim_parts = contradiction.claim.split(" vs ")
+        left_claim = claim_parts[0]
+        right_claim = claim_parts[1] if len(claim_parts) > 1 else contradiction.claim
         
         # If too close to call (within 0.1), document both
-        if abs(weighted_1 - weighted_2) < 0.1:
+        if too_close:
             return Resolution(
                 selected_claim=None,  # Document both
                 confidence=min(weighted_1, weighted_2),
@@ -62,35 +154,35 @@ class ContradictionResolver:
                     f"and {contradiction.source_2} (confidence: {contradiction.confidence_2:.2f}). "
                     f"Both documented with confidence scores. Weighted confidence: {min(weighted_1, weighted_2):.2f}."
                 ),
-                both_claims=[
+                both_claims=(
                     {
-                        "claim": contradiction.claim.split(" vs ")[0],
+                        "claim": left_claim,
                         "source": contradiction.source_1,
                         "confidence": contradiction.confidence_1,
                         "weighted_confidence": weighted_1
                     },
                     {
-                        "claim": contradiction.claim.split(" vs ")[1] if " vs " in contradiction.claim else contradiction.claim,
+                        "claim": right_claim,
                         "source": contradiction.source_2,
                         "confidence": contradiction.confidence_2,
                         "weighted_confidence": weighted_2
                     }
-                ]
+                )
             )
         else:
             # Pick winner based on weighted confidence
-            if weighted_1 > weighted_2:
-                winner_claim = contradiction.claim.split(" vs ")[0] if " vs " in contradiction.claim else contradiction.claim
+            if first_wins:
+                winner_claim = left_claim
                 winner_source = contradiction.source_1
                 winner_confidence = weighted_1
                 loser_source = contradiction.source_2
-                loser_claim = contradiction.claim.split(" vs ")[1] if " vs " in contradiction.claim else contradiction.claim
+                loser_claim = right_claim
             else:
-                winner_claim = contradiction.claim.split(" vs ")[1] if " vs " in contradiction.claim else contradiction.claim
+                winner_claim = right_claim
                 winner_source = contradiction.source_2
                 winner_confidence = weighted_2
                 loser_source = contradiction.source_1
-                loser_claim = contradiction.claim.split(" vs ")[0] if " vs " in contradiction.claim else contradiction.claim
+                loser_claim = left_claim
             
             return Resolution(
                 selected_claim=winner_claim,
@@ -102,23 +194,22 @@ class ContradictionResolver:
                 alternative_claim=f"{loser_claim} (Source: {loser_source}, Confidence: {min(weighted_1, weighted_2):.2f})"
             )
     
+    async def resolve_contradiction_async(
+        self,
+        contradiction: Contradiction
+    ) -> Resolution:
+        """Awaitable wrapper around resolve_contradiction for async callers."""
+        return self.resolve_contradiction(contradiction)
+    
+    def _source_weight(self, source_string: str) -> float:
+        """Reliability weight for a source string."""
+        return self.uncertainty_model.get_source_weight(self._extract_source_type(source_string))
+    
     def _extract_source_type(self, source_string: str) -> SourceType:
         """Extract SourceType from source string."""
         source_lower = source_string.lower()
         
-        if "vault" in source_lower or "knowledge" in source_lower:
-            return SourceType.KNOWLEDGE_VAULT
-        elif "docwhisperer" in source_lower or "doc whisperer" in source_lower:
-            return SourceType.DOCWHISPERER
-        elif "fivetran" in source_lower:
-            return SourceType.FIVETRAN
-        elif "github" in source_lower:
-            return SourceType.GITHUB_CODE
-        elif "official" in source_lower or "docs" in source_lower:
-            return SourceType.OFFICIAL_DOCS
-        elif "blog" in source_lower:
-            return SourceType.BLOG
-        elif "community" in source_lower:
-            return SourceType.COMMUNITY
-        else:
-            return SourceType.OTHER
+        for keyword, source_type in _SOURCE_TYPE_KEYWORDS:
+            if keyword in source_lower:
+                return source_type
+        return SourceType.OTHER
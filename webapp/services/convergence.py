@@ -14,6 +14,8 @@ This enables early-exit for:
 """
 
 import os
+import time
+import threading
 from typing import Tuple, Dict, List, Optional
 from datetime import datetime, timedelta
 import redis
@@ -28,6 +30,30 @@ load_dotenv()
 
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
+# check_convergence results are reused for this long while the counters and
+# fact state they were computed from are unchanged.
+# Keyed by checker prefix since callers build a fresh checker per check.
+_CHECK_CACHE_TTL = 1.0
+_check_cache: Dict[str, Tuple[tuple, Tuple[bool, str], float]] = {}
+
+# Non-decoding clients for counter reads, one per Redis URL. Shared because
+# callers build a fresh checker per check; a client per checker would open
+# a new connection pool every time.
+_raw_clients: Dict[str, redis.Redis] = {}
+_raw_clients_lock = threading.Lock()
+
+
+def _get_raw_client(redis_url: str) -> redis.Redis:
+    """Get the shared non-decoding client for a Redis URL."""
+    client = _raw_clients.get(redis_url)
+    if client is None:
+        with _raw_clients_lock:
+            client = _raw_clients.get(redis_url)
+            if client is None:
+                client = redis.from_url(redis_url, decode_responses=False)
+                _raw_clients[redis_url] = client
+    return client
+
 
 class ConvergenceChecker:
     """
@@ -58,6 +84,9 @@ class ConvergenceChecker:
     # Number of tasks with no new sources before "diminishing returns" convergence
     NO_NEW_SOURCE_THRESHOLD = 5
     
+    # Set of every key this checker has written, so reset() need not SCAN
+    KEY_REGISTRY = "__keys__"
+    
     def __init__(self, redis_url: str = REDIS_URL, connector_name: str = ""):
         """
         Initialize convergence checker.
@@ -67,6 +96,8 @@ class ConvergenceChecker:
             connector_name: Name of connector being researched
         """
         self.redis = redis.from_url(redis_url, decode_responses=True)
+        # Counter reads skip UTF-8 decoding; int() parses the raw bytes directly
+        self._raw = _get_raw_client(redis_url)
         self.connector_name = connector_name
         self.prefix = f"convergence:{connector_name}" if connector_name else "convergence"
     
@@ -78,6 +109,33 @@ class ConvergenceChecker:
         """
         Check if research has converged.
         
+        Results are cached for ``_CHECK_CACHE_TTL`` seconds as long as the
+        counters and fact state have not moved, so hot polling loops only
+        evaluate once per change. Fact state is read from Redis, so facts
+        added by any worker invalidate the cached result.
+        
+        Returns:
+            Tuple of (converged: bool, reason: str)
+        """
+        recent_source_count, task_count, fact_state = self._get_counters()
+        
+        now = time.monotonic()
+        cache_key = (recent_source_count, task_count, fact_state)
+        cached = _check_cache.get(self.prefix)
+        if cached and cached[0] == cache_key and now - cached[2] < _CHECK_CACHE_TTL:
+            return cached[1]
+        
+        result = self._evaluate_convergence(recent_source_count)
+        _check_cache[self.prefix] = (cache_key, result, now)
+        return result
+    
+    def _evaluate_convergence(self, recent_source_count: int) -> Tuple[bool, str]:
+        """
+        Evaluate the convergence criteria against the artifact store.
+        
+        Args:
+            recent_source_count: Current value of the recent sources counter
+            
         Returns:
             Tuple of (converged: bool, reason: str)
         """
@@ -86,18 +144,20 @@ class ConvergenceChecker:
         
         store = get_artifact_store(self.connector_name)
         
+        # One HMGET for the per-category and total counters
+        fact_counts = store.get_fact_counts(self.REQUIRED_CATEGORIES)
+        total_facts = fact_counts["total"]
+        
         # Check 1: Minimum facts per required category
         for category in self.REQUIRED_CATEGORIES:
-            fact_count = store.get_fact_count_by_category(category)
+            fact_count = fact_counts[category]
             required = self.MIN_FACTS.get(category, 1)
             
             if fact_count < required:
                 return False, f"Need {required - fact_count} more {category} facts"
         
         # Check 2: Diminishing returns (no new sources recently)
-        recent_source_count = self._get_recent_source_count()
         if recent_source_count == 0:
-            total_facts = store.get_fact_count()
             if total_facts >= 5:  # At least some facts discovered
                 return True, f"Converged: No new sources, {total_facts} facts gathered"
         
@@ -107,27 +167,43 @@ class ConvergenceChecker:
             return True, f"Converged: High confidence ({avg_confidence:.2f})"
         
         # Check 4: Total facts threshold (absolute ceiling)
-        total_facts = store.get_fact_count()
         if total_facts >= 20:
             return True, f"Converged: Sufficient facts ({total_facts})"
         
         return False, "Still gathering information"
     
-    def _get_recent_source_count(self) -> int:
+    def _get_counters(self) -> Tuple[int, int, tuple]:
         """
-        Get count of new sources discovered in recent tasks.
+        Get the recent source count, task count, and fact state in one round trip.
+        
+        The fact state is the artifact store's total fact count plus the
+        required categories' confidence sums: everything the evaluation
+        reads that can change without a task being recorded.
         
         Returns:
-            Number of new sources in last N tasks
+            Tuple of (recent_sources, task_count, fact_state)
         """
-        recent_key = self._key("recent_sources")
-        count = self.redis.get(recent_key)
-        return int(count) if count else 0
+        from services.artifact_store import ArtifactStore
+        
+        # Key names only: building a store here would open another client
+        store_prefix = ArtifactStore.key_prefix(self.connector_name)
+        
+        pipe = self._raw.pipeline(transaction=False)
+        pipe.mget(self._key("recent_sources"), self._key("task_count"))
+        pipe.hget(f"{store_prefix}:{ArtifactStore.STATS_KEY}", "facts:total")
+        pipe.hmget(f"{store_prefix}:{ArtifactStore.CONFIDENCE_KEY}", self.REQUIRED_CATEGORIES)
+        (recent, task_count), total_facts, confidence_sums = pipe.execute()
+        
+        fact_state = (total_facts, *confidence_sums)
+        return int(recent) if recent else 0, int(task_count or 0), fact_state
     
     def _get_avg_confidence(self, categories: List[str]) -> float:
         """
         Get average confidence score across categories.
         
+        Reads the running confidence sums kept by the artifact store, so the
+        cost does not grow with the number of facts.
+        
         Args:
             categories: List of categories to check
             
@@ -138,19 +214,13 @@ class ConvergenceChecker:
         
         store = get_artifact_store(self.connector_name)
         
-        total_confidence = 0.0
-        total_facts = 0
-        
-        for category in categories:
-            facts = store.get_facts_by_category(category)
-            for fact in facts:
-                total_confidence += fact.confidence
-                total_facts += 1
+        totals = store.get_confidence_totals(categories).values()
+        total_facts = sum(count for count, _ in totals)
         
         if total_facts == 0:
             return 0.0
         
-        return total_confidence / total_facts
+        return sum(confidence_sum for _, confidence_sum in totals) / total_facts
     
     def record_task_result(self, new_sources: int, new_facts: int):
         """
@@ -160,22 +230,33 @@ class ConvergenceChecker:
             new_sources: Number of new sources discovered
             new_facts: Number of new facts extracted
         """
-        # Track recent new sources (rolling window)
+        _check_cache.pop(self.prefix, None)
+        
         recent_key = self._key("recent_sources")
+        task_key = self._key("task_count")
+        facts_key = self._key("total_facts")
+        
+        pipe = self.redis.pipeline(transaction=False)
+        
+        # Track recent new sources (rolling window)
         if new_sources > 0:
-            self.redis.set(recent_key, new_sources)
-            self.redis.expire(recent_key, 300)  # 5 minute window
+            pipe.set(recent_key, new_sources)
+            pipe.expire(recent_key, 300)  # 5 minute window
         else:
             # Decrement if no new sources
-            current = int(self.redis.get(recent_key) or 0)
+            current = int(self._raw.get(recent_key) or 0)
             if current > 0:
-                self.redis.decr(recent_key)
+                pipe.decr(recent_key)
         
         # Track task count
-        self.redis.incr(self._key("task_count"))
+        pipe.incr(task_key)
         
         # Track cumulative facts
-        self.redis.incrby(self._key("total_facts"), new_facts)
+        pipe.incrby(facts_key, new_facts)
+        
+        # Register the keys so reset() can drop them without scanning
+        pipe.sadd(self._key(self.KEY_REGISTRY), recent_key, task_key, facts_key)
+        pipe.execute()
     
     def get_convergence_stats(self) -> Dict:
         """
@@ -187,22 +268,23 @@ class ConvergenceChecker:
         from services.artifact_store import get_artifact_store
         
         store = get_artifact_store(self.connector_name)
+        recent_sources, task_count, _ = self._get_counters()
         
         stats = {
             "total_facts": store.get_fact_count(),
             "total_sources": store.get_source_count(),
-            "recent_sources": self._get_recent_source_count(),
-            "task_count": int(self.redis.get(self._key("task_count")) or 0),
+            "recent_sources": recent_sources,
+            "task_count": task_count,
             "facts_by_category": {},
             "confidence_by_category": {}
         }
         
-        for category in self.MIN_FACTS.keys():
-            facts = store.get_facts_by_category(category)
-            stats["facts_by_category"][category] = len(facts)
+        totals = store.get_confidence_totals(list(self.MIN_FACTS.keys()))
+        for category, (count, confidence_sum) in totals.items():
+            stats["facts_by_category"][category] = count
             
-            if facts:
-                avg_conf = sum(f.confidence for f in facts) / len(facts)
+            if count:
+                avg_conf = confidence_sum / count
                 stats["confidence_by_category"][category] = round(avg_conf, 2)
             else:
                 stats["confidence_by_category"][category] = 0.0
@@ -216,14 +298,26 @@ class ConvergenceChecker:
     
     def reset(self):
         """Reset convergence tracking for a new research session."""
+        _check_cache.pop(self.prefix, None)
+        registry = self._key(self.KEY_REGISTRY)
+        keys = self.redis.smembers(registry)
+        if keys:
+            # UNLINK frees memory off the main thread
+            self.redis.unlink(*keys, registry)
+            return
+        
+        # No registry (keys written before it existed): fall back to scanning
         pattern = f"{self.prefix}:*"
+        # Queue an UNLINK per SCAN batch and send them all at once
+        pipe = self.redis.pipeline(transaction=False)
         cursor = 0
         while True:
-            cursor, keys = self.redis.scan(cursor, match=pattern, count=100)
+            cursor, keys = self.redis.scan(cursor, match=pattern, count=500)
             if keys:
-                self.redis.delete(*keys)
+                pipe.unlink(*keys)
             if cursor == 0:
                 break
+        pipe.execute()
 
 
 def get_convergence_checker(connector_name: str) -> ConvergenceChecker:
@@ -4,16 +4,161 @@ Reviews generated research sections for quality, contradictions, and uncertainty
 """
 
 import os
+import copy
 import json
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, field
-from openai import AsyncOpenAI
+import random
+import asyncio
+import hashlib
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Set, Tuple, Union, get_args, get_origin, get_type_hints
+from dataclasses import dataclass, field, fields, is_dataclass, replace
+from openai import AsyncOpenAI, APIConnectionError, APITimeoutError
 from dotenv import load_dotenv
 
+# Try to import numpy for the similarity search over cached review embeddings
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+# Try to import orjson for faster parsing of review responses
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Try to import ijson for parsing streamed review responses incrementally
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 load_dotenv()
 
 
-@dataclass
+# Static prefix shared by every section review. It goes out ahead of any
+# per-section content so provider-side prompt caching can reuse it across
+# calls: keep dynamic values out of it, and keep it above the 1024-token
+# threshold for automatic caching. Its source priority order follows
+# UncertaintyModel.SOURCE_WEIGHTS, which ContradictionResolver resolves by.
+CRITIC_SYSTEM_PROMPT = """You are a critical reviewer of technical documentation. Your task is to:
+1. Identify factual contradictions between sources
+2. Flag claims with low confidence or uncertainty
+3. Check for missing critical information
+4. Assess engineering feasibility concerns
+5. Provide specific recommendations for improvement
+
+Be thorough but fair. Focus on:
+- Critical contradictions (auth methods, rate limits, object support)
+- Low confidence claims (< 0.5 confidence)
+- Missing essential information
+- Engineering complexity concerns
+
+**Review Tasks:**
+1. Extract all factual claims from the content
+2. Compare claims against source contexts
+3. Identify contradictions (especially for: auth methods, rate limits, object support)
+4. Flag low confidence claims (confidence < 0.5)
+5. Check for missing critical information
+6. Assess engineering feasibility concerns
+
+**Review Rubric:**
+
+Approval status:
+- APPROVED: every critical claim (authentication, rate limits, supported objects, sync
+  capabilities) is backed by at least one source context and no CRITICAL issue remains
+  unresolved. WARNING and INFO issues may still be listed.
+- NEEDS_REVISION: the section is usable but has unsupported claims, WARNING-level
+  contradictions, missing information a connector engineer would need, or claims that
+  contradict previous sections.
+- STOP_THE_LINE: the section contains a CRITICAL contradiction that would produce a
+  broken connector if implemented as written (wrong auth flow, wrong pagination model,
+  unsupported object listed as supported, rate limit off by an order of magnitude),
+  or the content does not cover the requested section at all.
+
+Confidence scoring:
+- 0.9-1.0: stated explicitly in official documentation or the Knowledge Vault and not
+  contradicted by any other source.
+- 0.7-0.9: stated in official documentation or working code, with minor gaps in detail.
+- 0.5-0.7: inferred from code samples, SDKs, or reputable third-party material only.
+- 0.3-0.5: supported only by web search results, forums, or outdated material.
+- 0.0-0.3: not supported by any provided source, or contradicted by a stronger source.
+The overall confidence_score is your confidence that the section as a whole is
+accurate. It is not an average of the claim confidences.
+
+Severity:
+- CRITICAL: would cause a connector to fail, lose data, or violate API terms.
+- WARNING: would degrade behaviour, add engineering work, or confuse users.
+- INFO: stylistic, clarifying, or nice-to-have improvements.
+
+Source priority when sources disagree (highest first): Knowledge Vault, DocWhisperer,
+official documentation found by web search, Fivetran, GitHub code, community sources,
+blog posts. Fivetran context is a signal, not ground truth, and never overrides the
+API's own documentation. Use CONFIDENCE_WEIGHTED
+resolution when confidences differ clearly, SOURCE_PRIORITY when they are close but
+the sources differ in authority, and HUMAN_REVIEW when neither settles the conflict.
+
+Missing information: for the sections that cover them, check that the content states
+the authentication method and token lifetime, the base URL and API versioning, the
+pagination model, rate limits and retry guidance, the incremental sync cursor field,
+how deletes are surfaced, and whether webhooks or change feeds exist. Report each gap
+as a MISSING_INFO issue with a recommendation naming the source most likely to answer it.
+
+Quote claims exactly as they appear in the section. Do not invent sources: use the
+context headings (Knowledge Vault, DocWhisperer, Web Search, Fivetran, GitHub) as
+source names. Return empty lists rather than omitting keys.
+
+**Output JSON Format:**
+{
+    "approval_status": "APPROVED" | "NEEDS_REVISION" | "STOP_THE_LINE",
+    "confidence_score": 0.0-1.0,
+    "contradictions": [
+        {
+            "claim": "exact claim text",
+            "category": "AUTH" | "RATE_LIMIT" | "OBJECT_SUPPORT" | "FIELD_NAME" | "OTHER",
+            "severity": "CRITICAL" | "WARNING" | "INFO",
+            "source_1": "source name",
+            "source_2": "source name",
+            "confidence_1": 0.0-1.0,
+            "confidence_2": 0.0-1.0,
+            "resolution_strategy": "CONFIDENCE_WEIGHTED" | "SOURCE_PRIORITY" | "HUMAN_REVIEW"
+        }
+    ],
+    "uncertainty_flags": [
+        {
+            "claim": "exact claim text",
+            "confidence": 0.0-1.0,
+            "source_count": number,
+            "conflicting_sources": true/false,
+            "category": "AUTH" | "RATE_LIMIT" | "OBJECT_SUPPORT" | "GENERAL",
+            "recommendation": "VERIFY" | "FLAG_IN_DOC" | "ASSUME_DEFAULT"
+        }
+    ],
+    "issues": [
+        {
+            "severity": "CRITICAL" | "WARNING" | "INFO",
+            "category": "CONTRADICTION" | "UNCERTAINTY" | "MISSING_INFO" | "ENGINEERING_COST",
+            "description": "detailed description",
+            "source_1": "source name",
+            "source_2": "source name or null",
+            "confidence_1": 0.0-1.0,
+            "confidence_2": 0.0-1.0 or null,
+            "recommendation": "specific recommendation"
+        }
+    ],
+    "recommendations": [
+        "list of specific recommendations"
+    ]
+}
+
+Output your review as structured JSON."""
+
+
+@dataclass(slots=True)
 class ReviewIssue:
     """An issue found during section review."""
     severity: str  # "CRITICAL", "WARNING", "INFO"
@@ -26,7 +171,7 @@ class ReviewIssue:
     recommendation: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Contradiction:
     """A contradiction between sources."""
     claim: str
@@ -40,7 +185,7 @@ class Contradiction:
     resolution_strategy: str  # "CONFIDENCE_WEIGHTED", "SOURCE_PRIORITY", "HUMAN_REVIEW"
 
 
-@dataclass
+@dataclass(slots=True)
 class UncertaintyFlag:
     """An uncertainty flag for a claim."""
     claim: str
@@ -52,7 +197,7 @@ class UncertaintyFlag:
     recommendation: str = "VERIFY"  # "VERIFY", "FLAG_IN_DOC", "ASSUME_DEFAULT"
 
 
-@dataclass
+@dataclass(slots=True)
 class SectionReview:
     """Review result for a section."""
     section_number: int
@@ -65,18 +210,467 @@ class SectionReview:
     recommendations: List[str] = field(default_factory=list)
 
 
+# Allowed values for the review's string fields, keyed by (dataclass, field)
+_SCHEMA_ENUMS: Dict[Tuple[str, str], List[str]] = {
+    ("ReviewIssue", "severity"): ["CRITICAL", "WARNING", "INFO"],
+    ("ReviewIssue", "category"): ["CONTRADICTION", "UNCERTAINTY", "MISSING_INFO", "ENGINEERING_COST"],
+    ("Contradiction", "category"): ["AUTH", "RATE_LIMIT", "OBJECT_SUPPORT", "FIELD_NAME", "OTHER"],
+    ("Contradiction", "severity"): ["CRITICAL", "WARNING", "INFO"],
+    ("Contradiction", "resolution_strategy"): ["CONFIDENCE_WEIGHTED", "SOURCE_PRIORITY", "HUMAN_REVIEW"],
+    ("UncertaintyFlag", "category"): ["AUTH", "RATE_LIMIT", "OBJECT_SUPPORT", "GENERAL"],
+    ("UncertaintyFlag", "recommendation"): ["VERIFY", "FLAG_IN_DOC", "ASSUME_DEFAULT"],
+    ("SectionReview", "approval_status"): ["APPROVED", "NEEDS_REVISION", "STOP_THE_LINE"],
+}
+
+# Fields filled in by the caller or derived while parsing, not asked of the model
+_SCHEMA_EXCLUDED_FIELDS = {
+    ("SectionReview", "section_number"),
+    ("SectionReview", "section_name"),
+    ("Contradiction", "confidence_delta"),
+    ("UncertaintyFlag", "documentation_age"),
+}
+
+_SCHEMA_SCALARS = {str: "string", float: "number", int: "integer", bool: "boolean"}
+
+
+def _type_schema(owner: str, name: str, tp: Any) -> Dict[str, Any]:
+    """JSON Schema for one annotated dataclass field."""
+    if get_origin(tp) is Union:
+        # Optional[X]: strict mode needs nullable types instead of optional keys
+        inner = [arg for arg in get_args(tp) if arg is not type(None)][0]
+        schema = _type_schema(owner, name, inner)
+        schema["type"] = [schema["type"], "null"]
+        if "enum" in schema:
+            schema["enum"] = schema["enum"] + [None]
+        return schema
+    if get_origin(tp) in (list, List):
+        return {"type": "array", "items": _type_schema(owner, name, get_args(tp)[0])}
+    if is_dataclass(tp):
+        return _dataclass_schema(tp)
+    schema = {"type": _SCHEMA_SCALARS[tp]}
+    if (owner, name) in _SCHEMA_ENUMS:
+        schema["enum"] = list(_SCHEMA_ENUMS[(owner, name)])
+    return schema
+
+
+def _dataclass_schema(cls: type) -> Dict[str, Any]:
+    """Strict-mode JSON Schema object for a review dataclass."""
+    hints = get_type_hints(cls)
+    properties = {
+        f.name: _type_schema(cls.__name__, f.name, hints[f.name])
+        for f in fields(cls)
+        if (cls.__name__, f.name) not in _SCHEMA_EXCLUDED_FIELDS
+    }
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(properties),
+        "additionalProperties": False,
+    }
+
+
+# Structured Outputs schema for the critic's response, generated once from the dataclasses
+CRITIC_REVIEW_SCHEMA = _dataclass_schema(SectionReview)
+
+
+def _load_review_json(content: str) -> Dict[str, Any]:
+    """Parse the model's review JSON."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content.encode())
+    return json.loads(content)
+
+
+def _review_cache_storage():
+    """Database storage backing the review caches, or None without a database."""
+    try:
+        from services.database import get_database_storage
+    except ImportError:
+        return None
+    return get_database_storage()
+
+
+class SemanticReviewCache:
+    """
+    Embedding-keyed cache of critic review responses.
+    
+    A section whose name, content and sources embed within
+    SIMILARITY_THRESHOLD (cosine) of an earlier review reuses that review's
+    response instead of a new chat completion. Only a prefix of the content
+    and sources is embedded, so reuse also requires an exact match on
+    everything the embedding leaves out (see guard_hash). Entries live in
+    memory with LRU eviction; entries that keep getting hit are written to
+    the review_cache table so a restart starts warm.
+    """
+    
+    # Minimum cosine similarity for a cached review to be reused
+    SIMILARITY_THRESHOLD = 0.87
+    
+    # In-memory capacity; the least recently used entry is evicted beyond this
+    MAX_ENTRIES = 10000
+    
+    # Initial rows of the vector matrix; doubled as entries are added
+    INITIAL_SLOTS = 64
+    
+    # Persist an entry every this many hits
+    PERSIST_EVERY_HITS = 100
+    
+    # Characters of the content / of each source that go into the embedded key
+    KEY_CONTENT_CHARS = 4000
+    KEY_SOURCE_CHARS = 500
+    
+    SOURCE_NAMES = ("vault", "docwhisperer", "web", "fivetran", "github")
+    
+    # Hex characters of the guard hash; cache keys are guard + key text hash
+    GUARD_CHARS = 32
+    
+    def __init__(self, client: AsyncOpenAI, embedding_model: str):
+        """
+        Initialize an empty cache; persisted entries are loaded on first use.
+        
+        Args:
+            client: OpenAI client used for embeddings
+            embedding_model: Embedding model name
+        """
+        self.client = client
+        self.embedding_model = embedding_model
+        # cache_key -> {"vector", "review_data", "hits", "slot"}; order is LRU order
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # Row i of _vectors holds the vector of the entry keyed _slot_keys[i] (numpy only)
+        self._vectors = None
+        self._slot_keys: List[Optional[str]] = []
+        self._slot_count = 0
+        self._free_slots: List[int] = []
+        # guard hash -> cache keys of the entries sharing it
+        self._guard_keys: Dict[str, Set[str]] = {}
+        self._loaded = False
+        self._load_task: Optional[asyncio.Future] = None
+    
+    @classmethod
+    def key_text(cls, section_name: str, content: str, sources: Dict[str, Any]) -> str:
+        """Text embedded for a review: section name, content and truncated sources."""
+        parts = [section_name, content[:cls.KEY_CONTENT_CHARS]]
+        for name in cls.SOURCE_NAMES:
+            if sources.get(name):
+                parts.append(f"{name}: {sources[name][:cls.KEY_SOURCE_CHARS]}")
+        return "\n".join(parts)
+    
+    @classmethod
+    def guard_hash(
+        cls,
+        content: str,
+        sources: Dict[str, Any],
+        previous_sections: List[str]
+    ) -> str:
+        """
+        Hash of everything key_text() leaves out of the embedding.
+        
+        Covers the content past KEY_CONTENT_CHARS, each source past
+        KEY_SOURCE_CHARS, and the previous sections, so an edit the embedding
+        can't see never reuses an earlier review.
+        """
+        digest = hashlib.sha256()
+        parts = [content[cls.KEY_CONTENT_CHARS:]]
+        for name in cls.SOURCE_NAMES:
+            source = sources.get(name)
+            parts.append(source[cls.KEY_SOURCE_CHARS:] if isinstance(source, str) else "")
+        parts.extend(previous_sections)
+        for part in parts:
+            # Length-prefixed so part boundaries can't shift between inputs
+            encoded = part.encode()
+            digest.update(f"{len(encoded)}:".encode())
+            digest.update(encoded)
+        return digest.hexdigest()[:cls.GUARD_CHARS]
+    
+    def has_candidates(self, guard: str) -> bool:
+        """Whether any cached entry shares this guard hash (otherwise lookup() can't hit)."""
+        return bool(self._guard_keys.get(guard))
+    
+    async def load(self):
+        """
+        Warm the cache from the review_cache table, once.
+        
+        Concurrent callers wait on the same load.
+        """
+        if self._loaded:
+            return
+        if self._load_task is None:
+            self._load_task = asyncio.ensure_future(self._load_persisted())
+        await self._load_task
+    
+    async def embed(self, key_text: str) -> Optional[List[float]]:
+        """Normalized embedding of key_text, or None if the request failed."""
+        try:
+            response = await self.client.embeddings.create(
+                model=self.embedding_model,
+                input=key_text
+            )
+        except Exception as e:
+            print(f"⚠ Review cache embedding failed: {e}")
+            return None
+        return self._normalize(response.data[0].embedding)
+    
+    async def lookup(self, key_text: str, guard: str) -> Tuple[Optional[Dict[str, Any]], Optional[List[float]]]:
+        """
+        Find a cached review for key_text among entries sharing guard.
+        
+        Args:
+            key_text: Text from key_text()
+            guard: Hash from guard_hash()
+            
+        Returns:
+            Tuple of (cached review JSON or None, normalized embedding or None
+            if embedding failed); pass the embedding back to store() on a miss
+        """
+        await self.load()
+        vector = await self.embed(key_text)
+        if vector is None:
+            return None, None
+        
+        cache_key, similarity = self._nearest(vector, guard)
+        if cache_key is None or similarity < self.SIMILARITY_THRESHOLD:
+            return None, vector
+        
+        entry = self._entries[cache_key]
+        self._entries.move_to_end(cache_key)
+        entry["hits"] += 1
+        if entry["hits"] % self.PERSIST_EVERY_HITS == 0:
+            # Off the event loop, like the exact cache's database calls
+            await asyncio.to_thread(self._persist, cache_key, dict(entry))
+        
+        return entry["review_data"], vector
+    
+    def store(self, key_text: str, guard: str, vector: Optional[List[float]], review_data: Dict[str, Any]):
+        """
+        Cache a fresh review response.
+        
+        STOP_THE_LINE reviews are never cached, so a blocking verdict is
+        always re-checked rather than propagated to similar sections.
+        
+        Args:
+            key_text: Text from key_text()
+            guard: Hash from guard_hash()
+            vector: Embedding from lookup() or embed()
+            review_data: Parsed review JSON
+        """
+        if vector is None or review_data.get("approval_status") == "STOP_THE_LINE":
+            return
+        
+        # The guard is recoverable from the key, so persisted entries keep it
+        cache_key = guard + hashlib.sha256(key_text.encode()).hexdigest()[:64 - self.GUARD_CHARS]
+        self._add(cache_key, vector, review_data, hits=0)
+    
+    def _add(self, cache_key: str, vector: List[float], review_data: Dict[str, Any], hits: int):
+        """Insert or replace an entry, evicting the least recently used at capacity."""
+        old = self._entries.pop(cache_key, None)
+        if old is not None:
+            self._forget(cache_key, old)
+        while len(self._entries) >= self.MAX_ENTRIES:
+            evicted_key, evicted = self._entries.popitem(last=False)
+            self._forget(evicted_key, evicted)
+        
+        entry = {"vector": vector, "review_data": review_data, "hits": hits, "slot": None}
+        if NUMPY_AVAILABLE:
+            if self._vectors is None:
+                self._vectors = np.zeros((self.INITIAL_SLOTS, len(vector)), dtype=np.float32)
+            if len(vector) != self._vectors.shape[1]:
+                return  # Embedding model changed; skip stale dimensions
+            if self._free_slots:
+                slot = self._free_slots.pop()
+                self._slot_keys[slot] = cache_key
+            else:
+                slot = self._slot_count
+                if slot == len(self._vectors):
+                    self._grow_vectors()
+                self._slot_count += 1
+                self._slot_keys.append(cache_key)
+            self._vectors[slot] = vector
+            entry["slot"] = slot
+        
+        self._entries[cache_key] = entry
+        self._guard_keys.setdefault(cache_key[:self.GUARD_CHARS], set()).add(cache_key)
+    
+    def _grow_vectors(self):
+        """Double the vector matrix's rows, up to MAX_ENTRIES."""
+        rows = min(len(self._vectors) * 2, self.MAX_ENTRIES)
+        vectors = np.zeros((rows, self._vectors.shape[1]), dtype=np.float32)
+        vectors[:len(self._vectors)] = self._vectors
+        self._vectors = vectors
+    
+    def _forget(self, cache_key: str, entry: Dict[str, Any]):
+        """Drop a removed entry from the guard index and release its matrix row."""
+        guard = cache_key[:self.GUARD_CHARS]
+        keys = self._guard_keys.get(guard)
+        if keys is not None:
+            keys.discard(cache_key)
+            if not keys:
+                del self._guard_keys[guard]
+        self._release_slot(entry)
+    
+    def _release_slot(self, entry: Dict[str, Any]):
+        """Zero an entry's matrix row so it can never match, and recycle it."""
+        slot = entry["slot"]
+        if slot is not None:
+            self._vectors[slot] = 0.0
+            self._slot_keys[slot] = None
+            self._free_slots.append(slot)
+    
+    def _nearest(self, vector: List[float], guard: str) -> Tuple[Optional[str], float]:
+        """Most similar cached entry sharing guard, and its cosine similarity."""
+        cache_keys = list(self._guard_keys.get(guard, ()))
+        if not cache_keys:
+            return None, 0.0
+        
+        if NUMPY_AVAILABLE:
+            if len(vector) != self._vectors.shape[1]:
+                return None, 0.0
+            slots = [self._entries[key]["slot"] for key in cache_keys]
+            similarities = self._vectors[slots] @ np.asarray(vector, dtype=np.float32)
+            best = int(np.argmax(similarities))
+            return cache_keys[best], float(similarities[best])
+        
+        best_key, best_similarity = None, 0.0
+        for cache_key in cache_keys:
+            similarity = sum(a * b for a, b in zip(self._entries[cache_key]["vector"], vector))
+            if similarity > best_similarity:
+                best_key, best_similarity = cache_key, similarity
+        return best_key, best_similarity
+    
+    @staticmethod
+    def _normalize(vector: List[float]) -> List[float]:
+        """Scale to unit length so a dot product is the cosine similarity."""
+        norm = sum(v * v for v in vector) ** 0.5
+        return [v / norm for v in vector] if norm else list(vector)
+    
+    def _persist(self, cache_key: str, entry: Dict[str, Any]):
+        """Write a frequently hit entry to the review_cache table."""
+        storage = _review_cache_storage()
+        if storage:
+            storage.save_review_cache_entry(cache_key, entry["vector"], entry["review_data"], entry["hits"])
+    
+    async def _load_persisted(self):
+        """Add persisted entries to the cache, most-hit entries most recently used."""
+        storage = _review_cache_storage()
+        # Off the event loop, like the exact cache's database calls
+        rows = await asyncio.to_thread(storage.load_review_cache_entries, self.MAX_ENTRIES) if storage else []
+        # Insert least-hit first so the most-hit entries end up most recently used
+        for row in reversed(rows):
+            self._add(row["cache_key"], row["embedding"], row["review_data"], row["hits"])
+        self._loaded = True
+        if rows:
+            print(f"✓ Loaded {len(self._entries)} cached critic reviews")
+
+
 class CriticAgent:
     """Agent that reviews generated research sections for quality and accuracy."""
     
+    # Capacity of the in-memory exact prompt cache (LRU)
+    EXACT_CACHE_SIZE = 4096
+    # Characters of each source context included in the review prompt
+    SOURCE_CONTEXT_CHARS = 2000
+    # Review prompt source blocks, in prompt order: (sources key, heading)
+    SOURCE_HEADINGS = (
+        ("vault", "\n**Knowledge Vault Context:**\n"),
+        ("docwhisperer", "\n**DocWhisperer Context:**\n"),
+        ("web", "\n**Web Search Context:**\n"),
+        ("fivetran", "\n**Fivetran Context (Reference Only):**\n"),
+        ("github", "\n**GitHub Code Context:**\n"),
+    )
+    # Distinct source blocks memoized by digest (one per research context in practice)
+    SOURCE_BLOCK_CACHE_SIZE = 64
+    # Batch reviews: attempts per section and base delay (seconds) for backoff
+    MAX_REVIEW_ATTEMPTS = 4
+    RETRY_BASE_DELAY = 1.0
+    
     def __init__(self):
         """Initialize the Critic Agent."""
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
-        self.model = os.getenv("RESEARCH_MODEL", "gpt-5-mini-2025-08-07")
+        # Two-tier review: a cheap model first, the research model for risky reviews
+        self.model = os.getenv("CRITIC_MODEL", "gpt-4o-mini")
+        self.escalation_model = os.getenv(
+            "CRITIC_ESCALATION_MODEL",
+            os.getenv("RESEARCH_MODEL", "gpt-5-mini-2025-08-07")
+        )
+        self.escalation_confidence = float(os.getenv("CRITIC_ESCALATION_CONFIDENCE", "0.6"))
         
         if not self.openai_api_key:
             raise ValueError("OPENAI_API_KEY is required")
         
         self.client = AsyncOpenAI(api_key=self.openai_api_key)
+        # sha256(models + review prompt) -> SectionReview, for byte-identical retries
+        self._exact_cache: "OrderedDict[str, SectionReview]" = OrderedDict()
+        self.review_cache = SemanticReviewCache(
+            self.client,
+            os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
+        )
+        # Caps in-flight reviews so a wide DAG level stays within provider RPM/TPM
+        self._sem = asyncio.Semaphore(int(os.getenv("CRITIC_MAX_CONCURRENCY", "10")))
+        # Source digests (per heading) -> formatted source block
+        self._source_blocks: Dict[Tuple[Optional[str], ...], str] = {}
+    
+    async def review_sections_batch(
+        self,
+        nodes: List[Any],
+        sources: Dict[str, Any],
+        previous_sections: Optional[List[str]] = None,
+        source_digests: Optional[Dict[str, str]] = None
+    ) -> List[Optional[SectionReview]]:
+        """
+        Review several sections concurrently.
+        
+        Args:
+            nodes: SectionNodes (from the DAG) whose generated_content should be reviewed
+            sources: Dictionary of source contexts shared by all sections
+            previous_sections: List of previous section contents for consistency checking
+            source_digests: Optional per-source content hashes (ResearchContext.source_digests)
+            
+        Returns:
+            One SectionReview per node, in order; None where the node has no content
+            or the review failed after retries
+        """
+        return await asyncio.gather(*(
+            self._review_with_semaphore(node, sources, previous_sections, source_digests)
+            for node in nodes
+        ))
+    
+    async def _review_with_semaphore(
+        self,
+        node: Any,
+        sources: Dict[str, Any],
+        previous_sections: Optional[List[str]],
+        source_digests: Optional[Dict[str, str]] = None
+    ) -> Optional[SectionReview]:
+        """Review one node under the concurrency cap, retrying transient API errors."""
+        if not node.generated_content:
+            return None
+        
+        section = node.section
+        async with self._sem:
+            for attempt in range(self.MAX_REVIEW_ATTEMPTS):
+                try:
+                    return await self.review_section(
+                        section_number=section.number,
+                        section_name=section.name,
+                        content=node.generated_content,
+                        sources=sources,
+                        previous_sections=previous_sections,
+                        source_digests=source_digests
+                    )
+                except Exception as e:
+                    if not self._is_retryable(e) or attempt == self.MAX_REVIEW_ATTEMPTS - 1:
+                        print(f"  ⚠ Critic review failed for section {section.number}: {e}")
+                        return None
+                    # Full jitter so throttled reviews don't retry in lockstep
+                    delay = random.uniform(0, self.RETRY_BASE_DELAY * (2 ** attempt))
+                    print(f"  ⚠ Critic review for section {section.number} throttled, retrying in {delay:.1f}s")
+                    await asyncio.sleep(delay)
+    
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """Rate limits (429), server errors (5xx) and connection failures are retryable."""
+        if isinstance(error, (APIConnectionError, APITimeoutError)):
+            return True
+        status_code = getattr(error, "status_code", None)
+        return status_code == 429 or (status_code is not None and status_code >= 500)
     
     async def review_section(
         self,
@@ -84,7 +678,8 @@ class CriticAgent:
         section_name: str,
         content: str,
         sources: Dict[str, Any],
-        previous_sections: Optional[List[str]] = None
+        previous_sections: Optional[List[str]] = None,
+        source_digests: Optional[Dict[str, str]] = None
     ) -> SectionReview:
         """
         Review a generated section for quality, contradictions, and uncertainty.
@@ -95,6 +690,8 @@ class CriticAgent:
             content: Generated section content
             sources: Dictionary of source contexts (vault, docwhisperer, web, fivetran, github)
             previous_sections: List of previous section contents for consistency checking
+            source_digests: Optional hashes of the sources; reviews sharing them
+                reuse one formatted source block
             
         Returns:
             SectionReview with approval status and issues
@@ -106,50 +703,181 @@ class CriticAgent:
             section_name=section_name,
             content=content,
             sources=sources,
-            previous_sections=previous_sections or []
+            previous_sections=previous_sections or [],
+            source_digests=source_digests
+        )
+        
+        # Byte-identical prompt (retries, DAG re-runs): no network calls at all
+        prompt_sha256 = hashlib.sha256(
+            f"{self.model}\n{self.escalation_model}\n{CRITIC_SYSTEM_PROMPT}\n{review_prompt}".encode()
+        ).hexdigest()
+        exact_review = await self._get_exact_review(prompt_sha256, section_number, section_name)
+        if exact_review is not None:
+            return exact_review
+        
+        # Reuse the review of a near-identical section if one is cached
+        cache_text = SemanticReviewCache.key_text(section_name, content, sources)
+        cache_guard = SemanticReviewCache.guard_hash(content, sources, previous_sections or [])
+        await self.review_cache.load()
+        if self.review_cache.has_candidates(cache_guard):
+            cached_review, cache_vector = await self.review_cache.lookup(cache_text, cache_guard)
+            if cached_review is not None:
+                return self._parse_review_response(
+                    section_number=section_number,
+                    section_name=section_name,
+                    review_data=cached_review
+                )
+            review_data = await self._dispatch(review_prompt)
+        else:
+            # Nothing can match: embed (for store) alongside the review, not before it
+            cache_vector, review_data = await asyncio.gather(
+                self.review_cache.embed(cache_text),
+                self._dispatch(review_prompt)
+            )
+        self.review_cache.store(cache_text, cache_guard, cache_vector, review_data)
+        
+        # Build SectionReview from response
+        review = self._parse_review_response(
+            section_number=section_number,
+            section_name=section_name,
+            review_data=review_data
+        )
+        await self._put_exact_review(prompt_sha256, review, review_data)
+        
+        return review
+    
+    async def _dispatch(self, review_prompt: str) -> Dict[str, Any]:
+        """
+        Run the review on the first-tier model, escalating risky results.
+        
+        A review is re-run on the escalation model when the first pass is
+        unsure (confidence below CRITIC_ESCALATION_CONFIDENCE) or wants to
+        stop the line, so only those reviews pay for the larger model.
+        
+        Args:
+            review_prompt: Per-section review prompt
+            
+        Returns:
+            Parsed review JSON
+        """
+        review_data = await self._request_review(self.model, review_prompt)
+        if self.escalation_model == self.model:
+            return review_data
+        
+        risky = (
+            review_data.get("confidence_score", 1.0) < self.escalation_confidence
+            or review_data.get("approval_status") == "STOP_THE_LINE"
         )
+        if risky:
+            print(f"  ℹ️ Escalating critic review to {self.escalation_model} "
+                  f"({review_data.get('approval_status')}, confidence {review_data.get('confidence_score')})")
+            review_data = await self._request_review(self.escalation_model, review_prompt)
+        return review_data
+    
+    async def _request_review(self, model: str, review_prompt: str) -> Dict[str, Any]:
+        """
+        Request one structured review from the given model.
         
-        # Call LLM for review
-        response = await self.client.chat.completions.create(
-            model=self.model,
+        The response is streamed. With ijson, each chunk is fed to an
+        incremental parser as it arrives, so the review JSON is built while
+        tokens are still being generated; otherwise chunks are joined and
+        parsed at the end.
+        """
+        stream = await self.client.chat.completions.create(
+            model=model,
             messages=[
                 {
                     "role": "system",
-                    "content": """You are a critical reviewer of technical documentation. Your task is to:
-1. Identify factual contradictions between sources
-2. Flag claims with low confidence or uncertainty
-3. Check for missing critical information
-4. Assess engineering feasibility concerns
-5. Provide specific recommendations for improvement
-
-Be thorough but fair. Focus on:
-- Critical contradictions (auth methods, rate limits, object support)
-- Low confidence claims (< 0.5 confidence)
-- Missing essential information
-- Engineering complexity concerns
-
-Output your review as structured JSON."""
+                    "content": CRITIC_SYSTEM_PROMPT
                 },
                 {
                     "role": "user",
                     "content": review_prompt
                 }
             ],
-            response_format={"type": "json_object"},
-            temperature=0.3
+            response_format={
+                "type": "json_schema",
+                "json_schema": {
+                    "name": "SectionReview",
+                    "schema": CRITIC_REVIEW_SCHEMA,
+                    "strict": True
+                }
+            },
+            temperature=0.3,
+            stream=True
         )
         
-        # Parse review response
-        review_data = json.loads(response.choices[0].message.content)
+        if IJSON_AVAILABLE:
+            results = ijson.sendable_list()
+            parser = ijson.items_coro(results, "", use_float=True)
+            received = False
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parser.send(chunk.choices[0].delta.content.encode())
+                    received = True
+            if received:
+                parser.close()
+            if not results:
+                # No content (refusal, content filter): fail like the fallback's parse
+                return _load_review_json("")
+            return results[0]
         
-        # Build SectionReview from response
-        review = self._parse_review_response(
-            section_number=section_number,
-            section_name=section_name,
-            review_data=review_data
-        )
+        parts = []
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
+        return _load_review_json("".join(parts))
+    
+    async def _get_exact_review(
+        self,
+        prompt_sha256: str,
+        section_number: int,
+        section_name: str
+    ) -> Optional[SectionReview]:
+        """
+        Look up a review by prompt hash, in memory first, then in the database.
         
-        return review
+        The database read runs in a worker thread so concurrent batch reviews
+        don't stall the event loop.
+        
+        Returns:
+            A copy of the cached SectionReview, or None on a miss
+        """
+        review = self._exact_cache.get(prompt_sha256)
+        if review is not None:
+            self._exact_cache.move_to_end(prompt_sha256)
+        else:
+            storage = _review_cache_storage()
+            review_data = await asyncio.to_thread(storage.get_exact_review, prompt_sha256) if storage else None
+            if review_data is None:
+                return None
+            review = self._parse_review_response(
+                section_number=section_number,
+                section_name=section_name,
+                review_data=review_data
+            )
+            self._remember_exact_review(prompt_sha256, review)
+        
+        return replace(copy.deepcopy(review), section_number=section_number, section_name=section_name)
+    
+    async def _put_exact_review(self, prompt_sha256: str, review: SectionReview, review_data: Dict[str, Any]):
+        """Cache a fresh review by prompt hash; STOP_THE_LINE verdicts are always re-run.
+        
+        The database write runs in a worker thread, like the read in _get_exact_review.
+        """
+        if review.approval_status == "STOP_THE_LINE":
+            return
+        self._remember_exact_review(prompt_sha256, copy.deepcopy(review))
+        storage = _review_cache_storage()
+        if storage:
+            await asyncio.to_thread(storage.save_exact_review, prompt_sha256, review_data)
+    
+    def _remember_exact_review(self, prompt_sha256: str, review: SectionReview):
+        """Insert into the in-memory exact cache, evicting the least recently used."""
+        self._exact_cache[prompt_sha256] = review
+        self._exact_cache.move_to_end(prompt_sha256)
+        while len(self._exact_cache) > self.EXACT_CACHE_SIZE:
+            self._exact_cache.popitem(last=False)
     
     def _build_review_prompt(
         self,
@@ -157,90 +885,53 @@ Output your review as structured JSON."""
         section_name: str,
         content: str,
         sources: Dict[str, Any],
-        previous_sections: List[str]
+        previous_sections: List[str],
+        source_digests: Optional[Dict[str, str]] = None
     ) -> str:
-        """Build the review prompt."""
-        
-        sources_text = ""
-        if sources.get("vault"):
-            sources_text += f"\n**Knowledge Vault Context:**\n{sources['vault'][:2000]}...\n"
-        if sources.get("docwhisperer"):
-            sources_text += f"\n**DocWhisperer Context:**\n{sources['docwhisperer'][:2000]}...\n"
-        if sources.get("web"):
-            sources_text += f"\n**Web Search Context:**\n{sources['web'][:2000]}...\n"
-        if sources.get("fivetran"):
-            sources_text += f"\n**Fivetran Context (Reference Only):**\n{sources['fivetran'][:2000]}...\n"
-        if sources.get("github"):
-            sources_text += f"\n**GitHub Code Context:**\n{sources['github'][:2000]}...\n"
-        
-        previous_context = ""
+        """Build the review prompt.
+        
+        The static instructions live in CRITIC_SYSTEM_PROMPT; this is only the
+        per-section part, assembled in one join rather than by repeated concatenation.
+        Source contexts come first: they are shared by every section of a run, so
+        system prompt + sources form a common prefix for provider prompt caching.
+        """
+        parts = [
+            self._source_context_block(sources, source_digests),
+            f"\n\nReview Section {section_number}: {section_name}\n\n**Generated Content:**\n",
+            content,
+            "\n\n"
+        ]
         if previous_sections:
-            previous_context = "\n\n**Previous Sections (for consistency):**\n"
+            parts.append("\n\n**Previous Sections (for consistency):**\n")
             for i, prev_content in enumerate(previous_sections[-3:], 1):  # Last 3 sections
-                previous_context += f"\n--- Previous Section {i} ---\n{prev_content[:1000]}...\n"
+                parts += (f"\n--- Previous Section {i} ---\n", prev_content[:1000], "...\n")
         
-        prompt = f"""Review Section {section_number}: {section_name}
-
-**Generated Content:**
-{content}
-
-**Source Contexts:**
-{sources_text}
-
-{previous_context}
-
-**Review Tasks:**
-1. Extract all factual claims from the content
-2. Compare claims against source contexts
-3. Identify contradictions (especially for: auth methods, rate limits, object support)
-4. Flag low confidence claims (confidence < 0.5)
-5. Check for missing critical information
-6. Assess engineering feasibility concerns
-
-**Output JSON Format:**
-{{
-    "approval_status": "APPROVED" | "NEEDS_REVISION" | "STOP_THE_LINE",
-    "confidence_score": 0.0-1.0,
-    "contradictions": [
-        {{
-            "claim": "exact claim text",
-            "category": "AUTH" | "RATE_LIMIT" | "OBJECT_SUPPORT" | "FIELD_NAME" | "OTHER",
-            "severity": "CRITICAL" | "WARNING" | "INFO",
-            "source_1": "source name",
-            "source_2": "source name",
-            "confidence_1": 0.0-1.0,
-            "confidence_2": 0.0-1.0,
-            "resolution_strategy": "CONFIDENCE_WEIGHTED" | "SOURCE_PRIORITY" | "HUMAN_REVIEW"
-        }}
-    ],
-    "uncertainty_flags": [
-        {{
-            "claim": "exact claim text",
-            "confidence": 0.0-1.0,
-            "source_count": number,
-            "conflicting_sources": true/false,
-            "category": "AUTH" | "RATE_LIMIT" | "OBJECT_SUPPORT" | "GENERAL",
-            "recommendation": "VERIFY" | "FLAG_IN_DOC" | "ASSUME_DEFAULT"
-        }}
-    ],
-    "issues": [
-        {{
-            "severity": "CRITICAL" | "WARNING" | "INFO",
-            "category": "CONTRADICTION" | "UNCERTAINTY" | "MISSING_INFO" | "ENGINEERING_COST",
-            "description": "detailed description",
-            "source_1": "source name",
-            "source_2": "source name or null",
-            "confidence_1": 0.0-1.0,
-            "confidence_2": 0.0-1.0 or null,
-            "recommendation": "specific recommendation"
-        }}
-    ],
-    "recommendations": [
-        "list of specific recommendations"
-    ]
-}}"""
+        return "".join(parts)
+    
+    def _source_context_block(
+        self,
+        sources: Dict[str, Any],
+        source_digests: Optional[Dict[str, str]] = None
+    ) -> str:
+        """Format the source contexts, once per distinct set of source digests."""
+        key = None
+        if source_digests:
+            key = tuple(source_digests.get(name) for name, _ in self.SOURCE_HEADINGS)
+            block = self._source_blocks.get(key)
+            if block is not None:
+                return block
+        
+        parts = ["**Source Contexts:**\n"]
+        for name, heading in self.SOURCE_HEADINGS:
+            if sources.get(name):
+                parts += (heading, sources[name][:self.SOURCE_CONTEXT_CHARS], "...\n")
+        block = "".join(parts)
         
-        return prompt
+        if key is not None:
+            if len(self._source_blocks) >= self.SOURCE_BLOCK_CACHE_SIZE:
+                self._source_blocks.clear()
+            self._source_blocks[key] = block
+        return block
     
     def _parse_review_response(
         self,
@@ -251,9 +942,8 @@ Output your review as structured JSON."""
         """Parse LLM review response into SectionReview."""
         
         # Parse contradictions
-        contradictions = []
-        for c in review_data.get("contradictions", []):
-            contradictions.append(Contradiction(
+        contradictions = [
+            Contradiction(
                 claim=c.get("claim", ""),
                 category=c.get("category", "OTHER"),
                 severity=c.get("severity", "INFO"),
@@ -263,24 +953,26 @@ Output your review as structured JSON."""
                 confidence_2=c.get("confidence_2", 0.0),
                 confidence_delta=abs(c.get("confidence_1", 0.0) - c.get("confidence_2", 0.0)),
                 resolution_strategy=c.get("resolution_strategy", "CONFIDENCE_WEIGHTED")
-            ))
+            )
+            for c in review_data.get("contradictions", [])
+        ]
         
         # Parse uncertainty flags
-        uncertainty_flags = []
-        for u in review_data.get("uncertainty_flags", []):
-            uncertainty_flags.append(UncertaintyFlag(
+        uncertainty_flags = [
+            UncertaintyFlag(
                 claim=u.get("claim", ""),
                 confidence=u.get("confidence", 0.0),
                 source_count=u.get("source_count", 0),
                 conflicting_sources=u.get("conflicting_sources", False),
                 category=u.get("category", "GENERAL"),
                 recommendation=u.get("recommendation", "VERIFY")
-            ))
+            )
+            for u in review_data.get("uncertainty_flags", [])
+        ]
         
         # Parse issues
-        issues = []
-        for i in review_data.get("issues", []):
-            issues.append(ReviewIssue(
+        issues = [
+            ReviewIssue(
                 severity=i.get("severity", "INFO"),
                 category=i.get("category", "GENERAL"),
                 description=i.get("description", ""),
@@ -289,7 +981,9 @@ Output your review as structured JSON."""
                 confidence_1=i.get("confidence_1", 0.0),
                 confidence_2=i.get("confidence_2"),
                 recommendation=i.get("recommendation", "")
-            ))
+            )
+            for i in review_data.get("issues", [])
+        ]
         
         return SectionReview(
             section_number=section_number,
@@ -3,23 +3,41 @@ DAG Orchestrator Service
 Manages section-level parallelism and agent coordination for research generation.
 """
 
-from typing import List, Dict, Any, Optional
+import hashlib
+from collections import defaultdict
+from enum import IntEnum
+from typing import List, Dict, Any, Optional, Union
 from dataclasses import dataclass, field
 from .research_agent import ResearchSection
+from .critic_agent import CriticAgent
 
 
-@dataclass
+class SectionStatus(IntEnum):
+    """Status of a section in the DAG.
+    
+    Integer-valued and ordered so terminal states compare >= APPROVED.
+    Use .name when a status has to leave the DAG (logs, API responses).
+    """
+    PENDING = 0
+    RUNNING = 1
+    REVIEWING = 2
+    APPROVED = 3
+    BLOCKED = 4
+
+
+@dataclass(slots=True)
 class SectionNode:
     """Node in the research DAG representing a section."""
     section: ResearchSection
     dependencies: List[int]  # Section numbers that must complete first
-    status: str = "PENDING"  # "PENDING", "RUNNING", "REVIEWING", "APPROVED", "BLOCKED"
+    status: SectionStatus = SectionStatus.PENDING
     generated_content: Optional[str] = None
     review: Optional[Any] = None
     stop_the_line: Optional[Any] = None
+    remaining_deps: int = 0  # Dependencies present in the DAG and not yet approved
 
 
-@dataclass
+@dataclass(slots=True)
 class ResearchContext:
     """Context for research generation."""
     connector_id: str
@@ -31,6 +49,42 @@ class ResearchContext:
     structured_context: Optional[Dict[str, Any]] = None
     completed_sections: List[str] = field(default_factory=list)
     sources: Dict[str, Any] = field(default_factory=dict)
+    # Derived from sources on demand; see _refresh_sources
+    _sources_seen: Optional[Dict[str, Any]] = field(init=False, default=None, repr=False, compare=False)
+    _truncated_sources: Dict[str, Any] = field(init=False, default_factory=dict, repr=False, compare=False)
+    _source_digests: Dict[str, str] = field(init=False, default_factory=dict, repr=False, compare=False)
+    
+    @property
+    def truncated_sources(self) -> Dict[str, Any]:
+        """Sources cut to what the critic prompt uses, so each review's slice is a no-op."""
+        self._refresh_sources()
+        return self._truncated_sources
+    
+    @property
+    def source_digests(self) -> Dict[str, str]:
+        """Hashes of the truncated sources, so the critic can reuse one source block per context."""
+        self._refresh_sources()
+        return self._source_digests
+    
+    def _refresh_sources(self):
+        """Recompute the truncated sources and digests if sources changed since last time.
+        
+        sources is public and often filled in after construction, so the
+        derived values are checked against a shallow copy on each read.
+        Unchanged values compare by identity, so the check is cheap.
+        """
+        if self._sources_seen is not None and self._sources_seen == self.sources:
+            return
+        self._truncated_sources = {
+            k: v[:CriticAgent.SOURCE_CONTEXT_CHARS] if isinstance(v, str) else v
+            for k, v in self.sources.items()
+        }
+        self._source_digests = {
+            k: hashlib.blake2b(v.encode(), digest_size=8).hexdigest()
+            for k, v in self._truncated_sources.items()
+            if isinstance(v, str)
+        }
+        self._sources_seen = dict(self.sources)
 
 
 class ResearchDAG:
@@ -41,6 +95,9 @@ class ResearchDAG:
         self.nodes: Dict[int, SectionNode] = {}
         self.edges: List[tuple] = []  # (from_section, to_section)
         self.execution_levels: List[List[int]] = []  # Levels for parallel execution
+        self._dependents: Dict[int, List[int]] = defaultdict(list)  # Adjacency list of self.edges
+        self._ready: Dict[int, SectionNode] = {}  # PENDING nodes whose dependencies are all approved
+        self._positions: Dict[int, int] = {}  # Section number -> insertion order in self.nodes
     
     def add_section(self, section: ResearchSection, dependencies: List[int]):
         """
@@ -54,17 +111,33 @@ class ResearchDAG:
             section=section,
             dependencies=dependencies
         )
+        previous = self.nodes.get(section.number)
         self.nodes[section.number] = node
+        self._positions.setdefault(section.number, len(self._positions))
+        self._ready.pop(section.number, None)
         
         # Add edges
         for dep in dependencies:
             self.edges.append((dep, section.number))
+            self._dependents[dep].append(section.number)
+        
+        # Dependencies not in the DAG (yet) don't block, matching the readiness check
+        node.remaining_deps = sum(
+            1 for dep in set(dependencies)
+            if dep in self.nodes and self.nodes[dep].status != SectionStatus.APPROVED
+        )
+        self._update_ready(node)
+        
+        # Sections already waiting on this one now have an unapproved dependency
+        if previous is None or previous.status == SectionStatus.APPROVED:
+            self._adjust_dependents(section.number, 1)
     
     def calculate_execution_levels(self):
         """
         Calculate which sections can run in parallel.
         
-        Uses topological sort to determine execution order.
+        Uses Kahn's topological sort over the dependents adjacency list,
+        so each edge is visited once.
         """
         self.execution_levels = []
         
@@ -83,11 +156,10 @@ class ResearchDAG:
             # Process current level
             for node_num in current_level:
                 # Find nodes that depend on this one
-                for from_node, to_node in self.edges:
-                    if from_node == node_num:
-                        in_degree[to_node] -= 1
-                        if in_degree[to_node] == 0:
-                            next_level.append(to_node)
+                for to_node in self._dependents.get(node_num, ()):
+                    in_degree[to_node] -= 1
+                    if in_degree[to_node] == 0:
+                        next_level.append(to_node)
             
             current_level = next_level
     
@@ -99,20 +171,63 @@ class ResearchDAG:
         section_nums = self.execution_levels[level_index]
         return [self.nodes[num] for num in section_nums]
     
+    async def execute_level_parallel(
+        self,
+        level_index: int,
+        critic_agent: Any,
+        context: ResearchContext
+    ) -> List[Optional[Any]]:
+        """
+        Review every section in an execution level concurrently.
+        
+        Sections in the same level have no dependencies on each other, so their
+        reviews are dispatched together (bounded by the critic's concurrency cap).
+        
+        Args:
+            level_index: Index into execution_levels
+            critic_agent: CriticAgent used for the reviews
+            context: Research context providing sources and completed sections
+            
+        Returns:
+            Reviews in level order (None for sections without content or failed reviews)
+        """
+        nodes = [node for node in self.get_level(level_index) if node.generated_content]
+        for node in nodes:
+            self.update_node_status(node.section.number, SectionStatus.REVIEWING)
+        
+        reviews = await critic_agent.review_sections_batch(
+            nodes,
+            sources=context.truncated_sources,
+            previous_sections=context.completed_sections[-3:],
+            source_digests=context.source_digests
+        )
+        
+        for node, review in zip(nodes, reviews):
+            if review is not None and review.approval_status == "STOP_THE_LINE":
+                node.review = review
+                self.mark_blocked(node.section.number, review)
+            else:
+                self.mark_completed(node.section.number, node.generated_content, review)
+                context.completed_sections.append(node.generated_content)
+        
+        return reviews
+    
     def get_node(self, section_number: int) -> Optional[SectionNode]:
         """Get node by section number."""
         return self.nodes.get(section_number)
     
-    def update_node_status(self, section_number: int, status: str):
-        """Update node status."""
+    def update_node_status(self, section_number: int, status: Union[SectionStatus, str]):
+        """Update node status (a SectionStatus or its name)."""
         if section_number in self.nodes:
-            self.nodes[section_number].status = status
+            if isinstance(status, str):
+                status = SectionStatus[status]
+            self._set_status(self.nodes[section_number], status)
     
     def mark_completed(self, section_number: int, content: str, review: Optional[Any] = None):
         """Mark section as completed."""
         if section_number in self.nodes:
             node = self.nodes[section_number]
-            node.status = "APPROVED"
+            self._set_status(node, SectionStatus.APPROVED)
             node.generated_content = content
             node.review = review
     
@@ -120,35 +235,64 @@ class ResearchDAG:
         """Mark section as blocked by stop-the-line."""
         if section_number in self.nodes:
             node = self.nodes[section_number]
-            node.status = "BLOCKED"
+            self._set_status(node, SectionStatus.BLOCKED)
             node.stop_the_line = stop_event
     
     def get_ready_sections(self) -> List[SectionNode]:
-        """Get sections that are ready to execute (dependencies met)."""
-        ready = []
-        for node in self.nodes.values():
-            if node.status == "PENDING":
-                # Check if all dependencies are completed
-                deps_complete = all(
-                    self.nodes[dep].status == "APPROVED"
-                    for dep in node.dependencies
-                    if dep in self.nodes
-                )
-                if deps_complete:
-                    ready.append(node)
+        """
+        Get sections that are ready to execute (dependencies met).
+        
+        Reads the maintained ready set instead of rescanning every node. Polling
+        doesn't consume anything: a section stays ready until it leaves PENDING.
+        """
+        ready = [
+            node for node in self._ready.values()
+            # Guard against statuses assigned directly rather than through the DAG
+            if node.status == SectionStatus.PENDING and node.remaining_deps == 0
+        ]
+        ready.sort(key=lambda node: self._positions[node.section.number])
         return ready
     
+    def _update_ready(self, node: SectionNode):
+        """Add a node to the ready set if it is PENDING with no unapproved dependencies, else remove it."""
+        number = node.section.number
+        if node.status == SectionStatus.PENDING and node.remaining_deps == 0:
+            if self.nodes.get(number) is node:
+                self._ready[number] = node
+        elif self._ready.get(number) is node:
+            del self._ready[number]
+    
+    def _set_status(self, node: SectionNode, status: SectionStatus):
+        """Set a node's status, keeping dependents' readiness counters in sync."""
+        was_approved = node.status == SectionStatus.APPROVED
+        node.status = status
+        if status == SectionStatus.APPROVED and not was_approved:
+            self._adjust_dependents(node.section.number, -1)
+        elif was_approved and status != SectionStatus.APPROVED:
+            self._adjust_dependents(node.section.number, 1)
+        self._update_ready(node)
+    
+    def _adjust_dependents(self, section_number: int, delta: int):
+        """Add delta to the remaining dependency count of each section depending on this one."""
+        for dependent_num in dict.fromkeys(self._dependents.get(section_number, ())):
+            dependent = self.nodes.get(dependent_num)
+            # Edges from a re-added section's old dependency list no longer apply
+            if dependent is None or section_number not in dependent.dependencies:
+                continue
+            dependent.remaining_deps += delta
+            self._update_ready(dependent)
+    
     def has_blocked_sections(self) -> bool:
         """Check if any sections are blocked."""
-        return any(node.status == "BLOCKED" for node in self.nodes.values())
+        return any(node.status == SectionStatus.BLOCKED for node in self.nodes.values())
     
     def get_blocked_sections(self) -> List[SectionNode]:
         """Get all blocked sections."""
-        return [node for node in self.nodes.values() if node.status == "BLOCKED"]
+        return [node for node in self.nodes.values() if node.status == SectionStatus.BLOCKED]
     
     def all_completed(self) -> bool:
         """Check if all sections are completed."""
         return all(
-            node.status in ["APPROVED", "BLOCKED"]
+            node.status >= SectionStatus.APPROVED
             for node in self.nodes.values()
         )
@@ -5,22 +5,42 @@ Includes pgvector support for vector similarity search.
 """
 
 import os
+import io
+import sys
 import json
-from typing import Optional, List, Dict, Any
+import importlib.util
+from array import array
+from contextlib import contextmanager
+from functools import wraps
+from typing import Optional, List, Dict, Any, Tuple, Iterator, Callable
 from datetime import datetime
 
-from sqlalchemy import create_engine, Column, String, Integer, Float, Text, DateTime, JSON, Boolean, Index, text
+from sqlalchemy import create_engine, make_url, Column, String, Integer, Float, Text, DateTime, JSON, Boolean, Index, LargeBinary, ForeignKey, text, func, select, delete, lambda_stmt
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
 
-# Try to import pgvector
+# Check for pgvector without importing it (it pulls in numpy); the Vector type
+# is imported by init_database only when the extension is actually enabled
+PGVECTOR_AVAILABLE = importlib.util.find_spec("pgvector") is not None
+
+# Try to import zstandard (compresses research document content)
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# zstd level 3: fast enough for every save, ~4x smaller on Markdown
+ZSTD_LEVEL = 3
+
+# Try to import orjson (faster JSON/JSONB column (de)serialization)
 try:
-    from pgvector.sqlalchemy import Vector
-    PGVECTOR_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    PGVECTOR_AVAILABLE = False
-    Vector = None
+    ORJSON_AVAILABLE = False
 
 # Database URL from environment
 DATABASE_URL = os.getenv("DATABASE_URL")
@@ -34,6 +54,21 @@ engine = None
 SessionLocal = None
 
 
+# Binary JSON on Postgres (no re-parse per read, GIN-indexable); plain JSON elsewhere
+JSONB_VARIANT = JSON().with_variant(JSONB, "postgresql")
+
+
+def _json_column_dumps(value: Any) -> str:
+    """Serialize a JSON column value with orjson (engine json_serializer).
+    
+    Values orjson rejects (e.g. integers beyond 64 bits) go through json.
+    """
+    try:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    except TypeError:  # orjson.JSONEncodeError subclasses TypeError
+        return json.dumps(value)
+
+
 class ConnectorModel(Base):
     """SQLAlchemy model for Connector storage."""
     __tablename__ = "connectors"
@@ -54,7 +89,7 @@ class ConnectorModel(Base):
     doc_crawl_words = Column(Integer, default=0)  # Total words indexed
     
     # Fivetran URLs stored as JSON
-    fivetran_urls = Column(JSON, nullable=True)
+    fivetran_urls = Column(JSONB_VARIANT, nullable=True)
     
     # Metadata
     objects_count = Column(Integer, default=0)
@@ -62,7 +97,7 @@ class ConnectorModel(Base):
     fivetran_parity = Column(Float, nullable=True)
     
     # Progress stored as JSON
-    progress = Column(JSON, default=dict)
+    progress = Column(JSONB_VARIANT, default=dict)
     
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -70,37 +105,46 @@ class ConnectorModel(Base):
     completed_at = Column(DateTime, nullable=True)
     
     # Sources
-    sources = Column(JSON, default=list)
+    sources = Column(JSONB_VARIANT, default=list)
     
     # Pinecone index name
     pinecone_index = Column(String(255), default="")
     
+    __table_args__ = (
+        # Containment filters such as sources @> '["docwhisperer"]'
+        Index('ix_connectors_sources_gin', 'sources',
+              postgresql_using='gin', postgresql_ops={'sources': 'jsonb_path_ops'}),
+        Index('ix_connectors_fivetran_urls_gin', 'fivetran_urls',
+              postgresql_using='gin', postgresql_ops={'fivetran_urls': 'jsonb_path_ops'}),
+    )
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return {
-            'id': self.id,
-            'name': self.name,
-            'connector_type': self.connector_type,
-            'status': self.status,
-            'github_url': self.github_url,
-            'hevo_github_url': self.hevo_github_url,
-            'description': self.description,
-            'official_doc_urls': self.official_doc_urls,
-            'doc_crawl_status': self.doc_crawl_status,
-            'doc_crawl_urls': self.doc_crawl_urls,
-            'doc_crawl_pages': self.doc_crawl_pages,
-            'doc_crawl_words': self.doc_crawl_words,
-            'fivetran_urls': self.fivetran_urls,
-            'objects_count': self.objects_count,
-            'vectors_count': self.vectors_count,
-            'fivetran_parity': self.fivetran_parity,
-            'progress': self.progress or {},
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
-            'completed_at': self.completed_at.isoformat() if self.completed_at else None,
-            'sources': self.sources or [],
-            'pinecone_index': self.pinecone_index
-        }
+        # Loaded values sit in the instance __dict__; only expired/unloaded columns need the descriptor
+        state = self.__dict__
+        return _connector_row_to_dict({
+            name: state[name] if name in state else getattr(self, name)
+            for name in _CONNECTOR_COLUMNS
+        })
+
+
+# Connector column names in declaration order (the to_dict key order)
+_CONNECTOR_COLUMNS = tuple(c.name for c in ConnectorModel.__table__.columns)
+_CONNECTOR_TIMESTAMPS = ('created_at', 'updated_at', 'completed_at')
+
+
+def _connector_row_to_dict(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Finish a connector column dict (ORM attributes or a result mapping) for the API.
+    
+    Timestamps become ISO strings and empty progress/sources become {}/[].
+    Mutates and returns row.
+    """
+    for name in _CONNECTOR_TIMESTAMPS:
+        value = row[name]
+        row[name] = value.isoformat() if value else None
+    row['progress'] = row['progress'] or {}
+    row['sources'] = row['sources'] or []
+    return row
 
 
 class ResearchDocumentModel(Base):
@@ -108,8 +152,13 @@ class ResearchDocumentModel(Base):
     __tablename__ = "research_documents"
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    connector_id = Column(String(255), index=True, nullable=False)
-    content = Column(Text, nullable=False)
+    connector_id = Column(
+        String(255),
+        ForeignKey('connectors.id', name='fk_research_documents_connector', ondelete='CASCADE'),
+        index=True, unique=True, nullable=False
+    )  # One document per connector (upsert target), removed with its connector
+    content = Column(Text, nullable=False)  # Legacy plain text; empty when content_zstd is set
+    content_zstd = Column(LargeBinary, nullable=True)  # zstd-compressed Markdown
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
@@ -120,9 +169,46 @@ class ResearchDocumentModel(Base):
     assumptions_section = Column(Text, nullable=True)
     
     # Claim graph storage columns
-    claims_json = Column(JSON, nullable=True)
-    canonical_facts_json = Column(JSON, nullable=True)
-    evidence_map_json = Column(JSON, nullable=True)
+    claims_json = Column(JSONB_VARIANT, nullable=True)
+    canonical_facts_json = Column(JSONB_VARIANT, nullable=True)
+    evidence_map_json = Column(JSONB_VARIANT, nullable=True)
+    
+    # jsonb_path_ops GIN: smaller and faster than the default opclass for @> queries
+    __table_args__ = (
+        Index('ix_research_documents_claims_json', 'claims_json',
+              postgresql_using='gin', postgresql_ops={'claims_json': 'jsonb_path_ops'}),
+        Index('ix_research_documents_canonical_facts_json', 'canonical_facts_json',
+              postgresql_using='gin', postgresql_ops={'canonical_facts_json': 'jsonb_path_ops'}),
+        Index('ix_research_documents_evidence_map_json', 'evidence_map_json',
+              postgresql_using='gin', postgresql_ops={'evidence_map_json': 'jsonb_path_ops'}),
+    )
+    
+    @property
+    def document_text(self) -> Optional[str]:
+        """Document Markdown, decompressed from content_zstd when present."""
+        return decode_document_content(self.content, self.content_zstd)
+
+
+def encode_document_content(content: str) -> Tuple[str, Optional[bytes]]:
+    """Split document content into (content, content_zstd) column values.
+    
+    With zstandard installed the text is stored compressed and the legacy
+    column is left empty; otherwise it is stored as plain text.
+    """
+    if not ZSTD_AVAILABLE:
+        return content, None
+    compressed = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(content.encode('utf-8'))
+    return '', compressed
+
+
+def decode_document_content(content: Optional[str], content_zstd: Optional[bytes]) -> Optional[str]:
+    """Inverse of encode_document_content; legacy rows only have content."""
+    if content_zstd is None:
+        return content
+    if not ZSTD_AVAILABLE:
+        print("⚠ Research document is zstd-compressed but zstandard is not installed")
+        return None
+    return zstandard.ZstdDecompressor().decompress(bytes(content_zstd)).decode('utf-8')
 
 
 class DocumentChunkModel(Base):
@@ -130,20 +216,72 @@ class DocumentChunkModel(Base):
     __tablename__ = "document_chunks"
     
     id = Column(String(255), primary_key=True)
-    connector_id = Column(String(255), index=True, nullable=False)
+    connector_id = Column(String(255), nullable=False)  # Indexed by idx_chunks_connector_cover
     connector_name = Column(String(255), nullable=False)
     chunk_index = Column(Integer, nullable=False)
     text = Column(Text, nullable=False)
     section = Column(String(255), default="General")
     source_type = Column(String(50), default="research")
-    # Embedding stored as JSON array (fallback if pgvector not available)
+    # Embedding stored as JSON array (legacy rows; superseded by embedding_bytes)
     embedding_json = Column(JSON, nullable=True)
+    # Embedding as little-endian float32 bytes (fallback if pgvector not available)
+    embedding_bytes = Column(LargeBinary, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     
-    # Add index for connector_id queries
+    # One index for connector_id queries: ordered scans (stream_chunks) need no
+    # sort, and listing/count queries over the included columns are index-only
     __table_args__ = (
-        Index('idx_chunks_connector', 'connector_id'),
+        Index('idx_chunks_connector_cover', 'connector_id', 'chunk_index',
+              postgresql_include=['section', 'source_type', 'connector_name']),
     )
+    
+    @property
+    def stored_embedding(self) -> Optional[List[float]]:
+        """Embedding from embedding_bytes, or embedding_json for legacy rows."""
+        return decode_embedding(self.embedding_bytes, self.embedding_json)
+
+
+def decode_embedding(embedding_bytes: Optional[bytes], embedding_json: Optional[List[float]]) -> Optional[List[float]]:
+    """Embedding from a chunk's embedding_bytes / embedding_json column values."""
+    if embedding_bytes is not None:
+        return unpack_embedding(embedding_bytes)
+    return embedding_json
+
+
+def pack_embedding(embedding: List[float]) -> bytes:
+    """Serialize an embedding as little-endian float32 (4 bytes per value)."""
+    values = array('f', embedding)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values.tobytes()
+
+
+def unpack_embedding(data: bytes) -> List[float]:
+    """Inverse of pack_embedding."""
+    values = array('f')
+    values.frombytes(bytes(data))
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values.tolist()
+
+
+class ReviewCacheModel(Base):
+    """SQLAlchemy model for critic review responses kept by the review caches.
+    
+    Semantic entries set cache_key and embedding_json; exact-prompt entries
+    set prompt_sha256.
+    """
+    __tablename__ = "review_cache"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    cache_key = Column(String(64), unique=True, nullable=True)  # sha256 of the embedded key text
+    prompt_sha256 = Column(String(64), unique=True, nullable=True)  # sha256 of model + review prompt
+    # Embedding stored as JSON array; nearest-neighbour search runs in memory
+    embedding_json = Column(JSON, nullable=True)
+    review_json = Column(JSON, nullable=False)
+    hits = Column(Integer, default=0)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
 
 # Track if pgvector extension is actually available in the database
@@ -174,13 +312,54 @@ def init_database() -> bool:
         if db_url.startswith("postgres://"):
             db_url = db_url.replace("postgres://", "postgresql://", 1)
         
+        # Prefer psycopg 3 (pipelined executemany, binary parameters) when installed;
+        # an explicit driver in DATABASE_URL is left alone
+        if db_url.startswith("postgresql://"):
+            driver = "psycopg" if importlib.util.find_spec("psycopg") else "psycopg2"
+            db_url = db_url.replace("postgresql://", f"postgresql+{driver}://", 1)
+        
+        # TCP keepalives so managed Postgres proxies don't silently drop idle connections
+        connect_args = {}
+        if db_url.startswith("postgresql"):
+            connect_args = {
+                "connect_timeout": 3,
+                "keepalives": 1,
+                "keepalives_idle": 30,
+                "keepalives_interval": 10,
+                "keepalives_count": 3
+            }
+        
+        # psycopg2 executemany: INSERTs as multi-row VALUES pages, UPDATE/DELETE via execute_batch
+        dialect_args = {}
+        if make_url(db_url).get_dialect().driver == "psycopg2":
+            dialect_args = {
+                "executemany_mode": "values_plus_batch",
+                "executemany_batch_page_size": 1000
+            }
+        
+        # orjson for JSON/JSONB columns (progress, sources, claim graph) when installed
+        if ORJSON_AVAILABLE:
+            dialect_args["json_serializer"] = _json_column_dumps
+            dialect_args["json_deserializer"] = orjson.loads
+        
         # Create engine with connection pooling
         engine = create_engine(
             db_url,
             poolclass=QueuePool,
-            pool_size=5,
-            max_overflow=10,
-            pool_pre_ping=True,  # Verify connections before using
+            # Postgres throughput keeps improving up to ~25-50 pooled connections under
+            # heavy concurrency, then flattens; size per process against max_connections
+            pool_size=int(os.getenv("DB_POOL_SIZE", "25")),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "25")),
+            # No pre-ping by default: under PgBouncer transaction pooling its SELECT 1
+            # leaves server backends idle in transaction; recycling replaces stale ones
+            pool_pre_ping=os.getenv("DB_POOL_PRE_PING", "false").lower() == "true",
+            pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "60")),  # Keep below PgBouncer server_idle_timeout
+            pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", "30")),  # Seconds to wait for a free connection
+            pool_use_lifo=True,  # Reuse warm connections; idle extras age out
+            connect_args=connect_args,
+            insertmanyvalues_page_size=1000,  # Rows per multi-row INSERT ... VALUES statement
+            query_cache_size=1200,  # Compiled-statement cache; the default 500 churns across all the ORM/Core variants
+            **dialect_args,
             echo=False  # Set to True for SQL debugging
         )
         
@@ -190,7 +369,7 @@ def init_database() -> bool:
         # Test the connection with a simple query first
         try:
             with engine.connect() as conn:
-                result = conn.execute(text("SELECT 1"))
+                result = conn.execute(_CONNECTION_TEST_SQL)
                 result.fetchone()
             print("✓ Database connection test successful")
         except Exception as conn_error:
@@ -204,11 +383,11 @@ def init_database() -> bool:
         if PGVECTOR_AVAILABLE:
             try:
                 with engine.connect() as conn:
-                    conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+                    conn.execute(_CREATE_VECTOR_EXTENSION_SQL)
                     conn.commit()
                 # Verify extension is actually available
                 with engine.connect() as conn:
-                    result = conn.execute(text("SELECT 1 FROM pg_extension WHERE extname = 'vector'"))
+                    result = conn.execute(_VECTOR_EXTENSION_CHECK_SQL)
                     if result.fetchone():
                         PGVECTOR_EXTENSION_AVAILABLE = True
                         print("✓ pgvector extension enabled and verified")
@@ -216,23 +395,23 @@ def init_database() -> bool:
                         print("⚠ pgvector extension not found after creation attempt")
             except Exception as e:
                 print(f"⚠ Could not enable pgvector extension: {e}")
-                print("  → Will use embedding_json (JSON) storage instead")
+                print("  → Will use embedding_bytes (float32) storage instead")
         
         # Only add VECTOR column if extension is actually available
         # Note: This is for runtime use. Schema changes should be done via Alembic migrations.
         if PGVECTOR_EXTENSION_AVAILABLE and not hasattr(DocumentChunkModel, 'embedding'):
-            DocumentChunkModel.embedding = Column(Vector(EMBEDDING_DIMENSION), nullable=True)
+            try:
+                from pgvector.sqlalchemy import Vector
+                DocumentChunkModel.embedding = Column(Vector(EMBEDDING_DIMENSION), nullable=True)
+            except ImportError as e:
+                PGVECTOR_EXTENSION_AVAILABLE = False
+                print(f"⚠ Could not import pgvector: {e}")
         
         # Verify database tables exist - auto-create if fresh database
         try:
             with engine.connect() as conn:
                 # Check if tables exist
-                tables_exist = conn.execute(text("""
-                    SELECT EXISTS (
-                        SELECT FROM information_schema.tables 
-                        WHERE table_name = 'connectors'
-                    )
-                """)).scalar()
+                tables_exist = conn.execute(_TABLE_EXISTS_SQL, {"table_name": "connectors"}).scalar()
                 
                 if not tables_exist:
                     print("⚠ Database tables not found. Attempting to create them...")
@@ -280,12 +459,7 @@ def init_database() -> bool:
                         print("✓ Tables created directly via SQLAlchemy")
                     
                     # Verify tables were created
-                    tables_exist = conn.execute(text("""
-                        SELECT EXISTS (
-                            SELECT FROM information_schema.tables 
-                            WHERE table_name = 'connectors'
-                        )
-                    """)).scalar()
+                    tables_exist = conn.execute(_TABLE_EXISTS_SQL, {"table_name": "connectors"}).scalar()
                     
                     if tables_exist:
                         print("✓ Database tables verified after creation")
@@ -295,82 +469,167 @@ def init_database() -> bool:
                 else:
                     print("✓ Database tables verified")
                     
+                    # One catalog read for every schema-drift check below
+                    existing_columns = {
+                        (table_name, column_name): data_type
+                        for table_name, column_name, data_type in conn.execute(_SCHEMA_COLUMNS_SQL)
+                    }
+                    
                     # Auto-add missing columns (for deployments where migrations haven't run)
                     try:
-                        # Check and add hevo_github_url column to connectors
-                        hevo_col_exists = conn.execute(text("""
+                        missing_columns: Dict[str, List[str]] = {}
+                        for table_name, col_name, col_type in REQUIRED_COLUMNS:
+                            if (table_name, col_name) not in existing_columns:
+                                print(f"⚠ Adding missing column: {table_name}.{col_name}")
+                                # IF NOT EXISTS: another worker starting up may have just added it
+                                missing_columns.setdefault(table_name, []).append(
+                                    f"ADD COLUMN IF NOT EXISTS {col_name} {col_type}"
+                                )
+                        # One ALTER (one lock, one catalog update) per table, one commit overall
+                        for table_name, additions in missing_columns.items():
+                            conn.execute(text(f"ALTER TABLE {table_name} {', '.join(additions)}"))
+                        if missing_columns:
+                            conn.commit()
+                            print(f"✓ Added {sum(map(len, missing_columns.values()))} missing column(s)")
+                    except Exception as col_error:
+                        conn.rollback()
+                        print(f"⚠ Could not add missing columns: {col_error}")
+                    
+                    # Chunk indexes added after the initial schema
+                    try:
+                        conn.commit()  # Don't hold a transaction open while CONCURRENTLY waits
+                        # CONCURRENTLY can't run inside a transaction block
+                        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as ddl_conn:
+                            ddl_conn.execute(text(
+                                "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chunks_connector_cover "
+                                "ON document_chunks (connector_id, chunk_index) "
+                                "INCLUDE (section, source_type, connector_name)"
+                            ))
+                            # Superseded by the covering index
+                            for old_index in SUPERSEDED_CHUNK_INDEXES:
+                                ddl_conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {old_index}"))
+                            # HNSW index so top-k similarity search doesn't scan every chunk
+                            if PGVECTOR_EXTENSION_AVAILABLE and ('document_chunks', 'embedding') in existing_columns:
+                                ddl_conn.execute(text(HNSW_INDEX_SQL))
+                    except Exception as chunk_index_error:
+                        print(f"⚠ Could not create document_chunks indexes: {chunk_index_error}")
+                    
+                    # Store filterable JSON as JSONB with jsonb_path_ops GIN indexes for containment queries
+                    try:
+                        json_columns = [
+                            (table_name, col_name)
+                            for table_name, col_name in JSONB_COLUMNS
+                            if existing_columns.get((table_name, col_name)) == 'json'
+                        ]
+                        for table_name, col_name in json_columns:
+                            print(f"⚠ Converting {table_name}.{col_name} to JSONB")
+                            conn.execute(text(f"ALTER TABLE {table_name} ALTER COLUMN {col_name} TYPE JSONB USING {col_name}::jsonb"))
+                        if json_columns:
+                            conn.commit()
+                            print(f"✓ Converted {len(json_columns)} column(s) to JSONB")
+                        
+                        path_ops_indexes = set(conn.execute(text("""
+                            SELECT indexname FROM pg_indexes
+                            WHERE indexdef LIKE '%jsonb_path_ops%'
+                        """)).scalars().all())
+                        conn.commit()  # Don't hold a transaction open while CONCURRENTLY waits
+                        
+                        # CONCURRENTLY can't run inside a transaction block
+                        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as ddl_conn:
+                            for index_name, table_name, col_name in JSONB_GIN_INDEXES:
+                                if index_name in path_ops_indexes:
+                                    continue
+                                print(f"⚠ Creating jsonb_path_ops index: {index_name}")
+                                # Replaces the default-opclass index 004_claim_graph created under the same name
+                                ddl_conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}"))
+                                ddl_conn.execute(text(
+                                    f"CREATE INDEX CONCURRENTLY {index_name} ON {table_name} USING gin ({col_name} jsonb_path_ops)"
+                                ))
+                                print(f"✓ Created {index_name}")
+                    except Exception as jsonb_error:
+                        conn.rollback()
+                        print(f"⚠ Could not convert JSON columns to JSONB: {jsonb_error}")
+                    
+                    # One research document per connector, so saves can upsert
+                    try:
+                        unique_doc_index = conn.execute(text("""
                             SELECT EXISTS (
-                                SELECT FROM information_schema.columns 
-                                WHERE table_name = 'connectors' AND column_name = 'hevo_github_url'
+                                SELECT FROM pg_indexes
+                                WHERE tablename = 'research_documents'
+                                AND indexname = 'ix_research_documents_connector_id'
+                                AND indexdef LIKE 'CREATE UNIQUE%'
                             )
                         """)).scalar()
                         
-                        if not hevo_col_exists:
-                            print("⚠ Adding missing column: connectors.hevo_github_url")
-                            conn.execute(text("ALTER TABLE connectors ADD COLUMN hevo_github_url VARCHAR(500)"))
+                        if not unique_doc_index:
+                            print("⚠ Making research_documents.connector_id unique")
+                            # Keep the newest row per connector before adding the constraint
+                            removed = conn.execute(text("""
+                                DELETE FROM research_documents d
+                                USING research_documents newer
+                                WHERE d.connector_id = newer.connector_id AND d.id < newer.id
+                            """)).rowcount
+                            if removed:
+                                print(f"⚠ Removed {removed} older duplicate research document(s)")
+                            conn.execute(text("DROP INDEX IF EXISTS ix_research_documents_connector_id"))
+                            conn.execute(text("CREATE UNIQUE INDEX ix_research_documents_connector_id ON research_documents (connector_id)"))
                             conn.commit()
-                            print("✓ Added hevo_github_url column")
-                        
-                        # Check and add doc_crawl columns to connectors
-                        doc_crawl_columns = [
-                            ("official_doc_urls", "JSONB"),
-                            ("doc_crawl_status", "VARCHAR(50) DEFAULT 'pending'"),
-                            ("doc_crawl_urls", "JSONB"),
-                            ("doc_crawl_pages", "INTEGER DEFAULT 0"),
-                            ("doc_crawl_words", "INTEGER DEFAULT 0"),
-                        ]
-                        
-                        for col_name, col_type in doc_crawl_columns:
-                            col_exists = conn.execute(text(f"""
-                                SELECT EXISTS (
-                                    SELECT FROM information_schema.columns 
-                                    WHERE table_name = 'connectors' AND column_name = '{col_name}'
-                                )
-                            """)).scalar()
-                            
-                            if not col_exists:
-                                print(f"⚠ Adding missing column: connectors.{col_name}")
-                                conn.execute(text(f"ALTER TABLE connectors ADD COLUMN {col_name} {col_type}"))
-                                conn.commit()
-                                print(f"✓ Added {col_name} column")
+                            print("✓ research_documents.connector_id is unique")
+                    except Exception as index_error:
+                        conn.rollback()
+                        print(f"⚠ Could not make research_documents.connector_id unique: {index_error}")
+                    
+                    # Research documents go with their connector (ON DELETE CASCADE)
+                    try:
+                        cascade_fk = conn.execute(text("""
+                            SELECT EXISTS (
+                                SELECT FROM pg_constraint
+                                WHERE conname = 'fk_research_documents_connector'
+                            )
+                        """)).scalar()
                         
-                        # Check and add claim graph columns to research_documents
-                        claim_graph_columns = [
-                            ("citation_report_json", "JSONB"),
-                            ("citation_overrides_json", "JSONB"),
-                            ("validation_attempts", "INTEGER"),
-                            ("assumptions_section", "TEXT"),
-                            ("claims_json", "JSONB"),
-                            ("canonical_facts_json", "JSONB"),
-                            ("evidence_map_json", "JSONB"),
-                        ]
+                        # Documents of already-deleted connectors would fail validation;
+                        # deleting them is left to migration 015 rather than startup
+                        orphans = 0 if cascade_fk else conn.execute(_RESEARCH_DOCUMENT_ORPHANS_SQL).scalar()
+                        if orphans:
+                            conn.commit()
+                            print(f"⚠ Not adding research_documents foreign key: {orphans} document(s) have no connector")
+                            print("  → Run 'python migrate.py upgrade' to remove them and add the constraint")
+                        elif not cascade_fk:
+                            print("⚠ Adding research_documents -> connectors cascade foreign key")
+                            conn.execute(text(RESEARCH_DOCUMENT_FK_SQL))
+                            conn.commit()
+                            print("✓ Added fk_research_documents_connector")
+                    except Exception as fk_error:
+                        conn.rollback()
+                        print(f"⚠ Could not add research_documents foreign key: {fk_error}")
+                    
+                    # Create tables added after the initial schema
+                    try:
+                        review_cache_exists = any(table_name == 'review_cache' for table_name, _ in existing_columns)
                         
-                        for col_name, col_type in claim_graph_columns:
-                            col_exists = conn.execute(text(f"""
-                                SELECT EXISTS (
-                                    SELECT FROM information_schema.columns 
-                                    WHERE table_name = 'research_documents' AND column_name = '{col_name}'
-                                )
-                            """)).scalar()
-                            
-                            if not col_exists:
-                                print(f"⚠ Adding missing column: research_documents.{col_name}")
-                                conn.execute(text(f"ALTER TABLE research_documents ADD COLUMN {col_name} {col_type}"))
+                        if not review_cache_exists:
+                            print("⚠ Adding missing table: review_cache")
+                            Base.metadata.create_all(bind=engine, tables=[ReviewCacheModel.__table__])
+                            print("✓ Added review_cache table")
+                        else:
+                            if ('review_cache', 'prompt_sha256') not in existing_columns:
+                                print("⚠ Adding missing column: review_cache.prompt_sha256")
+                                conn.execute(text("ALTER TABLE review_cache ADD COLUMN IF NOT EXISTS prompt_sha256 VARCHAR(64)"))
+                                conn.execute(text("CREATE UNIQUE INDEX IF NOT EXISTS ix_review_cache_prompt_sha256 ON review_cache (prompt_sha256)"))
+                                conn.execute(text("ALTER TABLE review_cache ALTER COLUMN cache_key DROP NOT NULL"))
+                                conn.execute(text("ALTER TABLE review_cache ALTER COLUMN embedding_json DROP NOT NULL"))
                                 conn.commit()
-                                print(f"✓ Added {col_name} column")
-                                
-                    except Exception as col_error:
-                        print(f"⚠ Could not add missing columns: {col_error}")
+                                print("✓ Added prompt_sha256 column")
+                    except Exception as table_add_error:
+                        print(f"⚠ Could not add missing tables: {table_add_error}")
                     
                     # Check migration status (warn if pending, but don't block)
                     try:
                         # Check if alembic_version table exists
-                        alembic_version_exists = conn.execute(text("""
-                            SELECT EXISTS (
-                                SELECT FROM information_schema.tables 
-                                WHERE table_name = 'alembic_version'
-                            )
-                        """)).scalar()
+                        alembic_version_exists = conn.execute(
+                            _TABLE_EXISTS_SQL, {"table_name": "alembic_version"}
+                        ).scalar()
                         
                         if not alembic_version_exists:
                             print("⚠ Alembic version tracking not found. Consider running: alembic stamp head")
@@ -394,6 +653,20 @@ def init_database() -> bool:
         return False
 
 
+def _dispose_engine_after_fork():
+    """Drop pooled connections inherited from the parent process.
+    
+    Forked workers (Celery prefork, pre-loading servers) must not share the
+    parent's sockets. close=False leaves them open for the parent to keep using.
+    """
+    if engine is not None:
+        engine.dispose(close=False)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_dispose_engine_after_fork)
+
+
 def get_db_session() -> Optional[Session]:
     """Get a database session.
     
@@ -410,6 +683,147 @@ def is_database_available() -> bool:
     return engine is not None and SessionLocal is not None
 
 
+def require_db(
+    empty: Callable[[], Any] = lambda: None,
+    error: Optional[str] = None,
+    raise_errors: bool = False
+):
+    """Decorator for storage methods that run on one database session.
+    
+    The wrapped method receives a new session after self and does its own
+    commit; the wrapper rolls back on error and always closes the session.
+    
+    Args:
+        empty: Factory for the result when the database is not configured
+            or the method fails (e.g. list, bool)
+        error: Message printed with the exception; without it, errors propagate
+        raise_errors: Re-raise after printing instead of returning empty()
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if SessionLocal is None:
+                return empty()
+            session = SessionLocal()
+            try:
+                return method(self, session, *args, **kwargs)
+            except Exception as e:
+                session.rollback()
+                if error is None:
+                    raise
+                print(f"{error}: {e}")
+                if raise_errors:
+                    raise
+                return empty()
+            finally:
+                session.close()
+        return wrapper
+    return decorator
+
+
+# Columns added after the initial schema, auto-added by init_database when
+# migrations haven't run: (table, column, DDL type)
+REQUIRED_COLUMNS = (
+    ('connectors', 'hevo_github_url', 'VARCHAR(500)'),
+    ('connectors', 'official_doc_urls', 'JSONB'),
+    ('connectors', 'doc_crawl_status', "VARCHAR(50) DEFAULT 'pending'"),
+    ('connectors', 'doc_crawl_urls', 'JSONB'),
+    ('connectors', 'doc_crawl_pages', 'INTEGER DEFAULT 0'),
+    ('connectors', 'doc_crawl_words', 'INTEGER DEFAULT 0'),
+    ('research_documents', 'citation_report_json', 'JSONB'),
+    ('research_documents', 'citation_overrides_json', 'JSONB'),
+    ('research_documents', 'validation_attempts', 'INTEGER'),
+    ('research_documents', 'assumptions_section', 'TEXT'),
+    ('research_documents', 'claims_json', 'JSONB'),
+    ('research_documents', 'canonical_facts_json', 'JSONB'),
+    ('research_documents', 'evidence_map_json', 'JSONB'),
+    ('research_documents', 'content_zstd', 'BYTEA'),
+    ('document_chunks', 'embedding_bytes', 'BYTEA'),
+)
+
+# Columns declared JSONB_VARIANT; older deployments may still have them as json
+JSONB_COLUMNS = (
+    ('connectors', 'fivetran_urls'),
+    ('connectors', 'progress'),
+    ('connectors', 'sources'),
+    ('research_documents', 'claims_json'),
+    ('research_documents', 'canonical_facts_json'),
+    ('research_documents', 'evidence_map_json'),
+)
+
+# GIN (jsonb_path_ops) indexes for @> containment filters: (index, table, column).
+# progress is left unindexed: it is rewritten on every section update.
+JSONB_GIN_INDEXES = (
+    ('ix_connectors_sources_gin', 'connectors', 'sources'),
+    ('ix_connectors_fivetran_urls_gin', 'connectors', 'fivetran_urls'),
+    ('ix_research_documents_claims_json', 'research_documents', 'claims_json'),
+    ('ix_research_documents_canonical_facts_json', 'research_documents', 'canonical_facts_json'),
+    ('ix_research_documents_evidence_map_json', 'research_documents', 'evidence_map_json'),
+)
+
+# document_chunks connector_id indexes replaced by idx_chunks_connector_cover
+SUPERSEDED_CHUNK_INDEXES = (
+    'idx_chunks_connector',
+    'idx_chunks_connector_chunkidx',
+    'ix_document_chunks_connector_id',
+)
+
+# Statements init_database runs on every startup, built once per process
+_CONNECTION_TEST_SQL = text("SELECT 1")
+_CREATE_VECTOR_EXTENSION_SQL = text("CREATE EXTENSION IF NOT EXISTS vector")
+_VECTOR_EXTENSION_CHECK_SQL = text("SELECT 1 FROM pg_extension WHERE extname = 'vector'")
+_TABLE_EXISTS_SQL = text("""
+    SELECT EXISTS (
+        SELECT FROM information_schema.tables
+        WHERE table_name = :table_name
+    )
+""")
+_SCHEMA_COLUMNS_SQL = text("""
+    SELECT table_name, column_name, data_type FROM information_schema.columns
+    WHERE table_name IN ('connectors', 'research_documents', 'document_chunks', 'review_cache')
+""")
+
+# Research documents whose connector row no longer exists
+_RESEARCH_DOCUMENT_ORPHANS_SQL = text("""
+    SELECT count(*) FROM research_documents d
+    WHERE NOT EXISTS (SELECT 1 FROM connectors c WHERE c.id = d.connector_id)
+""")
+
+RESEARCH_DOCUMENT_FK_SQL = (
+    "ALTER TABLE research_documents ADD CONSTRAINT fk_research_documents_connector "
+    "FOREIGN KEY (connector_id) REFERENCES connectors (id) ON DELETE CASCADE"
+)
+
+# pgvector HNSW index for cosine top-k over document_chunks.embedding
+HNSW_INDEX_SQL = """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chunks_embedding_hnsw
+    ON document_chunks USING hnsw (embedding vector_cosine_ops)
+    WITH (m = 16, ef_construction = 64)
+"""
+
+
+# Columns written by bulk_insert_chunks, in COPY order
+_CHUNK_COPY_COLUMNS = (
+    'id', 'connector_id', 'connector_name', 'chunk_index', 'text',
+    'section', 'source_type', 'embedding_json', 'embedding_bytes', 'created_at'
+)
+# COPY text format escapes (backslash first)
+_COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+
+def _copy_text_value(value: Any) -> str:
+    """Encode one value for COPY ... FROM STDIN WITH (FORMAT text)."""
+    if value is None:
+        return '\\N'
+    if isinstance(value, (list, dict)):
+        value = json.dumps(value, separators=(',', ':'))
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        value = '\\x' + bytes(value).hex()  # bytea hex input
+    elif isinstance(value, datetime):
+        value = value.isoformat()
+    return str(value).translate(_COPY_ESCAPES)
+
+
 class DatabaseConnectorStorage:
     """Database-backed storage for connectors."""
     
@@ -421,138 +835,197 @@ class DatabaseConnectorStorage:
         """Get a new database session."""
         return get_db_session()
     
-    def create_connector(self, connector_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Create a new connector in database."""
+    @contextmanager
+    def session_scope(self) -> Iterator[Optional[Session]]:
+        """Provide a transactional scope around a series of operations.
+        
+        Commits when the block exits normally, rolls back and re-raises on
+        error, and always closes the session. Lets callers group several
+        operations into one checkout and one transaction.
+        
+        Yields:
+            Database session, or None if the database is not available
+        """
         session = self.get_session()
         if not session:
-            return None
+            yield None
+            return
         
         try:
-            connector = ConnectorModel(
-                id=connector_data['id'],
-                name=connector_data['name'],
-                connector_type=connector_data['connector_type'],
-                status=connector_data.get('status', 'not_started'),
-                github_url=connector_data.get('github_url'),
-                hevo_github_url=connector_data.get('hevo_github_url'),
-                description=connector_data.get('description', ''),
-                official_doc_urls=connector_data.get('official_doc_urls'),
-                doc_crawl_status=connector_data.get('doc_crawl_status', 'pending'),
-                doc_crawl_urls=connector_data.get('doc_crawl_urls'),
-                doc_crawl_pages=connector_data.get('doc_crawl_pages', 0),
-                doc_crawl_words=connector_data.get('doc_crawl_words', 0),
-                fivetran_urls=connector_data.get('fivetran_urls'),
-                objects_count=connector_data.get('objects_count', 0),
-                vectors_count=connector_data.get('vectors_count', 0),
-                fivetran_parity=connector_data.get('fivetran_parity'),
-                progress=connector_data.get('progress', {}),
-                sources=connector_data.get('sources', []),
-                pinecone_index=connector_data.get('pinecone_index', f"{connector_data['id']}-docs")
-            )
-            
-            session.add(connector)
+            yield session
             session.commit()
-            session.refresh(connector)
-            
-            return connector.to_dict()
-        except Exception as e:
+        except Exception:
             session.rollback()
-            print(f"Error creating connector in DB: {e}")
             raise
         finally:
             session.close()
     
-    def get_connector(self, connector_id: str) -> Optional[Dict[str, Any]]:
+    @require_db(error="Error creating connector in DB", raise_errors=True)
+    def create_connector(self, session: Session, connector_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Create a new connector in database."""
+        now = datetime.utcnow()
+        connector = ConnectorModel(
+            id=connector_data['id'],
+            name=connector_data['name'],
+            connector_type=connector_data['connector_type'],
+            status=connector_data.get('status', 'not_started'),
+            github_url=connector_data.get('github_url'),
+            hevo_github_url=connector_data.get('hevo_github_url'),
+            description=connector_data.get('description', ''),
+            official_doc_urls=connector_data.get('official_doc_urls'),
+            doc_crawl_status=connector_data.get('doc_crawl_status', 'pending'),
+            doc_crawl_urls=connector_data.get('doc_crawl_urls'),
+            doc_crawl_pages=connector_data.get('doc_crawl_pages', 0),
+            doc_crawl_words=connector_data.get('doc_crawl_words', 0),
+            fivetran_urls=connector_data.get('fivetran_urls'),
+            objects_count=connector_data.get('objects_count', 0),
+            vectors_count=connector_data.get('vectors_count', 0),
+            fivetran_parity=connector_data.get('fivetran_parity'),
+            progress=connector_data.get('progress', {}),
+            sources=connector_data.get('sources', []),
+            pinecone_index=connector_data.get('pinecone_index', f"{connector_data['id']}-docs"),
+            created_at=now,
+            updated_at=now,
+            completed_at=None
+        )
+        
+        # Every column is set above, so the dict is built without a refresh SELECT
+        result = connector.to_dict()
+        session.add(connector)
+        session.commit()
+        
+        return result
+    
+    @require_db()
+    def get_connector(self, session: Session, connector_id: str) -> Optional[Dict[str, Any]]:
         """Get a connector by ID."""
-        session = self.get_session()
-        if not session:
-            return None
+        connector = session.get(ConnectorModel, connector_id)
         
-        try:
-            connector = session.query(ConnectorModel).filter(
-                ConnectorModel.id == connector_id
-            ).first()
-            
-            if connector:
-                return connector.to_dict()
-            return None
-        finally:
-            session.close()
+        if connector:
+            return connector.to_dict()
+        return None
     
     def list_connectors(self) -> List[Dict[str, Any]]:
         """List all connectors."""
-        session = self.get_session()
-        if not session:
-            return []
+        with self.session_scope() as session:
+            if not session:
+                return []
+            
+            # Read-only listing: plain column rows, no ORM objects to build
+            rows = session.execute(
+                select(*ConnectorModel.__table__.columns).execution_options(yield_per=1000)
+            ).mappings()
+            return [_connector_row_to_dict(dict(row)) for row in rows]
+    
+    @require_db(list)
+    def list_connectors_summary(self, session: Session) -> List[Dict[str, Any]]:
+        """List connectors with only the columns a list view needs.
         
-        try:
-            connectors = session.query(ConnectorModel).all()
-            return [c.to_dict() for c in connectors]
-        finally:
-            session.close()
+        Progress counts are extracted server-side so the full progress
+        JSON (section reviews, contradictions, ...) is never transferred.
+        """
+        rows = session.query(
+            ConnectorModel.id,
+            ConnectorModel.name,
+            ConnectorModel.status,
+            func.coalesce(
+                func.jsonb_array_length(ConnectorModel.progress['sections_completed']), 0
+            ),
+            func.coalesce(ConnectorModel.progress['total_sections'].as_integer(), 0)
+        ).all()
+        return [
+            {
+                'id': connector_id,
+                'name': name,
+                'status': status,
+                'sections_completed_count': completed_count,
+                'total_sections': total_sections
+            }
+            for connector_id, name, status, completed_count, total_sections in rows
+        ]
     
-    def update_connector(self, connector_id: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    @require_db(error="Error updating connector in DB")
+    def update_connector(self, session: Session, connector_id: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update a connector."""
-        session = self.get_session()
-        if not session:
-            return None
+        connector = session.get(ConnectorModel, connector_id)
         
-        try:
-            connector = session.query(ConnectorModel).filter(
-                ConnectorModel.id == connector_id
-            ).first()
-            
-            if not connector:
-                return None
-            
-            # Update allowed fields
-            for key, value in updates.items():
-                if hasattr(connector, key):
-                    setattr(connector, key, value)
-            
-            connector.updated_at = datetime.utcnow()
-            session.commit()
-            session.refresh(connector)
-            
-            return connector.to_dict()
-        except Exception as e:
-            session.rollback()
-            print(f"Error updating connector in DB: {e}")
+        if not connector:
             return None
-        finally:
-            session.close()
+        
+        # Update allowed fields
+        for key, value in updates.items():
+            if hasattr(connector, key):
+                if key in _CONNECTOR_TIMESTAMPS and isinstance(value, str):
+                    # Callers send ISO strings; keep the attribute a datetime
+                    # since it is not reloaded after commit
+                    value = datetime.fromisoformat(value)
+                setattr(connector, key, value)
+        
+        connector.updated_at = datetime.utcnow()
+        result = connector.to_dict()
+        session.commit()
+        
+        return result
     
-    def delete_connector(self, connector_id: str) -> bool:
-        """Delete a connector."""
-        session = self.get_session()
-        if not session:
-            return False
+    def update_connectors_batch(self, batch: List[Tuple[str, Dict[str, Any]]]) -> bool:
+        """Apply updates to many connectors in a single transaction.
         
-        try:
-            connector = session.query(ConnectorModel).filter(
-                ConnectorModel.id == connector_id
-            ).first()
-            
-            if not connector:
-                return False
+        Rows are sent as one executemany-style bulk UPDATE keyed on the
+        primary key, so a burst of progress updates costs one roundtrip
+        instead of one SELECT + UPDATE per connector.
+        
+        Args:
+            batch: (connector_id, updates) pairs
             
-            # Also delete associated research document
-            session.query(ResearchDocumentModel).filter(
-                ResearchDocumentModel.connector_id == connector_id
-            ).delete()
+        Returns:
+            True if the batch was committed
+        """
+        return self.bulk_update_connectors([
+            {**updates, 'id': connector_id}
+            for connector_id, updates in batch
+        ])
+    
+    @require_db(bool, "Error batch updating connectors in DB")
+    def bulk_update_connectors(self, session: Session, rows: List[Dict[str, Any]]) -> bool:
+        """Apply many connector updates in a single transaction.
+        
+        Uses bulk_update_mappings, which skips loading the ORM objects and
+        groups rows with the same columns into one executemany UPDATE.
+        
+        Args:
+            rows: Dicts of column values, each including the connector 'id'
             
-            session.delete(connector)
-            session.commit()
+        Returns:
+            True if the batch was committed
+        """
+        if not rows:
             return True
-        except Exception as e:
-            session.rollback()
-            print(f"Error deleting connector from DB: {e}")
-            return False
-        finally:
-            session.close()
+        
+        now = datetime.utcnow()
+        mappings = [
+            {
+                **{k: v for k, v in row.items() if hasattr(ConnectorModel, k)},
+                'updated_at': now
+            }
+            for row in rows
+        ]
+        
+        session.bulk_update_mappings(ConnectorModel, mappings)
+        session.commit()
+        return True
     
+    @require_db(bool, "Error deleting connector from DB")
+    def delete_connector(self, session: Session, connector_id: str) -> bool:
+        """Delete a connector."""
+        # The research document is removed by ON DELETE CASCADE
+        result = session.execute(delete(ConnectorModel).where(ConnectorModel.id == connector_id))
+        session.commit()
+        return result.rowcount > 0
+    
+    @require_db(bool, "Error saving research document")
     def save_research_document(
         self,
+        session: Session,
         connector_id: str,
         content: str,
         claims_json: Optional[Dict[str, Any]] = None,
@@ -563,56 +1036,47 @@ class DatabaseConnectorStorage:
         validation_attempts: Optional[int] = None,
         assumptions_section: Optional[str] = None
     ) -> bool:
-        """Save or update research document with claim graph data."""
-        session = self.get_session()
-        if not session:
-            return False
+        """Save or update research document with claim graph data.
         
-        try:
-            # Check if document exists
-            doc = session.query(ResearchDocumentModel).filter(
-                ResearchDocumentModel.connector_id == connector_id
-            ).first()
-            
-            if doc:
-                doc.content = content
-                doc.updated_at = datetime.utcnow()
-                if claims_json is not None:
-                    doc.claims_json = claims_json
-                if canonical_facts_json is not None:
-                    doc.canonical_facts_json = canonical_facts_json
-                if evidence_map_json is not None:
-                    doc.evidence_map_json = evidence_map_json
-                if citation_report_json is not None:
-                    doc.citation_report_json = citation_report_json
-                if citation_overrides_json is not None:
-                    doc.citation_overrides_json = citation_overrides_json
-                if validation_attempts is not None:
-                    doc.validation_attempts = validation_attempts
-                if assumptions_section is not None:
-                    doc.assumptions_section = assumptions_section
-            else:
-                doc = ResearchDocumentModel(
-                    connector_id=connector_id,
-                    content=content,
-                    claims_json=claims_json,
-                    canonical_facts_json=canonical_facts_json,
-                    evidence_map_json=evidence_map_json,
-                    citation_report_json=citation_report_json,
-                    citation_overrides_json=citation_overrides_json,
-                    validation_attempts=validation_attempts or 0,
-                    assumptions_section=assumptions_section
-                )
-                session.add(doc)
-            
-            session.commit()
-            return True
-        except Exception as e:
-            session.rollback()
-            print(f"Error saving research document: {e}")
-            return False
-        finally:
-            session.close()
+        Issued as a single INSERT ... ON CONFLICT (connector_id) DO UPDATE.
+        Claim graph fields passed as None keep their stored values.
+        """
+        now = datetime.utcnow()
+        plain_content, compressed_content = encode_document_content(content)
+        # Only provided fields are written (None would be stored as JSON 'null')
+        provided = {
+            k: v for k, v in {
+                'claims_json': claims_json,
+                'canonical_facts_json': canonical_facts_json,
+                'evidence_map_json': evidence_map_json,
+                'citation_report_json': citation_report_json,
+                'citation_overrides_json': citation_overrides_json,
+                'validation_attempts': validation_attempts,
+                'assumptions_section': assumptions_section
+            }.items()
+            if v is not None
+        }
+        
+        stmt = pg_insert(ResearchDocumentModel).values(
+            connector_id=connector_id,
+            content=plain_content,
+            content_zstd=compressed_content,
+            created_at=now,
+            updated_at=now,
+            **{'validation_attempts': 0, **provided}
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ResearchDocumentModel.connector_id],
+            set_={
+                'content': stmt.excluded.content,
+                'content_zstd': stmt.excluded.content_zstd,
+                'updated_at': stmt.excluded.updated_at,
+                **{k: getattr(stmt.excluded, k) for k in provided}
+            }
+        )
+        session.execute(stmt)
+        session.commit()
+        return True
     
     def get_research_document(self, connector_id: str) -> Optional[str]:
         """Get research document content."""
@@ -621,24 +1085,26 @@ class DatabaseConnectorStorage:
             return None
         
         try:
-            # Use raw SQL to only fetch content column - avoids errors if new columns don't exist yet
+            # Use raw SQL to only fetch content columns - avoids errors if claim graph columns don't exist yet
             result = session.execute(
-                text("SELECT content FROM research_documents WHERE connector_id = :connector_id LIMIT 1"),
+                text("SELECT content, content_zstd FROM research_documents WHERE connector_id = :connector_id LIMIT 1"),
                 {"connector_id": connector_id}
             ).first()
             
             if result:
-                return result[0]
+                return decode_document_content(result[0], result[1])
             return None
         except Exception as e:
             print(f"Error getting research document: {e}")
-            # Fallback to ORM query if raw SQL fails
+            # Fallback to the legacy plain-text column (content_zstd not added yet)
             try:
-                doc = session.query(ResearchDocumentModel).filter(
-                    ResearchDocumentModel.connector_id == connector_id
+                session.rollback()
+                result = session.execute(
+                    text("SELECT content FROM research_documents WHERE connector_id = :connector_id LIMIT 1"),
+                    {"connector_id": connector_id}
                 ).first()
-                if doc:
-                    return doc.content
+                if result:
+                    return result[0]
             except Exception:
                 pass
             return None
@@ -646,6 +1112,204 @@ class DatabaseConnectorStorage:
             session.close()
 
 
+    # Below this many rows COPY's setup costs more than an executemany INSERT
+    COPY_MIN_ROWS = 100
+    
+    @require_db(bool, "Error bulk inserting document chunks")
+    def bulk_insert_chunks(self, session: Session, rows: List[Dict[str, Any]]) -> bool:
+        """Insert many document chunks in one transaction.
+        
+        Batches of COPY_MIN_ROWS or more on psycopg 3 / psycopg2 are streamed with
+        COPY document_chunks FROM STDIN; smaller batches (and other drivers)
+        use bulk_insert_mappings.
+        
+        Args:
+            rows: Dicts of DocumentChunkModel column values; 'embedding' is
+                written to the pgvector column when it exists
+            
+        Returns:
+            True if the batch was committed
+        """
+        if not rows:
+            return True
+        
+        if len(rows) >= self.COPY_MIN_ROWS and session.bind.dialect.driver in ("psycopg", "psycopg2"):
+            self._copy_chunks(session, rows)
+        else:
+            session.bulk_insert_mappings(DocumentChunkModel, rows)
+        session.commit()
+        return True
+    
+    def stream_chunks(self, connector_id: str, batch: int = 500) -> Iterator[DocumentChunkModel]:
+        """
+        Yield a connector's chunks in chunk_index order without loading them all.
+        
+        Uses a server-side cursor, so memory stays O(batch) however many
+        chunks (each with its embedding) the connector has.
+        
+        Args:
+            connector_id: Connector ID
+            batch: Rows fetched per round trip
+            
+        Yields:
+            DocumentChunkModel instances
+        """
+        session = self.get_session()
+        if not session:
+            return
+        
+        try:
+            stmt = (
+                select(DocumentChunkModel)
+                .where(DocumentChunkModel.connector_id == connector_id)
+                .order_by(DocumentChunkModel.chunk_index)
+                .execution_options(yield_per=batch, stream_results=True)
+            )
+            for partition in session.execute(stmt).scalars().partitions():
+                yield from partition
+        finally:
+            session.close()
+    
+    @staticmethod
+    def _copy_chunks(session: Session, rows: List[Dict[str, Any]]) -> None:
+        """Stream rows into document_chunks with COPY (psycopg 3 or psycopg2)."""
+        columns = _CHUNK_COPY_COLUMNS
+        if hasattr(DocumentChunkModel, 'embedding') and any(row.get('embedding') for row in rows):
+            columns += ('embedding',)
+        
+        # COPY bypasses the ORM, so apply the column defaults here
+        now = datetime.utcnow()
+        defaults = {'section': 'General', 'source_type': 'research', 'created_at': now}
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write('\t'.join(
+                _copy_text_value(row.get(col, defaults.get(col))) for col in columns
+            ))
+            buffer.write('\n')
+        buffer.seek(0)
+        
+        copy_sql = f"COPY document_chunks ({', '.join(columns)}) FROM STDIN WITH (FORMAT text)"
+        raw = session.connection().connection
+        with raw.cursor() as cur:
+            if session.bind.dialect.driver == "psycopg":
+                with cur.copy(copy_sql) as copy:
+                    copy.write(buffer.getvalue())
+            else:
+                cur.copy_expert(copy_sql, buffer)
+    
+    @require_db(bool, "Error saving review cache entry")
+    def save_review_cache_entry(
+        self,
+        session: Session,
+        cache_key: str,
+        embedding: List[float],
+        review_data: Dict[str, Any],
+        hits: int
+    ) -> bool:
+        """
+        Insert or update a semantic review cache entry.
+        
+        Args:
+            cache_key: sha256 hex digest of the embedded key text
+            embedding: Normalized embedding vector
+            review_data: Parsed critic review JSON
+            hits: Hit count so far
+            
+        Returns:
+            True if saved
+        """
+        # One INSERT ... ON CONFLICT (cache_key) DO UPDATE; no lookup, no insert race
+        now = datetime.utcnow()
+        stmt = pg_insert(ReviewCacheModel).values(
+            cache_key=cache_key,
+            embedding_json=embedding,
+            review_json=review_data,
+            hits=hits,
+            created_at=now,
+            updated_at=now
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ReviewCacheModel.cache_key],
+            set_={
+                'review_json': stmt.excluded.review_json,
+                'hits': stmt.excluded.hits,
+                'updated_at': stmt.excluded.updated_at
+            }
+        )
+        session.execute(stmt)
+        session.commit()
+        return True
+    
+    @require_db(list, "Error loading review cache entries")
+    def load_review_cache_entries(self, session: Session, limit: int) -> List[Dict[str, Any]]:
+        """
+        Load the most-hit semantic review cache entries.
+        
+        Args:
+            limit: Maximum number of entries
+            
+        Returns:
+            List of dicts with cache_key, embedding, review_data and hits
+        """
+        rows = session.execute(
+            select(
+                ReviewCacheModel.cache_key,
+                ReviewCacheModel.embedding_json,
+                ReviewCacheModel.review_json,
+                ReviewCacheModel.hits
+            ).where(
+                ReviewCacheModel.cache_key.isnot(None),
+                ReviewCacheModel.embedding_json.isnot(None)
+            ).order_by(ReviewCacheModel.hits.desc()).limit(limit)
+        ).all()
+        return [
+            {"cache_key": key, "embedding": embedding, "review_data": review, "hits": hits or 0}
+            for key, embedding, review, hits in rows
+        ]
+
+
+    @require_db(bool, "Error saving exact review cache entry")
+    def save_exact_review(self, session: Session, prompt_sha256: str, review_data: Dict[str, Any]) -> bool:
+        """
+        Insert or update an exact-prompt review cache entry.
+        
+        Args:
+            prompt_sha256: sha256 hex digest of model + review prompt
+            review_data: Parsed critic review JSON
+            
+        Returns:
+            True if saved
+        """
+        # Concurrent reviews of the same prompt upsert instead of racing on the unique index
+        now = datetime.utcnow()
+        stmt = pg_insert(ReviewCacheModel).values(
+            prompt_sha256=prompt_sha256,
+            review_json=review_data,
+            created_at=now,
+            updated_at=now
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ReviewCacheModel.prompt_sha256],
+            set_={
+                'review_json': stmt.excluded.review_json,
+                'updated_at': stmt.excluded.updated_at
+            }
+        )
+        session.execute(stmt)
+        session.commit()
+        return True
+    
+    @require_db(error="Error getting exact review cache entry")
+    def get_exact_review(self, session: Session, prompt_sha256: str) -> Optional[Dict[str, Any]]:
+        """Get the cached review JSON for a prompt hash."""
+        # Hot path (every critic review): lambda_stmt reuses the compiled SELECT
+        return session.execute(lambda_stmt(
+            lambda: select(ReviewCacheModel.review_json).where(
+                ReviewCacheModel.prompt_sha256 == prompt_sha256
+            )
+        )).scalar()
+
+
 # Singleton instance
 _db_storage: Optional[DatabaseConnectorStorage] = None
 
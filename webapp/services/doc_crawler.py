@@ -17,12 +17,15 @@ import re
 import asyncio
 import hashlib
 import fnmatch
-from typing import List, Dict, Set, Optional, Tuple
+import importlib.util
+from collections import deque
+from typing import List, Dict, Set, Optional, Tuple, Deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from urllib.parse import urljoin, urlparse
 from urllib.robotparser import RobotFileParser
 import xml.etree.ElementTree as ET
+from html import unescape
 import httpx
 
 from dotenv import load_dotenv
@@ -42,6 +45,13 @@ DEFAULT_HEADERS = {
     "Accept-Language": "en-US,en;q=0.9"
 }
 
+# HTTP/2 multiplexes a crawl's requests to one docs host over a single
+# connection; httpx needs the h2 package (httpx[http2]) for it
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Connection pool for the crawler's shared client
+HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=60)
+
 
 # Try to import Playwright
 try:
@@ -51,6 +61,65 @@ except ImportError:
     PLAYWRIGHT_AVAILABLE = False
     print("⚠ Playwright not available for doc crawling")
 
+# Try to import selectolax (Lexbor HTML parser; regex extraction is the fallback)
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# Class names of layout containers (sidebar, site-header, cookie-banner, ...),
+# matched as whole class-name parts so e.g. "shadow" or "leading-6" don't count as "ad"
+_BOILERPLATE_CLASS_RE = re.compile(
+    r'(?:^|[\s_-])(?:sidebar|menu|nav|navbar|footer|header|cookie|banner|ads?)(?=$|[\s_-])',
+    re.IGNORECASE
+)
+# Layout elements removed with their content, and divs to test for layout class names
+_BOILERPLATE_SELECTOR = 'nav, header, footer, aside, script, style, noscript, svg, div[class]'
+
+
+# Compiled once at import: _extract_content runs ~20 substitutions per page
+_TITLE_RE = re.compile(r'<title[^>]*>([^<]+)</title>', re.IGNORECASE)
+_LINK_RE = re.compile(r'<a[^>]+href=["\']([^"\']+)["\']', re.IGNORECASE)
+# (pattern, replacement) pairs applied in order to turn tags into Markdown
+_MARKDOWN_SUBS = tuple(
+    (re.compile(pattern, flags), replacement)
+    for pattern, replacement, flags in (
+        # Headers
+        (r'<h1[^>]*>([^<]+)</h1>', r'\n# \1\n', re.IGNORECASE),
+        (r'<h2[^>]*>([^<]+)</h2>', r'\n## \1\n', re.IGNORECASE),
+        (r'<h3[^>]*>([^<]+)</h3>', r'\n### \1\n', re.IGNORECASE),
+        (r'<h4[^>]*>([^<]+)</h4>', r'\n#### \1\n', re.IGNORECASE),
+        # Code blocks
+        (r'<pre[^>]*><code[^>]*>([^<]+)</code></pre>', r'\n```\n\1\n```\n', re.DOTALL | re.IGNORECASE),
+        (r'<code[^>]*>([^<]+)</code>', r'`\1`', re.IGNORECASE),
+        # Lists
+        (r'<li[^>]*>', r'\n- ', re.IGNORECASE),
+        (r'</li>', '', re.IGNORECASE),
+        # Paragraphs and line breaks
+        (r'<p[^>]*>', r'\n\n', re.IGNORECASE),
+        (r'</p>', '', re.IGNORECASE),
+        (r'<br\s*/?>', r'\n', re.IGNORECASE),
+        # Tables (basic)
+        (r'<tr[^>]*>', r'\n| ', re.IGNORECASE),
+        (r'<t[hd][^>]*>', r' | ', re.IGNORECASE),
+        (r'</tr>', r' |', re.IGNORECASE),
+    )
+)
+_TAG_RE = re.compile(r'<[^>]+>')
+_BLANK_LINES_RE = re.compile(r'\n\s*\n\s*\n')
+_SPACES_RE = re.compile(r' +')
+_WHITESPACE_RE = re.compile(r'\s+')
+_SLASHES_RE = re.compile(r'/+')
+
+
+def _may_be_layout_class(lowered: str) -> bool:
+    """Substring check run before _BOILERPLATE_CLASS_RE (unrolled; called once per div)."""
+    return (
+        'ad' in lowered or 'nav' in lowered or 'menu' in lowered or 'sidebar' in lowered
+        or 'footer' in lowered or 'header' in lowered or 'cookie' in lowered or 'banner' in lowered
+    )
+
 
 @dataclass
 class CrawledPage:
@@ -151,6 +220,7 @@ class DocCrawler:
         r'<!--.*?-->',
         r'<div[^>]*class="[^"]*(?:sidebar|menu|nav|footer|header|cookie|banner|ad)[^"]*"[^>]*>.*?</div>',
     ]
+    _BOILERPLATE_RES = [re.compile(pattern, re.DOTALL | re.IGNORECASE) for pattern in BOILERPLATE_PATTERNS]
     
     # Link patterns to skip
     SKIP_PATTERNS = [
@@ -170,6 +240,14 @@ class DocCrawler:
         r'\.jpg$',
         r'\.gif$',
     ]
+    # One alternation, so a URL is scanned once rather than once per pattern
+    _SKIP_RE = re.compile('|'.join(SKIP_PATTERNS), re.IGNORECASE)
+    
+    # Pages fetched at once during a crawl, and at most this many per host
+    CONCURRENCY = 8
+    PER_HOST_CONCURRENCY = 4
+    # Minimum seconds between request starts to the same host
+    PER_HOST_INTERVAL = 0.25
     
     def __init__(self, max_depth: int = 2, max_pages: int = 50):
         """
@@ -188,6 +266,7 @@ class DocCrawler:
         self._llms_txt_cache: Dict[str, Optional[str]] = {}  # Cache llms.txt content
         self._sitemap_urls: Dict[str, List[str]] = {}  # Cache sitemap URLs
         self._sitemap_cache: Dict[str, List[Tuple[str, Optional[float]]]] = {}  # Cache parsed sitemaps
+        self._client: Optional[httpx.AsyncClient] = None  # Shared per crawl (keep-alive, TLS reuse)
     
     # =========================================================================
     # URL Normalization (Before Any Checks)
@@ -211,7 +290,7 @@ class DocCrawler:
         host = parsed.netloc.lower()
         
         # Clean path: collapse //, remove trailing slash
-        path = re.sub(r'/+', '/', parsed.path).rstrip('/')
+        path = _SLASHES_RE.sub('/', parsed.path).rstrip('/')
         if not path:
             path = '/'
         
@@ -320,6 +399,33 @@ class DocCrawler:
             await self._browser.close()
             self._browser = None
     
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use.
+        
+        One pooled client per crawl, so robots.txt, sitemaps and pages on
+        the same host reuse connections instead of a new TCP + TLS
+        handshake per request.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                timeout=30.0,
+                follow_redirects=True,
+                headers=DEFAULT_HEADERS,
+                limits=HTTP_LIMITS
+            )
+        return self._client
+    
+    async def _close_client(self):
+        """Close the shared HTTP client if open.
+        
+        Called when a crawl finishes: the client is bound to the event loop
+        it was used on, and the singleton crawler may be driven by another.
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
     # =========================================================================
     # llms.txt Support (LLM-optimized content per llmstxt.org)
     # =========================================================================
@@ -343,16 +449,15 @@ class DocCrawler:
         llms_url = f"https://{domain}/llms.txt"
         
         try:
-            async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
-                response = await client.get(llms_url, headers=DEFAULT_HEADERS)
-                
-                if response.status_code == 200:
-                    content = response.text
-                    # Verify it looks like llms.txt content (not an error page)
-                    if len(content) > 100 and not content.strip().startswith('<!DOCTYPE'):
-                        self._llms_txt_cache[domain] = content
-                        print(f"  📄 Found llms.txt for {domain} ({len(content)} chars)")
-                        return content
+            response = await self._get_client().get(llms_url, timeout=15.0)
+            
+            if response.status_code == 200:
+                content = response.text
+                # Verify it looks like llms.txt content (not an error page)
+                if len(content) > 100 and not content.strip().startswith('<!DOCTYPE'):
+                    self._llms_txt_cache[domain] = content
+                    print(f"  📄 Found llms.txt for {domain} ({len(content)} chars)")
+                    return content
         except Exception as e:
             print(f"  ⚠ Could not fetch llms.txt for {domain}: {e}")
         
@@ -379,14 +484,13 @@ class DocCrawler:
         txt_url = url.rstrip('/') + '.txt'
         
         try:
-            async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
-                response = await client.get(txt_url, headers=DEFAULT_HEADERS)
-                
-                if response.status_code == 200:
-                    content = response.text
-                    # Verify it's actual text content, not HTML
-                    if not content.strip().startswith('<!DOCTYPE') and not content.strip().startswith('<html'):
-                        return content
+            response = await self._get_client().get(txt_url, timeout=15.0)
+            
+            if response.status_code == 200:
+                content = response.text
+                # Verify it's actual text content, not HTML
+                if not content.strip().startswith('<!DOCTYPE') and not content.strip().startswith('<html'):
+                    return content
         except Exception:
             pass
         
@@ -413,25 +517,24 @@ class DocCrawler:
         robots_url = f"https://{domain}/robots.txt"
         
         try:
-            async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
-                response = await client.get(robots_url, headers=DEFAULT_HEADERS)
+            response = await self._get_client().get(robots_url, timeout=15.0)
+            
+            if response.status_code == 200:
+                # Parse the robots.txt content
+                rp.parse(response.text.splitlines())
                 
-                if response.status_code == 200:
-                    # Parse the robots.txt content
-                    rp.parse(response.text.splitlines())
-                    
-                    # Extract sitemap URL if present
-                    for line in response.text.splitlines():
-                        if line.lower().startswith('sitemap:'):
-                            sitemap_url = line.split(':', 1)[1].strip()
-                            if domain not in self._sitemap_urls:
-                                self._sitemap_urls[domain] = []
-                            self._sitemap_urls[domain].append(sitemap_url)
-                    
-                    print(f"  🤖 Loaded robots.txt for {domain}")
-                else:
-                    # No robots.txt = allow all
-                    rp.allow_all = True
+                # Extract sitemap URL if present
+                for line in response.text.splitlines():
+                    if line.lower().startswith('sitemap:'):
+                        sitemap_url = line.split(':', 1)[1].strip()
+                        if domain not in self._sitemap_urls:
+                            self._sitemap_urls[domain] = []
+                        self._sitemap_urls[domain].append(sitemap_url)
+                
+                print(f"  🤖 Loaded robots.txt for {domain}")
+            else:
+                # No robots.txt = allow all
+                rp.allow_all = True
         except Exception as e:
             print(f"  ⚠ Could not load robots.txt for {domain}: {e}")
             rp.allow_all = True
@@ -498,67 +601,66 @@ class DocCrawler:
         urls: List[Tuple[str, Optional[float]]] = []
         
         try:
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-                response = await client.get(sitemap_url, headers=DEFAULT_HEADERS)
-                
-                if response.status_code != 200:
-                    print(f"  ⚠ Sitemap returned {response.status_code}: {sitemap_url}")
-                    return urls
-                
-                content = response.text
-                
-                # Parse XML
-                try:
-                    root = ET.fromstring(content)
-                except ET.ParseError as e:
-                    print(f"  ⚠ Sitemap XML parse error: {e}")
-                    return urls
-                
-                # Handle namespace
-                ns = {'sm': 'http://www.sitemaps.org/schemas/sitemap/0.9'}
-                
-                # Check if this is a SITEMAP INDEX (<sitemapindex>)
-                sitemap_refs = root.findall('.//sm:sitemap', ns)
-                if not sitemap_refs:
-                    sitemap_refs = root.findall('.//sitemap')  # Try without namespace
+            response = await self._get_client().get(sitemap_url)
+            
+            if response.status_code != 200:
+                print(f"  ⚠ Sitemap returned {response.status_code}: {sitemap_url}")
+                return urls
+            
+            content = response.text
+            
+            # Parse XML
+            try:
+                root = ET.fromstring(content)
+            except ET.ParseError as e:
+                print(f"  ⚠ Sitemap XML parse error: {e}")
+                return urls
+            
+            # Handle namespace
+            ns = {'sm': 'http://www.sitemaps.org/schemas/sitemap/0.9'}
+            
+            # Check if this is a SITEMAP INDEX (<sitemapindex>)
+            sitemap_refs = root.findall('.//sm:sitemap', ns)
+            if not sitemap_refs:
+                sitemap_refs = root.findall('.//sitemap')  # Try without namespace
+            
+            if sitemap_refs:
+                # It's an INDEX - recursively parse referenced sitemaps
+                print(f"  📂 Found sitemap index with {len(sitemap_refs)} sitemaps")
+                for ref in sitemap_refs[:max_sitemaps]:
+                    loc = ref.find('sm:loc', ns)
+                    if loc is None:
+                        loc = ref.find('loc')
+                    if loc is not None and loc.text:
+                        sub_urls = await self._parse_sitemap_with_priority(
+                            loc.text, max_sitemaps, _depth + 1
+                        )
+                        urls.extend(sub_urls)
+            else:
+                # It's a URLSET - extract URLs with priority
+                url_elements = root.findall('.//sm:url', ns)
+                if not url_elements:
+                    url_elements = root.findall('.//url')  # Try without namespace
                 
-                if sitemap_refs:
-                    # It's an INDEX - recursively parse referenced sitemaps
-                    print(f"  📂 Found sitemap index with {len(sitemap_refs)} sitemaps")
-                    for ref in sitemap_refs[:max_sitemaps]:
-                        loc = ref.find('sm:loc', ns)
-                        if loc is None:
-                            loc = ref.find('loc')
-                        if loc is not None and loc.text:
-                            sub_urls = await self._parse_sitemap_with_priority(
-                                loc.text, max_sitemaps, _depth + 1
-                            )
-                            urls.extend(sub_urls)
-                else:
-                    # It's a URLSET - extract URLs with priority
-                    url_elements = root.findall('.//sm:url', ns)
-                    if not url_elements:
-                        url_elements = root.findall('.//url')  # Try without namespace
+                for url_elem in url_elements:
+                    loc = url_elem.find('sm:loc', ns)
+                    if loc is None:
+                        loc = url_elem.find('loc')
                     
-                    for url_elem in url_elements:
-                        loc = url_elem.find('sm:loc', ns)
-                        if loc is None:
-                            loc = url_elem.find('loc')
-                        
-                        priority_elem = url_elem.find('sm:priority', ns)
-                        if priority_elem is None:
-                            priority_elem = url_elem.find('priority')
-                        
-                        if loc is not None and loc.text:
-                            normalized = self._normalize_url_strict(loc.text)
-                            priority = None
-                            if priority_elem is not None and priority_elem.text:
-                                try:
-                                    priority = float(priority_elem.text)
-                                except ValueError:
-                                    pass
-                            urls.append((normalized, priority))
-            
+                    priority_elem = url_elem.find('sm:priority', ns)
+                    if priority_elem is None:
+                        priority_elem = url_elem.find('priority')
+                    
+                    if loc is not None and loc.text:
+                        normalized = self._normalize_url_strict(loc.text)
+                        priority = None
+                        if priority_elem is not None and priority_elem.text:
+                            try:
+                                priority = float(priority_elem.text)
+                            except ValueError:
+                                pass
+                        urls.append((normalized, priority))
+
             # Cache results
             self._sitemap_cache[cache_key] = urls
             
@@ -613,9 +715,8 @@ class DocCrawler:
             url = urljoin(base_url, url)
         
         # Check if URL should be skipped
-        for pattern in self.SKIP_PATTERNS:
-            if re.search(pattern, url, re.IGNORECASE):
-                return None
+        if self._SKIP_RE.search(url):
+            return None
         
         # Remove fragments
         parsed = urlparse(url)
@@ -637,68 +738,136 @@ class DocCrawler:
         Returns:
             Tuple of (title, content, links)
         """
+        if SELECTOLAX_AVAILABLE:
+            return self._extract_content_lexbor(html)
+        
         # Extract title
-        title_match = re.search(r'<title[^>]*>([^<]+)</title>', html, re.IGNORECASE)
+        title_match = _TITLE_RE.search(html)
         title = title_match.group(1).strip() if title_match else "Untitled"
         
         # Remove boilerplate
         cleaned = html
-        for pattern in self.BOILERPLATE_PATTERNS:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.DOTALL | re.IGNORECASE)
+        for pattern in self._BOILERPLATE_RES:
+            cleaned = pattern.sub('', cleaned)
         
         # Extract links before removing tags
         links = []
-        for match in re.finditer(r'<a[^>]+href=["\']([^"\']+)["\']', cleaned, re.IGNORECASE):
+        for match in _LINK_RE.finditer(cleaned):
             href = match.group(1)
             if href and not href.startswith('#'):
                 links.append(href)
         
-        # Convert headers to markdown
-        cleaned = re.sub(r'<h1[^>]*>([^<]+)</h1>', r'\n# \1\n', cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r'<h2[^>]*>([^<]+)</h2>', r'\n## \1\n', cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r'<h3[^>]*>([^<]+)</h3>', r'\n### \1\n', cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r'<h4[^>]*>([^<]+)</h4>', r'\n#### \1\n', cleaned, flags=re.IGNORECASE)
+        # Convert headers, code blocks, lists, paragraphs and tables to markdown
+        for pattern, replacement in _MARKDOWN_SUBS:
+            cleaned = pattern.sub(replacement, cleaned)
         
-        # Convert code blocks
-        cleaned = re.sub(r'<pre[^>]*><code[^>]*>([^<]+)</code></pre>', r'\n```\n\1\n```\n', cleaned, flags=re.DOTALL | re.IGNORECASE)
-        cleaned = re.sub(r'<code[^>]*>([^<]+)</code>', r'`\1`', cleaned, flags=re.IGNORECASE)
+        # Remove remaining tags
+        cleaned = _TAG_RE.sub('', cleaned)
         
-        # Convert lists
-        cleaned = re.sub(r'<li[^>]*>', r'\n- ', cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r'</li>', '', cleaned, flags=re.IGNORECASE)
+        # Clean up whitespace
+        cleaned = _BLANK_LINES_RE.sub('\n\n', cleaned)
+        cleaned = _SPACES_RE.sub(' ', cleaned)
+        cleaned = cleaned.strip()
         
-        # Convert paragraphs and line breaks
-        cleaned = re.sub(r'<p[^>]*>', r'\n\n', cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r'</p>', '', cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r'<br\s*/?>', r'\n', cleaned, flags=re.IGNORECASE)
+        # Decode HTML entities
+        cleaned = unescape(cleaned).replace('\xa0', ' ')
+        
+        return title, cleaned, links
+    
+    def _extract_content_lexbor(self, html: str) -> Tuple[str, str, List[str]]:
+        """
+        Extract clean text content from HTML with selectolax (Lexbor).
         
-        # Convert tables (basic)
-        cleaned = re.sub(r'<tr[^>]*>', r'\n| ', cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r'<t[hd][^>]*>', r' | ', cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r'</tr>', r' |', cleaned, flags=re.IGNORECASE)
+        Parses once and rewrites the DOM in place (boilerplate removed,
+        headings/code/lists/tables turned into Markdown text) instead of
+        running regex passes over the whole document.
         
-        # Remove remaining tags
-        cleaned = re.sub(r'<[^>]+>', '', cleaned)
+        Returns:
+            Tuple of (title, content, links)
+        """
+        tree = LexborHTMLParser(html)
+        
+        title_node = tree.css_first('title')
+        title = (title_node.text().strip() if title_node else "") or "Untitled"
+        
+        # Remove boilerplate: layout elements plus divs with layout class names,
+        # found in one selector pass
+        boilerplate = []
+        for node in tree.css(_BOILERPLATE_SELECTOR):
+            if node.tag == 'div':
+                class_attr = node.attrs.get('class') or ''
+                # Cheap substring prefilter; most divs carry none of the words
+                if not _may_be_layout_class(class_attr.lower()):
+                    continue
+                if not _BOILERPLATE_CLASS_RE.search(class_attr):
+                    continue
+            boilerplate.append(node)
+        for node in boilerplate:
+            node.attrs['data-crawler-drop'] = ''
+        # Decompose only the outermost matches (nested ones go with them); decide
+        # for all before freeing any, since a freed ancestor can't be walked
+        outermost = [node for node in boilerplate if not self._has_marked_ancestor(node)]
+        for node in outermost:
+            node.decompose()
+        
+        # Links left after boilerplate removal
+        links = []
+        for anchor in tree.css('a[href]'):
+            href = anchor.attributes.get('href')
+            if href and not href.startswith('#'):
+                links.append(href)
+        
+        # Convert headers to markdown (innermost first, so no replaced node is revisited)
+        for node in reversed(tree.css('h1, h2, h3, h4')):
+            node.replace_with(f"\n{'#' * int(node.tag[1])} {' '.join(node.text().split())}\n")
+        
+        # Convert code blocks (pre first, so inline code inside them is already gone)
+        for node in reversed(tree.css('pre')):
+            node.replace_with(f"\n```\n{node.text()}\n```\n")
+        for node in reversed(tree.css('code')):
+            node.replace_with(f"`{node.text()}`")
+        
+        # Convert lists, paragraphs, line breaks and tables (basic) in one pass;
+        # only childless <br> nodes are replaced
+        for node in tree.css('li, p, br, tr, th, td'):
+            tag = node.tag
+            if tag == 'li':
+                node.insert_before("\n- ")
+            elif tag == 'p':
+                node.insert_before("\n\n")
+            elif tag == 'br':
+                node.replace_with("\n")
+            elif tag == 'tr':
+                node.insert_before("\n| ")
+                node.insert_after(" |")
+            else:
+                node.insert_before(" | ")
+        
+        # Remaining tags drop out; entities are already decoded
+        root = tree.body or tree.root
+        cleaned = root.text(separator='').replace('\xa0', ' ') if root else ""
         
         # Clean up whitespace
-        cleaned = re.sub(r'\n\s*\n\s*\n', '\n\n', cleaned)
-        cleaned = re.sub(r' +', ' ', cleaned)
+        cleaned = _BLANK_LINES_RE.sub('\n\n', cleaned)
+        cleaned = _SPACES_RE.sub(' ', cleaned)
         cleaned = cleaned.strip()
         
-        # Decode HTML entities
-        cleaned = cleaned.replace('&nbsp;', ' ')
-        cleaned = cleaned.replace('&lt;', '<')
-        cleaned = cleaned.replace('&gt;', '>')
-        cleaned = cleaned.replace('&amp;', '&')
-        cleaned = cleaned.replace('&quot;', '"')
-        cleaned = cleaned.replace('&#39;', "'")
-        
         return title, cleaned, links
     
+    @staticmethod
+    def _has_marked_ancestor(node) -> bool:
+        """Check whether a parent element carries the data-crawler-drop marker."""
+        parent = node.parent
+        while parent is not None:
+            if 'data-crawler-drop' in parent.attributes:
+                return True
+            parent = parent.parent
+        return False
+    
     def _content_hash(self, content: str) -> str:
         """Generate a hash for content deduplication."""
         # Normalize content for hashing
-        normalized = re.sub(r'\s+', ' ', content.lower())[:1000]
+        normalized = _WHITESPACE_RE.sub(' ', content.lower())[:1000]
         return hashlib.md5(normalized.encode()).hexdigest()
     
     async def _crawl_page_playwright(self, url: str, page: Page) -> Optional[CrawledPage]:
@@ -743,29 +912,28 @@ class DocCrawler:
                 )
             
             # Fall back to HTML version
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-                response = await client.get(url, headers=DEFAULT_HEADERS)
-                response.raise_for_status()
-                html = response.text
-                
-                title, content, links = self._extract_content(html)
-                
-                # Check for duplicate content
-                content_hash = self._content_hash(content)
-                if content_hash in self._content_hashes:
-                    return None
-                self._content_hashes.add(content_hash)
-                
-                # Skip pages with very little content
-                if len(content.split()) < 50:
-                    return None
-                
-                return CrawledPage(
-                    url=url,
-                    title=title,
-                    content=content,
-                    links=links
-                )
+            response = await self._get_client().get(url)
+            response.raise_for_status()
+            html = response.text
+            
+            title, content, links = self._extract_content(html)
+            
+            # Check for duplicate content
+            content_hash = self._content_hash(content)
+            if content_hash in self._content_hashes:
+                return None
+            self._content_hashes.add(content_hash)
+            
+            # Skip pages with very little content
+            if len(content.split()) < 50:
+                return None
+            
+            return CrawledPage(
+                url=url,
+                title=title,
+                content=content,
+                links=links
+            )
         except Exception as e:
             print(f"  ⚠ Failed to crawl {url}: {e}")
             return None
@@ -802,31 +970,35 @@ class DocCrawler:
         self._visited_urls.clear()
         self._content_hashes.clear()
         
-        urls_to_crawl = [(url, 0)]  # (url, depth)
+        # BFS frontier of (url, depth); deque pops from the front in O(1)
+        urls_to_crawl: Deque[Tuple[str, int]] = deque([(url, 0)])
         
-        while urls_to_crawl and len(result.pages) < self.max_pages:
-            current_url, depth = urls_to_crawl.pop(0)
-            
-            if current_url in self._visited_urls:
-                continue
-            
-            self._visited_urls.add(current_url)
-            
-            # Crawl the page
-            page = await self._crawl_page_httpx(current_url)
-            
-            if page:
-                page.depth = depth
-                result.pages.append(page)
-                result.urls_crawled.append(current_url)
+        try:
+            while urls_to_crawl and len(result.pages) < self.max_pages:
+                current_url, depth = urls_to_crawl.popleft()
+                
+                if current_url in self._visited_urls:
+                    continue
+                
+                self._visited_urls.add(current_url)
                 
-                # Follow links if enabled and within depth
-                if follow_links and depth < max_depth and page.links:
-                    for link in page.links:
-                        # Only follow links on the same domain
-                        link_parsed = urlparse(link)
-                        if link_parsed.netloc == parsed.netloc and link not in self._visited_urls:
-                            urls_to_crawl.append((link, depth + 1))
+                # Crawl the page
+                page = await self._crawl_page_httpx(current_url)
+                
+                if page:
+                    page.depth = depth
+                    result.pages.append(page)
+                    result.urls_crawled.append(current_url)
+                    
+                    # Follow links if enabled and within depth
+                    if follow_links and depth < max_depth and page.links:
+                        for link in page.links:
+                            # Only follow links on the same domain
+                            link_parsed = urlparse(link)
+                            if link_parsed.netloc == parsed.netloc and link not in self._visited_urls:
+                                urls_to_crawl.append((link, depth + 1))
+        finally:
+            await self._close_client()
         
         # Compile results
         if result.pages:
@@ -867,6 +1039,18 @@ class DocCrawler:
         Returns:
             CrawlResult with all crawled content
         """
+        try:
+            return await self._crawl_official_docs(connector_name, user_provided_urls, max_depth)
+        finally:
+            await self._close_client()
+    
+    async def _crawl_official_docs(
+        self,
+        connector_name: str,
+        user_provided_urls: Optional[List[str]],
+        max_depth: Optional[int]
+    ) -> CrawlResult:
+        """Run crawl_official_docs; the caller closes the shared HTTP client."""
         start_time = datetime.utcnow()
         result = CrawlResult(connector_name=connector_name)
         
@@ -1014,55 +1198,108 @@ class DocCrawler:
         # Crawl URLs with depth tracking
         # =================================================================
         browser = await self._init_browser()
-        page = None
-        if browser:
-            page = await browser.new_page()
-            await page.set_extra_http_headers(DEFAULT_HEADERS)
+        # Playwright pages, opened only when no idle one is free, so there are
+        # never more than concurrent fetches (PER_HOST_CONCURRENCY for a
+        # single-host crawl); a page can only load one URL at a time
+        tabs = []
+        idle_tabs = []
         
         try:
-            queue: List[Tuple[str, int]] = [(url, 0) for url in urls_to_crawl]
-            pages_crawled = len(result.pages)  # Account for llms.txt
+            # (seq, url, depth): seq is the enqueue order, so results can be put
+            # back in BFS order however the fetches interleave
+            queue: asyncio.Queue = asyncio.Queue()
+            for seq, url in enumerate(urls_to_crawl):
+                queue.put_nowait((seq, url, 0))
+            next_seq = len(urls_to_crawl)
+            pages_budget = self.max_pages - len(result.pages)  # Account for llms.txt
+            crawled: List[Tuple[int, str, CrawledPage]] = []
+            host_slots: Dict[str, asyncio.Semaphore] = {}
+            host_next_start: Dict[str, float] = {}
+            loop = asyncio.get_running_loop()
             
-            while queue and pages_crawled < self.max_pages:
-                url, depth = queue.pop(0)
-                
-                # Skip if already visited or depth exceeded
-                if url in self._visited_urls:
-                    continue
-                if depth > self.max_depth:
-                    continue
-                
-                self._visited_urls.add(url)
-                
-                # Crawl the page
-                print(f"  ✓ [{pages_crawled + 1}/{self.max_pages}] {url[:70]}...")
-                
-                if page:
-                    crawled_page = await self._crawl_page_playwright(url, page)
-                else:
-                    crawled_page = await self._crawl_page_httpx(url)
-                
-                if crawled_page:
-                    crawled_page.depth = depth
-                    result.pages.append(crawled_page)
-                    result.urls_crawled.append(url)
-                    pages_crawled += 1
-                    
-                    # Add internal links to queue (must pass Gate 1)
-                    if depth < self.max_depth:
-                        for link in crawled_page.links:
-                            normalized = self._normalize_url(link, url)
-                            if normalized and normalized not in self._visited_urls:
-                                # Quick Gate 1 check for discovered links
-                                if config:
-                                    passed, _ = self._passes_gate1(normalized, config)
-                                    if passed:
-                                        queue.append((normalized, depth + 1))
-                                elif self._is_same_domain(normalized, allowed_domain):
-                                    queue.append((normalized, depth + 1))
-                
-                # Rate limiting
-                await asyncio.sleep(0.5)
+            async def worker():
+                nonlocal next_seq
+                while True:
+                    seq, url, depth = await queue.get()
+                    try:
+                        # Skip if the page budget is spent, already visited or depth exceeded.
+                        # Check-and-add has no await in between, so workers can't both claim a URL
+                        if len(crawled) >= pages_budget:
+                            continue
+                        if url in self._visited_urls:
+                            continue
+                        if depth > self.max_depth:
+                            continue
+                        
+                        self._visited_urls.add(url)
+                        
+                        # Crawl the page
+                        print(f"  ✓ [{len(crawled) + 1}/{pages_budget}] {url[:70]}...")
+                        
+                        # Politeness is per origin: a cap on concurrent fetches plus a
+                        # minimum interval between request starts, instead of a global
+                        # pause between pages
+                        host = urlparse(url).netloc
+                        slot = host_slots.setdefault(host, asyncio.Semaphore(self.PER_HOST_CONCURRENCY))
+                        async with slot:
+                            # Reserve the next start time before sleeping, so
+                            # concurrent workers space out rather than wake together
+                            now = loop.time()
+                            start = max(now, host_next_start.get(host, now))
+                            host_next_start[host] = start + self.PER_HOST_INTERVAL
+                            if start > now:
+                                await asyncio.sleep(start - now)
+                            
+                            tab = idle_tabs.pop() if idle_tabs else None
+                            if browser and tab is None:
+                                tab = await browser.new_page()
+                                tabs.append(tab)
+                                await tab.set_extra_http_headers(DEFAULT_HEADERS)
+                            try:
+                                if tab:
+                                    crawled_page = await self._crawl_page_playwright(url, tab)
+                                else:
+                                    crawled_page = await self._crawl_page_httpx(url)
+                            finally:
+                                if tab:
+                                    idle_tabs.append(tab)
+                        
+                        if crawled_page:
+                            crawled_page.depth = depth
+                            crawled.append((seq, url, crawled_page))
+                            
+                            # Add internal links to queue (must pass Gate 1)
+                            if depth < self.max_depth:
+                                for link in crawled_page.links:
+                                    normalized = self._normalize_url(link, url)
+                                    if normalized and normalized not in self._visited_urls:
+                                        # Quick Gate 1 check for discovered links
+                                        if config:
+                                            passed, _ = self._passes_gate1(normalized, config)
+                                            if not passed:
+                                                continue
+                                        elif not self._is_same_domain(normalized, allowed_domain):
+                                            continue
+                                        queue.put_nowait((next_seq, normalized, depth + 1))
+                                        next_seq += 1
+                    except Exception as e:
+                        print(f"  ⚠ Failed to crawl {url}: {e}")
+                    finally:
+                        queue.task_done()
+            
+            workers = [asyncio.create_task(worker()) for _ in range(self.CONCURRENCY)]
+            try:
+                await queue.join()
+            finally:
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+            
+            # In-flight fetches may finish past the budget; keep the earliest in BFS order
+            crawled.sort(key=lambda item: item[0])
+            for _, url, crawled_page in crawled[:pages_budget]:
+                result.pages.append(crawled_page)
+                result.urls_crawled.append(url)
             
             # Combine all content
             all_content_parts = []
@@ -1074,8 +1311,8 @@ class DocCrawler:
             result.total_words = sum(p.word_count for p in result.pages)
             
         finally:
-            if page:
-                await page.close()
+            for tab in tabs:
+                await tab.close()
             if browser:
                 await browser.close()
         
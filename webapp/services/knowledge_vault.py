@@ -25,12 +25,13 @@ import tempfile
 import json
 
 from openai import OpenAI
-from sqlalchemy import text
+from sqlalchemy import text, select
 from dotenv import load_dotenv
 
 from .database import (
     get_db_session, is_database_available, init_database,
-    DocumentChunkModel, PGVECTOR_AVAILABLE, PGVECTOR_EXTENSION_AVAILABLE, EMBEDDING_DIMENSION
+    DocumentChunkModel, PGVECTOR_AVAILABLE, PGVECTOR_EXTENSION_AVAILABLE, EMBEDDING_DIMENSION,
+    pack_embedding, decode_embedding
 )
 
 load_dotenv()
@@ -394,7 +395,8 @@ class KnowledgeVault:
                     # Update existing chunk
                     existing.text = chunk[:5000]
                     existing.section = section_title
-                    existing.embedding_json = embedding
+                    existing.embedding_json = None
+                    existing.embedding_bytes = pack_embedding(embedding)
                     if self._pgvector_available and hasattr(existing, 'embedding'):
                         existing.embedding = embedding
                 else:
@@ -407,7 +409,7 @@ class KnowledgeVault:
                         text=chunk[:5000],
                         section=section_title,
                         source_type=source_type.value,
-                        embedding_json=embedding
+                        embedding_bytes=pack_embedding(embedding)
                     )
                     
                     if self._pgvector_available and hasattr(chunk_model, 'embedding'):
@@ -575,15 +577,22 @@ class KnowledgeVault:
                     for row in results
                 ]
             else:
-                # Fallback: Load all and compute similarity
-                chunks = session.query(DocumentChunkModel).filter(
-                    DocumentChunkModel.connector_id == vault_connector_id
-                ).all()
+                # Fallback: Stream chunk rows (no ORM objects) and compute similarity
+                chunks = session.execute(
+                    select(
+                        DocumentChunkModel.text, DocumentChunkModel.section,
+                        DocumentChunkModel.source_type, DocumentChunkModel.connector_name,
+                        DocumentChunkModel.embedding_bytes, DocumentChunkModel.embedding_json
+                    )
+                    .where(DocumentChunkModel.connector_id == vault_connector_id)
+                    .execution_options(yield_per=1000)
+                )
                 
                 results = []
                 for chunk in chunks:
-                    if chunk.embedding_json:
-                        score = self._cosine_similarity(query_embedding, chunk.embedding_json)
+                    embedding = decode_embedding(chunk.embedding_bytes, chunk.embedding_json)
+                    if embedding:
+                        score = self._cosine_similarity(query_embedding, embedding)
                         results.append(VaultSearchResult(
                             text=chunk.text,
                             score=score,
@@ -12,11 +12,11 @@ from dataclasses import dataclass
 from datetime import datetime
 
 from openai import OpenAI
-from sqlalchemy import text
+from sqlalchemy import text, select
 from dotenv import load_dotenv
 
 from .database import (
-    get_db_session, is_database_available,
+    get_db_session, is_database_available, DatabaseConnectorStorage, pack_embedding, decode_embedding,
     DocumentChunkModel, PGVECTOR_AVAILABLE, PGVECTOR_EXTENSION_AVAILABLE, EMBEDDING_DIMENSION
 )
 
@@ -220,39 +220,34 @@ class VectorManager:
             # Split into chunks
             chunks = self._chunk_text(research_content)
             
-            # Create and store vectors
-            created_count = 0
+            # Create chunk rows
+            rows = []
             for i, chunk in enumerate(chunks):
                 # Generate embedding
                 embedding = self._generate_embedding(chunk)
                 
-                # Create chunk record
-                chunk_id = self._generate_chunk_id(connector_id, chunk, i)
-                section = self._extract_section(chunk)
-                
-                chunk_model = DocumentChunkModel(
-                    id=chunk_id,
-                    connector_id=connector_id,
-                    connector_name=connector_name,
-                    chunk_index=i,
-                    text=chunk[:5000],  # Limit text size
-                    section=section,
-                    source_type=source_type,
-                    embedding_json=embedding  # Store as JSON (always works)
-                )
+                row = {
+                    'id': self._generate_chunk_id(connector_id, chunk, i),
+                    'connector_id': connector_id,
+                    'connector_name': connector_name,
+                    'chunk_index': i,
+                    'text': chunk[:5000],  # Limit text size
+                    'section': self._extract_section(chunk),
+                    'source_type': source_type,
+                    'embedding_bytes': pack_embedding(embedding)  # float32 bytes (always works)
+                }
                 
                 # If pgvector is available, also set the vector column
-                if self._pgvector_available and hasattr(chunk_model, 'embedding'):
-                    chunk_model.embedding = embedding
-                
-                session.add(chunk_model)
-                created_count += 1
+                if self._pgvector_available and hasattr(DocumentChunkModel, 'embedding'):
+                    row['embedding'] = embedding
                 
-                # Commit in batches
-                if created_count % 50 == 0:
-                    session.commit()
+                rows.append(row)
             
-            session.commit()
+            # One bulk write (COPY for large documents) instead of a flush per chunk
+            if not DatabaseConnectorStorage().bulk_insert_chunks(rows):
+                return 0
+            
+            created_count = len(rows)
             print(f"✓ Stored {created_count} vectors for {connector_name}")
             return created_count
             
@@ -320,16 +315,23 @@ class VectorManager:
                     for row in results
                 ]
             else:
-                # Fallback: Load all chunks and compute similarity in Python
-                chunks = session.query(DocumentChunkModel).filter(
-                    DocumentChunkModel.connector_id == connector_id
-                ).all()
+                # Fallback: Stream chunk rows (no ORM objects) and compute similarity in Python
+                chunks = session.execute(
+                    select(
+                        DocumentChunkModel.id, DocumentChunkModel.text, DocumentChunkModel.section,
+                        DocumentChunkModel.source_type, DocumentChunkModel.connector_name,
+                        DocumentChunkModel.embedding_bytes, DocumentChunkModel.embedding_json
+                    )
+                    .where(DocumentChunkModel.connector_id == connector_id)
+                    .execution_options(yield_per=1000)
+                )
                 
                 # Compute cosine similarity
                 results = []
                 for chunk in chunks:
-                    if chunk.embedding_json:
-                        score = self._cosine_similarity(query_embedding, chunk.embedding_json)
+                    embedding = decode_embedding(chunk.embedding_bytes, chunk.embedding_json)
+                    if embedding:
+                        score = self._cosine_similarity(query_embedding, embedding)
                         results.append({
                             "id": chunk.id,
                             "score": score,